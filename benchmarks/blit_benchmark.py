@@ -0,0 +1,139 @@
+# benchmarks/blit_benchmark.py
+#
+# เวลา blit ต่อครั้งของแต่ละชุดภาพ: convert_alpha() ทุกชุด (แบบเดิม) เทียบกับรูปแบบที่ loader เลือก
+# (opaque = convert(), colorkey = convert() + RLEACCEL, alpha = convert_alpha() เหมือนเดิม)
+# - ชุดเฟรม: blit เฟรมแรกลงจอ (Surface ขนาดจอ รูปแบบเดียวกับ display)
+# - ชั้นพื้นหลัง (BACKGROUND_LAYERS): blit strip เต็มจอแบบที่ BackgroundManager วาดจริง
+# - คอลัมน์ same = ภาพที่ได้บนจอตรงกันทุก pixel
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/blit_benchmark.py
+#     python benchmarks/blit_benchmark.py --repeat 500 --only bg_01 bg_02 --out blit.json
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# ต้องตั้งก่อน pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT, GREY
+import managers.resource_manager as rm
+from managers.background_manager import BACKGROUND_LAYERS, TiledLayer
+
+
+def time_blit(screen: pygame.Surface, image: pygame.Surface, repeat: int, area=None) -> float:
+    """เวลาเฉลี่ยต่อ blit (µs)"""
+    screen.blit(image, (0, 0), area)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        screen.blit(image, (0, 0), area)
+    return (time.perf_counter() - started) / repeat * 1e6
+
+
+def same_pixels(screen: pygame.Surface, a: pygame.Surface, b: pygame.Surface, area=None) -> bool:
+    screen.fill(GREY)
+    screen.blit(a, (0, 0), area)
+    first = pygame.image.tobytes(screen, "RGB")
+    screen.fill(GREY)
+    screen.blit(b, (0, 0), area)
+    return first == pygame.image.tobytes(screen, "RGB")
+
+
+def load_raw(key: str) -> list[pygame.Surface]:
+    """เฟรมที่ scale แล้ว ยังไม่ convert (ผ่าน AssetCache เหมือนตอนเล่นจริง)"""
+    return rm.ResourceManager._prepare_frames(key)[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blit cost: convert_alpha vs detected format")
+    parser.add_argument("--repeat", type=int, default=200, help="จำนวน blit ต่อการวัด")
+    parser.add_argument("--only", nargs="+", metavar="KEY", help="วัดเฉพาะชุดที่ระบุ")
+    parser.add_argument("--out", help="เขียนผลเป็น JSON")
+    args = parser.parse_args()
+
+    pygame.init()
+    display = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.Surface(display.get_size()).convert()
+
+    # init แบบ lazy: ได้ _jobs / cache โดยไม่ต้องโหลดทุกชุด (วัดทีละชุดเอง)
+    rm.ASSET_MEMORY_BUDGET_MB = None
+    rm.ResourceManager.init(lazy=True)
+
+    rows = []
+
+    def measure(name: str, raw: pygame.Surface, fmt: str, colorkey, area=None, make=None):
+        before = raw.convert_alpha()
+        after = rm.convert_frame(raw, fmt, colorkey)
+        if make is not None:
+            before = make(before)
+            after = make(after)
+
+        row = {
+            "name": name,
+            "format": fmt,
+            "size": list(before.get_size()),
+            "alpha_us": round(time_blit(screen, before, args.repeat, area), 2),
+            "chosen_us": round(time_blit(screen, after, args.repeat, area), 2),
+            "same": same_pixels(screen, before, after, area),
+        }
+        rows.append(row)
+
+    keys = list(rm.ResourceManager._jobs)
+    if args.only:
+        keys = [key for key in keys if key in args.only]
+
+    # ---------- ชุดเฟรม (เฟรมแรก) ----------
+    for key in keys:
+        frames = load_raw(key)
+        if not frames:
+            continue
+        fmt, colorkey = rm.detect_format(frames)
+        measure(key, frames[0], fmt, colorkey)
+
+    # ---------- ชั้นพื้นหลัง: strip เต็มจอ ----------
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    for cfg in BACKGROUND_LAYERS:
+        key = cfg["image_key"]
+        if args.only and key not in args.only:
+            continue
+        frames = load_raw(key)
+        if not frames:
+            continue
+        fmt, colorkey = rm.detect_format(frames)
+        scale = cfg.get("scale", 1.0)
+
+        def make_strip(image, scale=scale):
+            image = rm.scale_image(image, scale)
+            return TiledLayer(image, speed=0.0).strip(*size)
+
+        measure(f"layer.{cfg['name']}", frames[0], fmt, colorkey, pygame.Rect((0, 0), size), make_strip)
+
+    print(f"{'name':<22}{'format':>10}{'size':>12}{'alpha µs':>11}{'chosen µs':>11}{'speedup':>9}{'same':>6}")
+    for row in rows:
+        w, h = row["size"]
+        speedup = row["alpha_us"] / row["chosen_us"] if row["chosen_us"] > 0 else 0.0
+        print(
+            f"{row['name']:<22}{row['format']:>10}{f'{w}x{h}':>12}"
+            f"{row['alpha_us']:>11.1f}{row['chosen_us']:>11.1f}{speedup:>8.2f}x{str(row['same']):>6}"
+        )
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nresults written to {args.out}")
+
+    rm.ResourceManager.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
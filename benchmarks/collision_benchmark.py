@@ -0,0 +1,150 @@
+# benchmarks/collision_benchmark.py
+#
+# เทียบ pygame.sprite.groupcollide (ทุกคู่) กับ SpatialHash broadphase
+# - จำนวนคู่ที่ถูกเช็คละเอียด (pair tests)
+# - เวลาต่อเฟรมของช่วง collision
+# - ผลการชนต้องตรงกันทุกเคส
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/collision_benchmark.py
+#     python benchmarks/collision_benchmark.py --counts 50 100 200 400 --repeat 20
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from managers.spatial_hash import SpatialHash
+
+
+def make_surface(w, h, color):
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, color, surf.get_rect())
+    return surf
+
+
+class DummySprite(pygame.sprite.Sprite):
+    def __init__(self, ident, image, pos, radius=None):
+        super().__init__()
+        self.ident = ident
+        self.image = image
+        self.rect = image.get_rect(center=pos)
+        self.mask = pygame.mask.from_surface(image)
+        if radius is not None:
+            self.radius = radius
+
+
+def build_world(count: int, seed: int):
+    """
+    สร้างฉากจำลองแบบบอสด่านหนัก ๆ
+    - bullets / shields เป็นฝั่งยิง
+    - meteors / boss_bullets / enemies เป็นฝั่งเป้า
+    """
+    rng = random.Random(seed)
+    bullet_img = make_surface(8, 20, (255, 255, 0))
+    meteor_img = make_surface(46, 80, (150, 120, 90))
+    boss_bullet_img = make_surface(36, 48, (255, 80, 80))
+    enemy_img = make_surface(120, 120, (80, 200, 80))
+    shield_img = make_surface(175, 175, (80, 160, 255))
+
+    def rand_pos():
+        return (rng.randint(0, SCREEN_WIDTH), rng.randint(0, SCREEN_HEIGHT))
+
+    groups = {name: pygame.sprite.Group() for name in (
+        "bullets", "shields", "meteors", "boss_bullets", "enemies",
+    )}
+
+    ident = 0
+    for _ in range(count):
+        groups["bullets"].add(DummySprite(ident, bullet_img, rand_pos()))
+        ident += 1
+        groups["meteors"].add(DummySprite(ident, meteor_img, rand_pos()))
+        ident += 1
+        groups["boss_bullets"].add(DummySprite(ident, boss_bullet_img, rand_pos()))
+        ident += 1
+    for _ in range(max(1, count // 20)):
+        groups["enemies"].add(DummySprite(ident, enemy_img, rand_pos()))
+        ident += 1
+    groups["shields"].add(DummySprite(ident, shield_img, rand_pos(), radius=87))
+    return groups
+
+
+# (ฝั่งยิง, ฝั่งเป้า, dokilla, dokillb, collided) เรียงเหมือนใน Game.update_world_playing
+RULES = [
+    ("bullets", "enemies", True, True, pygame.sprite.collide_mask),
+    ("bullets", "meteors", True, True, pygame.sprite.collide_mask),
+    ("shields", "meteors", False, True, pygame.sprite.collide_circle),
+    ("shields", "enemies", False, True, pygame.sprite.collide_circle),
+    ("shields", "boss_bullets", False, True, pygame.sprite.collide_circle),
+    ("bullets", "boss_bullets", False, False, pygame.sprite.collide_rect),
+]
+
+
+def run_brute(groups):
+    hits = []
+    tests = 0
+    for a, b, ka, kb, fn in RULES:
+        tests += len(groups[a]) * len(groups[b])
+        result = pygame.sprite.groupcollide(groups[a], groups[b], ka, kb, fn)
+        hits.append([(s.ident, [o.ident for o in lst]) for s, lst in result.items()])
+    return hits, tests
+
+
+def run_hash(groups, spatial_hash):
+    spatial_hash.build([groups["meteors"], groups["boss_bullets"], groups["enemies"]])
+    hits = []
+    for a, b, ka, kb, fn in RULES:
+        result = spatial_hash.groupcollide(groups[a], groups[b], ka, kb, fn)
+        hits.append([(s.ident, [o.ident for o in lst]) for s, lst in result.items()])
+    return hits, spatial_hash.pair_tests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SpatialHash vs groupcollide")
+    parser.add_argument("--counts", type=int, nargs="+", default=[25, 50, 100, 200, 400, 800])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+
+    pygame.init()
+    spatial_hash = SpatialHash()
+
+    print(f"{'N':>6} {'brute tests':>12} {'hash tests':>11} {'brute ms':>9} {'hash ms':>8} {'speedup':>8}  same")
+    for count in args.counts:
+        brute_time = 0.0
+        hash_time = 0.0
+        same = True
+        for r in range(args.repeat):
+            seed = args.seed + r
+
+            groups = build_world(count, seed)
+            t0 = time.perf_counter()
+            brute_hits, brute_tests = run_brute(groups)
+            brute_time += time.perf_counter() - t0
+
+            groups = build_world(count, seed)
+            t0 = time.perf_counter()
+            hash_hits, hash_tests = run_hash(groups, spatial_hash)
+            hash_time += time.perf_counter() - t0
+
+            same = same and (brute_hits == hash_hits)
+
+        brute_ms = brute_time * 1000.0 / args.repeat
+        hash_ms = hash_time * 1000.0 / args.repeat
+        speedup = brute_ms / hash_ms if hash_ms > 0 else float("inf")
+        print(
+            f"{count:>6} {brute_tests:>12} {hash_tests:>11} "
+            f"{brute_ms:>9.2f} {hash_ms:>8.2f} {speedup:>7.1f}x  {same}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
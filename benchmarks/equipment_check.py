@@ -0,0 +1,86 @@
+# benchmarks/equipment_check.py
+#
+# ตรวจว่า hero.weapon_counts (equipment registry) นับ 1 ต่อของที่ติดตัวจริง
+# - speed: เก็บไอเท็ม speed ผ่าน CollisionManager._effect_pickup (ทางเดียวกับตอนเล่น)
+#          ระหว่าง buff → weapon_counts["speed_flame"] == 1 และมีไอพ่นใน group "speeds" อันเดียว
+#          เก็บซ้ำระหว่าง buff → ยังเป็น 1 / buff หมด → 0 และ loadout()["speed"] เป็น False
+# ไม่ผ่าน → exit code 1
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/equipment_check.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ต้องตั้งก่อน pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from settings.config import FIXED_DT
+
+
+def step(game, seconds: float):
+    """เดินเฉพาะ Hero + ไอพ่น (ไม่มี spawn / ชน → Hero ไม่ตายระหว่างตรวจ)"""
+    still = pygame.Vector2(0, 0)
+    for _ in range(round(seconds / FIXED_DT)):
+        game.hero.update(FIXED_DT, still)
+        game.speeds.update(FIXED_DT)
+
+
+def check_speed(game) -> list[str]:
+    from managers.collision_manager import CollisionManager
+    from nodes.item_node import ItemNode
+
+    failures = []
+    hero = game.hero
+    ctx = {"groups": game.groups, "pickup_sound": None}
+
+    def expect(label: str, count: int, active: bool):
+        flames = len(game.speeds)
+        now = (hero.weapon_counts["speed_flame"], flames, hero.loadout()["speed"])
+        if now != (count, count, active):
+            failures.append(f"{label}: (speed_flame, flames in group, speed) = {now}, expected {(count, count, active)}")
+
+    expect("before pickup", 0, False)
+
+    CollisionManager._effect_pickup(ctx, None, hero, ItemNode("speed"))
+    expect("after 1st pickup", 1, True)
+
+    step(game, 2.0)
+    CollisionManager._effect_pickup(ctx, None, hero, ItemNode("speed"))
+    expect("after 2nd pickup during buff", 1, True)
+
+    step(game, 4.0)
+    expect("4 s after 2nd pickup (buff 5 s)", 1, True)
+
+    step(game, 1.5)
+    expect("after buff ended", 0, False)
+
+    return failures
+
+
+def main():
+    pygame.init()
+    pygame.mixer.init()
+
+    from game import Game
+
+    game = Game(headless=True, seed=1)
+    game.start_new_game()
+
+    failures = check_speed(game)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print("equipment registry OK")
+
+    pygame.quit()
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
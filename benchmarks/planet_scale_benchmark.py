@@ -0,0 +1,124 @@
+# benchmarks/planet_scale_benchmark.py
+#
+# PlanetScaleCache: scale ภาพ planet ดวงถัดไปไว้ล่วงหน้าบน thread เบื้องหลังได้จริงไหม
+# 1) check: prefetch(i, b) → รอจนเสร็จ → take(i, b) ต้องนับเป็น ready_hits (ไม่ใช่ waits / misses)
+#           take โดยไม่ prefetch ต้องนับเป็น misses และภาพต้องขนาดเท่ากับ scale ตรง ๆ
+#           ไม่ผ่าน → exit code 1
+# 2) run:   เกม headless --seconds วินาที (fixed step) นับ spawn ของ planet ใกล้สายตา
+#           ready / waits / misses + เวลาที่ spawn ใช้มากสุด เทียบกับ smoothscale ตรง ๆ ตอน spawn
+#           (spawn ดวงแรกใน BackgroundManager.__init__ ยังไม่มีอะไร prefetch → นับเป็น miss เสมอ)
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/planet_scale_benchmark.py
+#     python benchmarks/planet_scale_benchmark.py --seconds 300 --seeds 1 2 3
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ต้องตั้งก่อน pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from settings.config import FIXED_DT
+
+
+def check(cache) -> list[str]:
+    """prefetch → take ต้องเป็น ready_hit, take ที่ไม่ได้ prefetch ต้องเป็น miss (คืนรายการที่ไม่ผ่าน)"""
+    failures = []
+    index, bucket = 0, len(cache.scales) - 1
+
+    before = (cache.ready_hits, cache.waits, cache.misses)
+    cache.prefetch(index, bucket)
+    deadline = time.perf_counter() + 5.0
+    while not cache.ready(index, bucket) and time.perf_counter() < deadline:
+        time.sleep(0.001)
+    image = cache.take(index, bucket)
+    after = (cache.ready_hits, cache.waits, cache.misses)
+    if after != (before[0] + 1, before[1], before[2]):
+        failures.append(f"prefetch → take: (ready, waits, misses) {before} → {after}")
+
+    before = after
+    direct = cache.take(index, bucket)
+    after = (cache.ready_hits, cache.waits, cache.misses)
+    if after != (before[0], before[1], before[2] + 1):
+        failures.append(f"take without prefetch: (ready, waits, misses) {before} → {after}")
+    if image.get_size() != direct.get_size():
+        failures.append(f"prefetched size {image.get_size()} != direct size {direct.get_size()}")
+
+    return failures
+
+
+def run(seed: int, seconds: float) -> dict:
+    from game import Game
+
+    game = Game(headless=True, seed=seed)
+    background = game.background
+    cache = background.planet_scales
+
+    spawn_times = []
+    spawn = background._spawn_close_planet
+
+    def timed_spawn():
+        t0 = time.perf_counter()
+        spawn()
+        spawn_times.append(time.perf_counter() - t0)
+
+    background._spawn_close_planet = timed_spawn
+
+    t0 = time.perf_counter()
+    game.run_headless(round(seconds / FIXED_DT))
+    wall = time.perf_counter() - t0
+
+    # เวลา smoothscale ตรง ๆ ที่ขั้นใหญ่สุด (สิ่งที่ spawn ต้องจ่ายถ้าไม่มี prefetch)
+    t1 = time.perf_counter()
+    for index in range(len(cache.images)):
+        cache._scale(index, len(cache.scales) - 1)
+    inline_ms = (time.perf_counter() - t1) / max(1, len(cache.images)) * 1000
+
+    result = {
+        "spawns": len(spawn_times),
+        "ready": cache.ready_hits,
+        "waits": cache.waits,
+        "misses": cache.misses,
+        "worst_ms": max(spawn_times, default=0.0) * 1000,
+        "inline_ms": inline_ms,
+        "wall": wall,
+        "failures": check(cache),
+    }
+    cache.shutdown()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PlanetScaleCache prefetch hit rate")
+    parser.add_argument("--seconds", type=float, default=120.0, help="เวลาในเกม (fixed step) ต่อ seed")
+    parser.add_argument("--seeds", nargs="+", type=int, default=[7, 3])
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.mixer.init()
+
+    print(f"{'seed':>5}{'spawns':>8}{'ready':>7}{'waits':>7}{'misses':>8}{'worst ms':>10}{'inline ms':>11}{'wall s':>8}")
+    failed = False
+    for seed in args.seeds:
+        r = run(seed, args.seconds)
+        print(
+            f"{seed:>5}{r['spawns']:>8}{r['ready']:>7}{r['waits']:>7}{r['misses']:>8}"
+            f"{r['worst_ms']:>10.2f}{r['inline_ms']:>11.2f}{r['wall']:>8.1f}"
+        )
+        for failure in r["failures"]:
+            print(f"  FAIL {failure}")
+            failed = True
+
+    pygame.quit()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
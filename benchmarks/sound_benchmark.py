@@ -0,0 +1,160 @@
+# benchmarks/sound_benchmark.py
+#
+# เวลาต่อการเรียก SoundManager.play() ที่ 32 / 64 / 128 channel
+# เทียบกับวิธีเดิม (ไล่ get_busy / get_sound ทุก channel 2 รอบ + min() หา channel ที่จะแย่ง)
+# - idle:      เสียงสั้น + อ่าน END_EVENT ทุก ๆ frame → ส่วนใหญ่มี channel ว่าง
+# - saturated: เสียงยาว ทุก channel ไม่ว่าง → ต้องแย่ง channel ที่ priority ต่ำสุด / เก่าสุดทุกครั้ง
+# เสียงที่ใช้: กระสุน (max_simultaneous=8) + ระเบิด + pickup ปนกันแบบสุ่ม (seed ตายตัว)
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/sound_benchmark.py
+#     python benchmarks/sound_benchmark.py --channels 32 64 128 256 --calls 5000
+
+import argparse
+import array
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ต้องตั้งก่อน pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from managers.sound_manager import SoundManager
+
+
+class LegacySoundPool:
+    """SoundManager.play() แบบเดิม (ไว้เทียบเวลา)"""
+
+    def __init__(self, num_channels: int):
+        pygame.mixer.set_num_channels(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self.priority = [0] * num_channels
+        self.last_play_time = [0.0] * num_channels
+
+    def play(self, sound, volume=1.0, max_simultaneous=None, priority=0):
+        if max_simultaneous is not None:
+            same_count = 0
+            for ch in self.channels:
+                if ch.get_busy() and ch.get_sound() is sound:
+                    same_count += 1
+            if same_count >= max_simultaneous:
+                return
+
+        now = time.time()
+
+        selected_index = None
+        for idx, ch in enumerate(self.channels):
+            if not ch.get_busy():
+                selected_index = idx
+                break
+
+        if selected_index is None:
+            lowest_pri = min(self.priority)
+            candidates = [i for i, p in enumerate(self.priority) if p == lowest_pri]
+            selected_index = min(candidates, key=lambda i: self.last_play_time[i])
+
+        ch = self.channels[selected_index]
+        ch.set_volume(volume)
+        ch.play(sound)
+        self.priority[selected_index] = priority
+        self.last_play_time[selected_index] = now
+
+
+def make_sound(seconds: float) -> pygame.mixer.Sound:
+    freq, _, channels = pygame.mixer.get_init()
+    return pygame.mixer.Sound(buffer=array.array("h", [0] * int(freq * seconds) * channels))
+
+
+def make_calls(sounds: dict, count: int, seed: int) -> list[tuple]:
+    """(sound, volume, max_simultaneous, priority) แบบที่เกมเรียกจริง"""
+    rng = random.Random(seed)
+    table = [
+        (sounds["bullet"], 0.5, 8, 7),
+        (sounds["bullet"], 0.8, 8, 7),
+        (sounds["explosion"], 1.0, None, 5),
+        (sounds["pickup"], 1.0, None, 9),
+    ]
+    return [table[rng.randrange(len(table))] for _ in range(count)]
+
+
+def run_calls(play, calls: list[tuple], batch: int, pump) -> float:
+    """เวลาเฉลี่ยต่อ play() (µs) ไม่นับเวลา pump ระหว่าง batch"""
+    total = 0.0
+    for start in range(0, len(calls), batch):
+        pump()
+        chunk = calls[start:start + batch]
+        t0 = time.perf_counter()
+        for sound, volume, max_simultaneous, priority in chunk:
+            play(sound, volume, max_simultaneous, priority)
+        total += time.perf_counter() - t0
+    return total / len(calls) * 1e6
+
+
+def stop_all():
+    pygame.mixer.stop()
+    pygame.event.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SoundManager.play() cost vs channel count")
+    parser.add_argument("--channels", nargs="+", type=int, default=[32, 64, 128])
+    parser.add_argument("--calls", type=int, default=3000, help="จำนวน play() ต่อการวัด")
+    parser.add_argument("--batch", type=int, default=8, help="play() ต่อ 1 frame (อ่าน event ระหว่าง frame)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.mixer.init()
+    pygame.display.set_mode((1, 1))
+
+    scenarios = {
+        # เสียงสั้นมาก → จบก่อน frame ถัดไปแทบทุกครั้ง (รอ mixer เล่นจบก่อนอ่าน event)
+        "idle": {name: make_sound(0.001) for name in ("bullet", "explosion", "pickup")},
+        # เสียงยาวกว่าเวลาวัดทั้งหมด → channel ไม่ว่างตลอด
+        "saturated": {name: make_sound(60.0) for name in ("bullet", "explosion", "pickup")},
+    }
+
+    print(f"{'channels':>8}  {'scenario':<10}{'legacy µs':>11}{'pool µs':>10}{'speedup':>9}  stats")
+    for num_channels in args.channels:
+        for name, sounds in scenarios.items():
+            calls = make_calls(sounds, args.calls, args.seed)
+
+            def wait_for_mixer():
+                if name == "idle":
+                    time.sleep(0.01)
+
+            # ----- แบบเดิม -----
+            stop_all()
+            legacy = LegacySoundPool(num_channels)
+            legacy_us = run_calls(legacy.play, calls, args.batch, wait_for_mixer)
+
+            # ----- SoundManager -----
+            stop_all()
+            SoundManager.shutdown()
+            SoundManager.init(num_channels=num_channels)
+
+            def pump():
+                wait_for_mixer()
+                SoundManager.pump()
+
+            pool_us = run_calls(SoundManager.play, calls, args.batch, pump)
+            stats = SoundManager.stats()
+
+            speedup = legacy_us / pool_us if pool_us > 0 else 0.0
+            print(
+                f"{num_channels:>8}  {name:<10}{legacy_us:>11.2f}{pool_us:>10.2f}{speedup:>8.2f}x  "
+                f"plays={stats['plays']} steals={stats['steals']} limited={stats['limited']}"
+            )
+
+    SoundManager.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
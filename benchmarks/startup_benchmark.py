@@ -0,0 +1,139 @@
+# benchmarks/startup_benchmark.py
+#
+# เวลาเปิดเกมจนถึงเมนู (time-to-menu) + หน่วยความจำสูงสุด
+# - cold : ไม่มี cache → decode PNG ต้นฉบับ + scale + bake
+# - warm : โหลดเฟรมที่ scale แล้วจาก ASSET_CACHE_DIR
+# - eager: โหลดทุกชุดเฟรมใน ResourceManager.init() (ASSET_STREAMING = False)
+# - lazy : โหลดแค่ของเมนู ที่เหลือ prefetch / โหลดตอนใช้ (ASSET_STREAMING = True)
+# แต่ละรอบรันใน process ใหม่ (ไม่มีอะไรค้างใน memory จากรอบก่อน)
+# cache ที่ใช้วัดอยู่ในโฟลเดอร์ชั่วคราว (ไม่แตะ ASSET_CACHE_DIR จริงของผู้เล่น) ลบทิ้งตอนจบ
+# --threads หลายค่า = ดูว่าเวลาโหลดลดลงตามจำนวน thread ที่ใช้ decode แค่ไหน
+# --budget = งบหน่วยความจำของ ResourceManager (MB, ไม่ใส่ = ASSET_MEMORY_BUDGET_MB)
+#            คอลัมน์ cache MB = ภาพที่ยังโหลดค้างอยู่ตอนถึงเมนู (หลัง trim)
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/startup_benchmark.py
+#     python benchmarks/startup_benchmark.py --repeat 5 --threads 1 2 4 8 --out startup.json
+#     python benchmarks/startup_benchmark.py --modes eager --budget 4
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from settings.config import ASSET_MEMORY_BUDGET_MB
+from managers.asset_cache import AssetCache
+
+
+# โค้ดที่รันใน process ลูก: สร้าง Game แล้ววาดเมนูเฟรมแรก จากนั้นพิมพ์ผลเป็น JSON
+CHILD = """
+import json, os, resource, sys, time
+started = time.perf_counter()
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, {root!r})
+import pygame
+pygame.init()
+pygame.mixer.init()
+import managers.resource_manager as rm
+rm.ASSET_STREAMING = {lazy}
+rm.ASSET_LOADER_THREADS = {threads}
+rm.ASSET_MEMORY_BUDGET_MB = {budget}
+rm.ASSET_CACHE_DIR = {cache_dir!r}
+from game import Game
+game = Game()
+game.scene_manager.render(game.screen)
+pygame.display.flip()
+report = dict(rm.ResourceManager.load_report)
+report["menu_seconds"] = time.perf_counter() - started
+report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+report["memory"] = rm.ResourceManager.memory_stats()
+rm.ResourceManager.shutdown()
+print(json.dumps(report))
+"""
+
+
+def run_once(lazy: bool, threads: int | None, budget: float | None, cache_dir: str) -> dict:
+    child = CHILD.format(root=ROOT, lazy=lazy, threads=threads, budget=budget, cache_dir=cache_dir)
+    out = subprocess.run(
+        [sys.executable, "-c", child],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs warm, eager vs lazy startup")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[None],
+        help="จำนวน thread ที่ใช้ decode (ไม่ใส่ = เท่าจำนวน core)",
+    )
+    parser.add_argument("--modes", nargs="+", default=["eager", "lazy"], choices=["eager", "lazy"])
+    parser.add_argument(
+        "--budget", type=float, default=ASSET_MEMORY_BUDGET_MB,
+        help="งบหน่วยความจำของภาพ (MB)",
+    )
+    parser.add_argument("--out", help="เขียนผลเป็น JSON")
+    args = parser.parse_args()
+
+    cache_dir = tempfile.mkdtemp(prefix="startup-benchmark-cache-")
+    cache = AssetCache(cache_dir)
+    try:
+        run_all(args, cache)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def run_all(args, cache: AssetCache):
+
+    print(f"cores: {os.cpu_count()}  budget: {args.budget} MB")
+    print(
+        f"{'mode':<6}{'threads':>8} {'':<5}{'init s':>8}{'menu s':>8}{'peak MB':>9}"
+        f"{'sets':>7}{'hits':>6}{'misses':>8}{'decoded':>9}{'cache MB':>10}{'evicted':>9}"
+    )
+
+    report = []
+    for mode in args.modes:
+        lazy = mode == "lazy"
+        for threads in args.threads:
+            runs = {"cold": [], "warm": []}
+            for _ in range(args.repeat):
+                cache.clear()
+                runs["cold"].append(run_once(lazy, threads, args.budget, cache.cache_dir))
+                runs["warm"].append(run_once(lazy, threads, args.budget, cache.cache_dir))
+
+            entry = {"mode": mode, "threads": runs["cold"][-1]["threads"]}
+            for name in ("cold", "warm"):
+                results = runs[name]
+                init_s = statistics.median(r["seconds"] for r in results)
+                menu_s = statistics.median(r["menu_seconds"] for r in results)
+                peak_mb = statistics.median(r["peak_rss_mb"] for r in results)
+                last = results[-1]
+                memory = last["memory"]
+                print(
+                    f"{mode:<6}{last['threads']:>8} {name:<5}{init_s:>8.3f}{menu_s:>8.3f}{peak_mb:>9.1f}"
+                    f"{last['loaded_sets']:>4}/{last['total_sets']:<2}{last['cache_hits']:>6}"
+                    f"{last['cache_misses']:>8}{last['decoded_files']:>9}"
+                    f"{memory['bytes'] / 1048576:>10.1f}{memory['evictions']:>9}"
+                )
+                entry[name] = results
+                entry[f"{name}_init_median"] = init_s
+                entry[f"{name}_menu_median"] = menu_s
+                entry[f"{name}_peak_rss_mb_median"] = peak_mb
+            report.append(entry)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
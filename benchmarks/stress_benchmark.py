@@ -0,0 +1,341 @@
+# benchmarks/stress_benchmark.py
+#
+# Stress test ของเกมจริง (Game แบบ headless) ด้วยโหลดที่กำหนดเอง
+# - ทุกด่านใน STAGE_CONFIGS (spawn ตามปกติ + บอสถ้าด่านนั้นมี)
+# - เคสหนักสังเคราะห์: meteor / boss bullet / explosion จำนวนมาก, laser + shield + drone
+# - คงจำนวน entity ไว้ทุกเฟรม (เติมของที่ตาย/หลุดจอ นอกช่วงจับเวลา) ด้วย seed ตายตัว
+# - วัดเวลา update / collision / draw ต่อเฟรม (p50 / p95 / p99) ผ่าน Profiler
+# - นับ blit / การเรียก Surface.blits ต่อเฟรม (Game.render_queue)
+# - เสียงจาก collision ต่อเฟรม: ที่ emit เข้า SoundBus เทียบกับที่เล่นจริงหลังรวมเสียงซ้ำ
+# - สัดส่วนเฟรมที่ HUD ต้องประกอบภาพใหม่ (UIManager.hud_recomposes, ค่าที่เหลือ = blit Surface เดิม)
+# - --dirty-rects: วาดแบบ DirtyRenderer + วัดเวลาส่งขึ้นจอ (flip / display.update)
+# - เขียนผลเป็น JSON ไว้เทียบข้าม commit (--compare)
+#
+# วิธีรัน (จากโฟลเดอร์หลักของโปรเจกต์):
+#     python benchmarks/stress_benchmark.py
+#     python benchmarks/stress_benchmark.py --frames 300 --out results.json
+#     python benchmarks/stress_benchmark.py --only bullet_hell kitchen_sink --compare results.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# ต้องตั้งก่อน pygame.init()
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT, FIXED_DT
+from settings.game_constants import GAME_STATE_PLAYING
+from settings.stage_config import STAGE_CONFIGS, has_boss
+from game import Game, create_boss_for_stage
+from managers.collision_manager import CollisionManager
+from managers.input_manager import InputManager, INPUT_FIRE, INPUT_LEFT, INPUT_RIGHT
+from managers.pool_manager import PoolManager
+from managers.profiler import Profiler
+from managers.replay_manager import InputReplay
+from managers.sound_bus import SoundBus
+from managers.sound_manager import SoundManager
+from nodes.boss_bullet_node import BossBulletNode
+from nodes.drone_node import DroneNode
+from nodes.explosion_node import ExplosionNode
+from nodes.meteor_node import MeteorNode
+from nodes.shield_node import ShieldNode
+
+
+# โหลดของแต่ละ scenario (ค่าที่ไม่ใส่ = 0 / False)
+#   meteors / boss_bullets / explosions : จำนวนที่คงไว้ทุกเฟรม (นอกเหนือจากที่เกม spawn เอง)
+#   laser : Hero อยู่โหมดเลเซอร์ตลอด, shields / drones : จำนวนที่ติดตัว Hero
+#   boss  : มีบอสของด่านนั้นตลอด
+SYNTHETIC_SCENARIOS = [
+    {"name": "meteor_storm", "stage": 1, "meteors": 300},
+    {"name": "bullet_hell", "stage": 1, "boss": True, "boss_bullets": 800},
+    {"name": "explosion_flood", "stage": 1, "explosions": 300},
+    {"name": "laser_shield_drones", "stage": 1, "meteors": 60, "laser": True, "shields": 3, "drones": 2},
+    {
+        "name": "kitchen_sink",
+        "stage": 1,
+        "boss": True,
+        "meteors": 200,
+        "boss_bullets": 400,
+        "explosions": 100,
+        "laser": True,
+        "shields": 3,
+        "drones": 2,
+    },
+]
+
+
+def stage_scenarios() -> list[dict]:
+    """1 scenario ต่อด่าน: spawn ตาม config + บอสถ้าด่านนั้นมี"""
+    return [
+        {"name": f"stage_{stage}", "stage": stage, "boss": has_boss(stage)}
+        for stage in sorted(STAGE_CONFIGS)
+    ]
+
+
+def input_pattern(frames: int) -> bytes:
+    """ยิงตลอด + ส่ายซ้าย/ขวาทุก 60 tick"""
+    return bytes(
+        INPUT_FIRE | (INPUT_LEFT if (i // 60) % 2 else INPUT_RIGHT)
+        for i in range(frames)
+    )
+
+
+class StressRunner:
+    def __init__(self, game, scenario: dict, seed: int):
+        self.game = game
+        self.scenario = scenario
+        self.rng = random.Random(seed)
+
+    # ------------------------------------------------
+    # เตรียมฉาก
+    # ------------------------------------------------
+    def setup(self, total_frames: int):
+        game = self.game
+        stage = self.scenario.get("stage", 1)
+
+        game.start_new_game()
+        game.current_stage = stage
+        game.spawn_manager.set_stage(stage)
+
+        InputManager.set_replay(InputReplay(game.seed, FIXED_DT, input_pattern(total_frames)))
+
+    def top_up(self):
+        """เติม entity ให้ครบตามโหลด + กัน Hero ตาย / เปลี่ยนด่าน (ไม่นับเวลา)"""
+        game = self.game
+        scenario = self.scenario
+        hero = game.hero
+        rng = self.rng
+
+        # Hero อมตะ: ตายแล้วใส่กลับ
+        if not hero.alive():
+            game.heros.add(hero)
+        game.game_state = GAME_STATE_PLAYING
+
+        # ล็อกด่าน: ไม่ให้เกมเรียกบอสเอง / เปลี่ยนด่าน
+        game.stage_timer = 0.0
+        game.boss_spawned = False
+
+        if scenario.get("boss") and len(game.bosses) == 0:
+            game.bosses.add(create_boss_for_stage(game.current_stage, hero, game.boss_bullets))
+
+        for _ in range(scenario.get("meteors", 0) - len(game.meteors)):
+            meteor = PoolManager.acquire(MeteorNode, rng)
+            meteor.pos.y = rng.uniform(-meteor.rect.height, SCREEN_HEIGHT)
+            meteor.rect.center = meteor.pos
+            game.meteors.add(meteor)
+
+        for _ in range(scenario.get("boss_bullets", 0) - len(game.boss_bullets)):
+            start = (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT * 0.6))
+            direction = pygame.Vector2(rng.uniform(-1.0, 1.0), 1.0).normalize()
+            game.boss_bullets.add(PoolManager.acquire(BossBulletNode, start, direction))
+
+        for _ in range(scenario.get("explosions", 0) - len(game.explosions)):
+            pos = (rng.uniform(0, SCREEN_WIDTH), rng.uniform(0, SCREEN_HEIGHT))
+            game.explosions.add(PoolManager.acquire(ExplosionNode, pos, game.explosion_frames))
+
+        if scenario.get("laser"):
+            hero.activate_laser(duration=60.0)
+
+        for _ in range(scenario.get("shields", 0) - len(game.shields)):
+            game.shields.add(ShieldNode(hero, max_hp=3))
+
+        drones = scenario.get("drones", 0)
+        if len(game.drones) < drones:
+            for drone in game.drones.sprites():
+                drone.kill()    # kill() คืนจำนวนใน hero.weapon_counts (empty() ไม่คืน)
+            sides = ["right", "left"]
+            for i in range(drones):
+                game.drones.add(DroneNode(hero, side=sides[i % 2]))
+
+    # ------------------------------------------------
+    # วัดผล
+    # ------------------------------------------------
+    def run(self, frames: int, warmup: int) -> dict:
+        game = self.game
+        self.setup(frames + warmup)
+
+        entities = 0
+        pair_tests = 0
+        blits = 0
+        blit_calls = 0
+        hud_start = game.ui.hud_recomposes
+        sound_start = (SoundBus.emitted, SoundBus.dispatched)
+
+        for frame in range(frames + warmup):
+            if frame == warmup:
+                Profiler.reset()
+                entities = 0
+                pair_tests = 0
+                blits = 0
+                blit_calls = 0
+                hud_start = game.ui.hud_recomposes
+                sound_start = (SoundBus.emitted, SoundBus.dispatched)
+
+            self.top_up()
+            SoundManager.pump()
+            entities += sum(len(group) for group in game.groups.values())
+
+            with Profiler.section("update"):
+                game.update_world_playing(FIXED_DT)
+            with Profiler.section("draw"):
+                game.draw_world(GAME_STATE_PLAYING)
+            with Profiler.section("flip"):
+                game.present()
+            Profiler.end_frame()
+
+            pair_tests += CollisionManager.get_pair_tests()
+            blits += game.render_queue.blits
+            blit_calls += game.render_queue.calls
+
+        summary = {row["name"]: row for row in Profiler.summary()}
+
+        def timing(name):
+            row = summary.get(name)
+            if row is None:
+                return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+            return {
+                "mean": round(row["mean_ms"], 4),
+                "p50": round(row["p50_ms"], 4),
+                "p95": round(row["p95_ms"], 4),
+                "p99": round(row["p99_ms"], 4),
+                "max": round(row["max_ms"], 4),
+            }
+
+        load = {key: value for key, value in self.scenario.items() if key != "name"}
+        return {
+            "name": self.scenario["name"],
+            "load": load,
+            "frames": frames,
+            "entities_mean": round(entities / frames, 1),
+            "pair_tests_mean": round(pair_tests / frames, 1),
+            "blits_mean": round(blits / frames, 1),
+            "blit_calls_mean": round(blit_calls / frames, 1),
+            "hud_recompose_rate": round((game.ui.hud_recomposes - hud_start) / frames, 3),
+            "sound_events_mean": round((SoundBus.emitted - sound_start[0]) / frames, 2),
+            "sound_plays_mean": round((SoundBus.dispatched - sound_start[1]) / frames, 2),
+            "update_ms": timing("update"),
+            "collision_ms": timing("update.collision"),
+            "draw_ms": timing("draw"),
+            "flip_ms": timing("flip"),
+        }
+
+
+def git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results: list[dict]):
+    print(
+        f"{'scenario':<22}{'entities':>9}{'pairs':>8}{'blits':>7}"
+        f"{'update p50':>12}{'p95':>8}{'coll p50':>10}{'draw p50':>10}{'p95':>8}"
+    )
+    for r in results:
+        print(
+            f"{r['name']:<22}{r['entities_mean']:>9.0f}{r['pair_tests_mean']:>8.0f}"
+            f"{r.get('blits_mean', 0):>7.0f}"
+            f"{r['update_ms']['p50']:>12.2f}{r['update_ms']['p95']:>8.2f}"
+            f"{r['collision_ms']['p50']:>10.2f}"
+            f"{r['draw_ms']['p50']:>10.2f}{r['draw_ms']['p95']:>8.2f}"
+        )
+
+
+def print_compare(results: list[dict], baseline_path: str):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    base = {r["name"]: r for r in baseline["scenarios"]}
+
+    print(f"\ncompare with {baseline_path} (commit {baseline['meta'].get('commit')}) — p50 ms, + = ช้าลง")
+    print(f"{'scenario':<22}{'update':>18}{'collision':>18}{'draw':>18}")
+    for r in results:
+        old = base.get(r["name"])
+        if old is None:
+            print(f"{r['name']:<22}  (ไม่มีใน baseline)")
+            continue
+
+        cells = []
+        for key in ("update_ms", "collision_ms", "draw_ms"):
+            before = old[key]["p50"]
+            after = r[key]["p50"]
+            change = (after - before) / before * 100.0 if before > 0 else 0.0
+            cells.append(f"{before:.2f}→{after:.2f} {change:+4.0f}%")
+        print(f"{r['name']:<22}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress benchmark (headless Game)")
+    parser.add_argument(
+        "--frames", type=int, default=300,
+        help="เฟรมที่วัดต่อ scenario (p50/p95/p99 คิดจาก PROFILER_WINDOW เฟรมล่าสุด)",
+    )
+    parser.add_argument("--warmup", type=int, default=30, help="เฟรมอุ่นเครื่อง (ไม่นับ)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="รันเฉพาะ scenario ที่ระบุ")
+    parser.add_argument("--dirty-rects", action="store_true", help="วาดแบบ dirty-rect (DirtyRenderer)")
+    parser.add_argument("--out", default="stress_results.json", help="ไฟล์ผลลัพธ์ (JSON)")
+    parser.add_argument("--compare", metavar="PATH", help="JSON จากรอบก่อน ไว้เทียบ")
+    args = parser.parse_args()
+
+    scenarios = stage_scenarios() + SYNTHETIC_SCENARIOS
+    if args.only:
+        scenarios = [s for s in scenarios if s["name"] in args.only]
+
+    pygame.init()
+    pygame.mixer.init()
+
+    game = Game(headless=True, seed=args.seed, dirty_rects=args.dirty_rects)
+    Profiler.enable()
+
+    results = []
+    started = time.perf_counter()
+    for scenario in scenarios:
+        game.seed = args.seed
+        runner = StressRunner(game, scenario, args.seed)
+        results.append(runner.run(args.frames, args.warmup))
+    elapsed = time.perf_counter() - started
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "dt": FIXED_DT,
+            "dirty_rects": args.dirty_rects,
+            "wall_seconds": round(elapsed, 2),
+        },
+        "scenarios": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print_table(results)
+    print(f"\nresults written to {args.out}")
+    if args.compare:
+        print_compare(results, args.compare)
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
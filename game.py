@@ -1,5 +1,10 @@
 # game.py
 
+import hashlib
+import os
+import random
+import time
+
 import pygame
 
 from settings.config import (
@@ -7,6 +12,10 @@ from settings.config import (
     SCREEN_HEIGHT,
     FPS,
     GREY,
+    HEADLESS_DT,
+    FIXED_DT,
+    MAX_CATCHUP_STEPS,
+    DIRTY_RECT_RENDERING,
 )
 from settings.game_constants import (
     BULLET_COOLDOWN,
@@ -15,6 +24,7 @@ from settings.game_constants import (
     GAME_STATE_WIN,
 )
 
+from settings.asset_manifest import SCENE_ASSETS, stage_assets
 from settings.stage_config import (
     STAGE_CONFIGS,
     has_boss,
@@ -28,8 +38,16 @@ from managers.input_manager import InputManager
 from managers.collision_manager import CollisionManager
 from managers.spawn_manager import SpawnManager
 from managers.sound_manager import SoundManager
+from managers.sound_bus import SoundBus
 from managers.ui_manager import UIManager
 from managers.background_manager import BackgroundManager
+from managers.pool_manager import PoolManager
+from managers.projectile_group import ProjectileGroup
+from managers.replay_manager import InputRecorder
+from managers.frame_interpolator import FrameInterpolator
+from managers.render_queue import RenderQueue
+from managers.dirty_renderer import DirtyRenderer
+from managers.profiler import Profiler
 from managers.scene_manager import (
     SceneManager,
     MenuScene,
@@ -47,6 +65,49 @@ from nodes.laser_beam_node import LaserBeamNode
 # Boss จะโผล่เมื่อเวลาผ่านไปกี่ % ของด่าน (0.7 = 70% ท้ายด่าน)
 BOSS_APPEAR_RATIO = 0.7
 
+# ลำดับการวาด sprite (ล่าง → บน) = ชื่อใน Game.groups
+SPRITE_DRAW_ORDER = [
+    "meteors",
+    "enemies",
+    "bosses",
+    "items",
+    "heros",
+    "speeds",
+    "shields",
+    "drones",
+    "bullets",
+    "boss_bullets",
+    "laser_beams",
+    "explosions",
+]
+
+
+def use_dummy_drivers():
+    """
+    สลับจอ / เสียงไปใช้ SDL dummy driver (ไม่เปิดหน้าต่าง ไม่เปิดอุปกรณ์เสียงจริง)
+    เรียกก่อนหรือหลัง pygame.init() ก็ได้: subsystem ที่เปิดด้วย driver จริงไปแล้วจะถูกปิดแล้วเปิดใหม่
+    """
+    # mixer ไม่มี API บอก driver → ถ้า env เป็น dummy อยู่แล้วก่อนเรียก ถือว่า mixer ที่เปิดอยู่ใช้ dummy แล้ว
+    audio_was_dummy = os.environ.get("SDL_AUDIODRIVER") == "dummy"
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    if pygame.display.get_init() and pygame.display.get_driver() != "dummy":
+        pygame.display.quit()
+    if not pygame.display.get_init():
+        pygame.display.init()
+
+    settings = pygame.mixer.get_init()
+    if settings is not None and not audio_was_dummy:
+        # เปิด mixer ใหม่ (ค่า frequency / size / channels เดิม)
+        # Channel เดิมใช้ไม่ได้แล้ว → ปิด SoundManager ให้ init() สร้างชุดใหม่
+        SoundManager.shutdown()
+        pygame.mixer.quit()
+        frequency, size, channels = settings
+        pygame.mixer.init(frequency, size, channels)
+    elif settings is None:
+        pygame.mixer.init()
+
 
 def create_boss_for_stage(
     stage: int,
@@ -81,7 +142,27 @@ class Game:
     - มี SceneManager คอยจัดการ Scene ต่าง ๆ
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        headless: bool = False,
+        seed: int | None = None,
+        dirty_rects: bool | None = None,
+    ):
+        # headless = ไม่มีจอจริง: สลับไปใช้ SDL dummy driver เอง (ไม่ต้องพึ่ง env จากคนเรียก)
+        self.headless = headless
+        if headless:
+            use_dummy_drivers()
+
+        # ---------- Random ----------
+        # RNG ตัวเดียวที่ส่งให้ทุก spawner: seed เดิม + input เดิม → เกมเหมือนเดิมทุกบิต
+        # (None = สุ่ม seed ใหม่ทุกครั้ง)
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        # dt คงที่ต่อ 1 step ของ simulation (replay ใช้ค่าจากไฟล์)
+        self.fixed_dt = FIXED_DT
+        self.recorder: InputRecorder | None = None
+
         # ---------- Pygame Window ----------
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Spaceship (State-based Animation)")
@@ -89,16 +170,25 @@ class Game:
 
         # ---------- Audio ----------
         SoundManager.init(num_channels=32)
+        InputManager.bind_event(SoundManager.END_EVENT, SoundManager.handle_event)
 
         # ---------- Resource ----------
         ResourceManager.init()
-        self.explosion_frames = ResourceManager.get_explosion_frames()
+        self.explosion_frames = []      # โหลดตอนเริ่มเกม (ดู start_new_game)
+        self.pinned_assets: list[str] = []  # ชุดเฟรมที่ pin ไว้กับ ResourceManager (ดู pin_stage_assets)
         self.explosion_sound = ResourceManager.get_sound("explosion")
         self.pickup_sound = ResourceManager.get_sound("pickup")
         self.laser_sound = ResourceManager.get_sound("laser")
 
         # ---------- Background ----------
-        self.background = BackgroundManager()
+        # ใช้ RNG แยกจาก gameplay (เมนูเล่นนานแค่ไหนก็ไม่กระทบการ spawn)
+        self.background = BackgroundManager(rng=random.Random(seed))
+
+        # BackgroundManager เก็บภาพที่ scale แล้วไว้เอง → ต้นฉบับ bg_* ทิ้งได้ถ้าเกินงบ
+        ResourceManager.trim()
+
+        # ระหว่างอยู่หน้าเมนู → เตรียมภาพตอนเล่น + ด่านแรกไว้เบื้องหลัง
+        ResourceManager.prefetch(SCENE_ASSETS["game"] + stage_assets(1))
 
         # ---------- Fonts + UI ----------
         self.font_small = pygame.font.Font(None, 28)
@@ -109,8 +199,8 @@ class Game:
         self.heros = pygame.sprite.Group()
         self.enemies = pygame.sprite.Group()
         self.bosses = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.boss_bullets = pygame.sprite.Group()
+        self.bullets = ProjectileGroup()
+        self.boss_bullets = ProjectileGroup()
         self.meteors = pygame.sprite.Group()
         self.items = pygame.sprite.Group()
         self.drones = pygame.sprite.Group()
@@ -119,10 +209,42 @@ class Game:
         self.explosions = pygame.sprite.Group()
         self.laser_beams = pygame.sprite.Group()
 
+        # ชื่อ group → group (ใช้กับ COLLISION_MATRIX)
+        self.groups = {
+            "heros": self.heros,
+            "enemies": self.enemies,
+            "bosses": self.bosses,
+            "bullets": self.bullets,
+            "boss_bullets": self.boss_bullets,
+            "meteors": self.meteors,
+            "items": self.items,
+            "drones": self.drones,
+            "shields": self.shields,
+            "speeds": self.speeds,
+            "explosions": self.explosions,
+            "laser_beams": self.laser_beams,
+        }
+
+        # F3 = แสดง/ซ่อนเวลาที่ใช้แต่ละส่วนของเฟรม
+        InputManager.bind_key(pygame.K_F3, Profiler.toggle_overlay)
+
+        # วาดตำแหน่งระหว่าง step ก่อนหน้ากับ step ล่าสุด (ดู run)
+        self.interpolator = FrameInterpolator(self.groups.values())
+        self.render_alpha = 1.0
+
+        # ทุก layer (พื้นหลัง + group) วาดผ่าน Surface.blits ครั้งเดียวต่อ layer
+        self.render_queue = RenderQueue()
+
+        # dirty_rects: ระหว่างเล่น update จอเฉพาะส่วนที่เปลี่ยน (None = DIRTY_RECT_RENDERING)
+        if dirty_rects is None:
+            dirty_rects = DIRTY_RECT_RENDERING
+        self.dirty_renderer = DirtyRenderer(self.screen.get_size()) if dirty_rects else None
+
         # ---------- Game Variables ----------
         self.hero: HeroNode | None = None
         self.score = 0
         self.bullet_cooldown = 0.0
+        self.collision_hits: list = []   # การชนทั้งหมดของเฟรมล่าสุด
 
         self.current_stage = 1
         self.STAGE_DURATION = 30.0
@@ -148,19 +270,24 @@ class Game:
 
     def start_new_game(self):
         """เริ่มเกมใหม่ (ใช้จาก MenuScene / GameOverScene)"""
-        # เคลียร์ group ต่าง ๆ
+        # เคลียร์ group ต่าง ๆ (group ที่มาจาก pool → release_group คืน sprite เข้า pool)
         self.heros.empty()
         self.enemies.empty()
         self.bosses.empty()
-        self.bullets.empty()
-        self.boss_bullets.empty()
-        self.meteors.empty()
+        PoolManager.release_group(self.bullets)
+        PoolManager.release_group(self.boss_bullets)
+        PoolManager.release_group(self.meteors)
         self.items.empty()
         self.drones.empty()
         self.shields.empty()
         self.speeds.empty()
-        self.explosions.empty()
+        PoolManager.release_group(self.explosions)
         self.laser_beams.empty()
+        SoundBus.clear()
+
+        # ภาพที่ทุกด่านใช้ต้องพร้อมก่อนสร้าง Hero (ปกติ prefetch เสร็จตั้งแต่อยู่หน้าเมนู)
+        ResourceManager.ensure(SCENE_ASSETS["game"])
+        self.explosion_frames = ResourceManager.get_explosion_frames()
 
         # Hero ใหม่
         self.hero = HeroNode()
@@ -171,6 +298,7 @@ class Game:
         self.bullet_cooldown = 0.0
 
         self.current_stage = 1
+        self.pin_stage_assets(self.current_stage)
         self.stage_timer = 0.0
         self.total_time = 0.0
         self.max_stage = MAX_STAGE
@@ -178,8 +306,19 @@ class Game:
 
         self.game_state = GAME_STATE_PLAYING
 
+        # เริ่ม RNG ใหม่จาก seed ทุกเกม + เริ่มอัด input ใหม่
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        if self.recorder is not None:
+            self.recorder.reset()
+
         # SpawnManager สำหรับด่านแรก
-        self.spawn_manager = SpawnManager(STAGE_CONFIGS, initial_stage=self.current_stage)
+        self.spawn_manager = SpawnManager(
+            STAGE_CONFIGS,
+            initial_stage=self.current_stage,
+            rng=self.rng,
+        )
+        self.background.set_stage(self.current_stage)
 
         # เข้าสู่ GameScene
         self.scene_manager.change_scene(GameScene(self))
@@ -188,13 +327,59 @@ class Game:
         """ใช้จาก Scene เพื่อออกเกม"""
         self.running = False
 
+    # --------------------------------------------------
+    # Record / Replay
+    # --------------------------------------------------
+
+    def enable_recording(self, dt: float = FIXED_DT):
+        """อัด input ทุก tick (ใช้ dt คงที่ เพื่อให้เล่นซ้ำได้ตรงทุกบิต)"""
+        if self.seed is None:
+            raise ValueError("Recording needs a fixed seed")
+        self.fixed_dt = dt
+        self.recorder = InputRecorder(self.seed, dt)
+        InputManager.set_recorder(self.recorder)
+
+    def enable_replay(self, replay):
+        """ใช้ input จาก InputReplay แทนคีย์บอร์ด"""
+        self.fixed_dt = replay.dt
+        InputManager.set_replay(replay)
+
+    def state_digest(self) -> str:
+        """
+        hash ของสถานะเกมทั้งหมด (คะแนน, ด่าน, เวลา, ตำแหน่ง sprite ทุกตัว, ฟิสิกส์ Hero)
+        ใช้เทียบว่า replay ได้ผลเหมือนตอนอัดทุกบิตหรือไม่
+        """
+        digest = hashlib.sha1()
+        digest.update(repr((
+            self.score,
+            self.current_stage,
+            self.stage_timer,
+            self.total_time,
+            self.game_state,
+            self.bullet_cooldown,
+        )).encode())
+
+        if self.hero is not None:
+            digest.update(repr((
+                tuple(self.hero.pos),
+                tuple(self.hero.velocity),
+                self.hero.weapon_mode,
+                self.hero.weapon_timer,
+            )).encode())
+
+        for name, group in self.groups.items():
+            digest.update(name.encode())
+            for sprite in group:
+                digest.update(repr(tuple(sprite.rect)).encode())
+
+        return digest.hexdigest()
+
     # --------------------------------------------------
     # Logic หลักตอน "กำลังเล่นเกม" (ใช้ใน GameScene)
     # --------------------------------------------------
 
     def handle_playing_input_and_weapons(self, dt: float):
         """ส่วนเดิม: Input + ยิงกระสุน + จัดการเลเซอร์"""
-        keys = pygame.key.get_pressed()
 
         if self.game_state == GAME_STATE_PLAYING and self.hero and self.hero.alive():
             move_dir = InputManager.get_move_direction()
@@ -207,7 +392,7 @@ class Game:
                 self.bullet_cooldown = 0
 
             # กด SPACE แล้วค่อยดูว่าจะยิงแบบไหน
-            if keys[pygame.K_SPACE] and self.bullet_cooldown <= 0:
+            if InputManager.is_space_pressed() and self.bullet_cooldown <= 0:
                 weapon_mode = getattr(self.hero, "weapon_mode", "normal")
 
                 # -------------------------------
@@ -219,7 +404,7 @@ class Game:
                     offsets = [-40, -20, 0, 20, 40]  # px จาก center ของยาน
                     for dx in offsets:
                         bullet_pos = (self.hero.rect.centerx + dx, self.hero.rect.top)
-                        bullet = BulletNode(bullet_pos)
+                        bullet = PoolManager.acquire(BulletNode, bullet_pos)
                         self.bullets.add(bullet)
 
                     # ให้คูลดาวน์ 1 นัด / BULLET_COOLDOWN วินาที
@@ -238,7 +423,7 @@ class Game:
                 # -------------------------------
                 elif weapon_mode == "normal":
                     bullet_pos = self.hero.rect.midtop
-                    bullet = BulletNode(bullet_pos)
+                    bullet = PoolManager.acquire(BulletNode, bullet_pos)
                     self.bullets.add(bullet)
 
                     self.bullet_cooldown = BULLET_COOLDOWN
@@ -295,8 +480,10 @@ class Game:
                     self.stage_timer = 0.0
                     self.boss_spawned = False
                     self.bosses.empty()
-                    self.boss_bullets.empty()
+                    PoolManager.release_group(self.boss_bullets)
                     self.spawn_manager.set_stage(self.current_stage)
+                    self.background.set_stage(self.current_stage)
+                    self.pin_stage_assets(self.current_stage)
                 else:
                     # บอด่านสุดท้ายตาย → ชนะเกม
                     self.game_state = GAME_STATE_WIN
@@ -307,14 +494,26 @@ class Game:
                     self.stage_timer = 0.0
                     self.current_stage += 1
                     self.spawn_manager.set_stage(self.current_stage)
+                    self.background.set_stage(self.current_stage)
+                    self.pin_stage_assets(self.current_stage)
 
                     self.boss_spawned = False
                     self.bosses.empty()
-                    self.boss_bullets.empty()
+                    PoolManager.release_group(self.boss_bullets)
                 else:
                     # ด่านสุดท้าย + ไม่มีบอส → ชนะเกมเมื่อเวลาครบ
                     self.game_state = GAME_STATE_WIN
 
+    def pin_stage_assets(self, stage: int):
+        """
+        pin ชุดเฟรมที่ทุกด่านใช้ + ของด่านนี้ (ไม่ให้ ResourceManager ทิ้งตอนเกินงบระหว่างเล่น)
+        pin ชุดใหม่ก่อนแล้วค่อย unpin ชุดของด่านก่อน → ชุดที่ใช้ต่อเนื่องไม่หลุด pin ระหว่างทาง
+        """
+        keys = SCENE_ASSETS["game"] + stage_assets(stage)
+        ResourceManager.pin(keys)
+        ResourceManager.unpin(self.pinned_assets)
+        self.pinned_assets = keys
+
     def update_world_playing(self, dt: float):
         """
         รวม logic หลักตอน PLAYING:
@@ -327,223 +526,220 @@ class Game:
         if not self.hero:
             return
 
+        # อ่าน input ของ tick นี้ (คีย์บอร์ด หรือ replay) + อัดไว้ถ้าเปิด recorder
+        InputManager.begin_tick()
+
         # เวลา + ด่าน + บอส
-        self.update_stage_and_boss(dt)
+        with Profiler.section("update.stage_boss"):
+            self.update_stage_and_boss(dt)
 
         # Input + weapon
-        move_dir = self.handle_playing_input_and_weapons(dt)
+        with Profiler.section("update.input_weapons"):
+            move_dir = self.handle_playing_input_and_weapons(dt)
 
         # Spawn
         if self.game_state == GAME_STATE_PLAYING and self.spawn_manager:
-            self.spawn_manager.update(dt, self.meteors, self.items)
+            with Profiler.section("update.spawn"):
+                self.spawn_manager.update(dt, self.meteors, self.items)
 
-        # Collision
+        # Collision (ทุกคู่ตาม COLLISION_MATRIX ในรอบเดียว)
         if self.game_state == GAME_STATE_PLAYING:
-            # Bullet vs Enemy
-            self.score = CollisionManager.handle_bullet_enemy_collisions(
-                self.bullets,
-                self.enemies,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            # Hero vs Enemy
-            CollisionManager.handle_hero_enemy_collisions(
-                self.heros,
-                self.enemies,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # Hero vs Meteor
-            CollisionManager.handle_hero_meteor_collisions(
-                self.heros,
-                self.meteors,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # Bullet vs Meteor
-            self.score = CollisionManager.handle_bullet_meteor_collisions(
-                self.bullets,
-                self.meteors,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            # Hero เก็บ Item
-            CollisionManager.handle_hero_item_collisions(
-                self.heros,
-                self.items,
-                self.drones,
-                self.shields,
-                self.speeds,
-                self.pickup_sound,
-            )
-
-            # Shield vs Meteor
-            CollisionManager.handle_shield_meteor_collisions(
-                self.shields,
-                self.meteors,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # Shield vs Enemy
-            CollisionManager.handle_shield_enemy_collisions(
-                self.shields,
-                self.enemies,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # -------- Boss (ตัว + กระสุน) --------
-            self.score = CollisionManager.handle_bullet_boss_collisions(
-                self.bullets,
-                self.bosses,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            CollisionManager.handle_hero_boss_collisions(
-                self.heros,
-                self.bosses,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            self.score = CollisionManager.handle_shield_boss_collisions(
-                self.shields,
-                self.bosses,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            # BossBullet vs Hero
-            CollisionManager.handle_hero_bossbullet_collisions(
-                self.heros,
-                self.boss_bullets,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # BossBullet vs Shield
-            CollisionManager.handle_shield_bossbullet_collisions(
-                self.shields,
-                self.boss_bullets,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-            )
-
-            # -------- LaserBeam vs Enemy/Meteor/Boss --------
-            self.score = CollisionManager.handle_laser_enemy_collisions(
-                self.laser_beams,
-                self.enemies,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            self.score = CollisionManager.handle_laser_meteor_collisions(
-                self.laser_beams,
-                self.meteors,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
-
-            self.score = CollisionManager.handle_laser_boss_collisions(
-                self.laser_beams,
-                self.bosses,
-                self.explosions,
-                self.explosion_frames,
-                self.explosion_sound,
-                self.score,
-            )
+            with Profiler.section("update.collision"):
+                gained, self.collision_hits = CollisionManager.resolve(
+                    self.groups,
+                    self.explosion_frames,
+                    self.explosion_sound,
+                    self.pickup_sound,
+                )
+            self.score += gained
 
         # Update Sprites
         if self.game_state == GAME_STATE_PLAYING:
-            self.background.update(dt)
-            self.heros.update(dt, move_dir)
-            self.enemies.update(dt)
-            self.bosses.update(dt)
-            self.drones.update(dt, self.bullets)
-            self.bullets.update(dt)
-            self.boss_bullets.update(dt)
-            self.meteors.update(dt)
-            self.items.update(dt)
-            self.shields.update(dt)
-            self.speeds.update(dt)
-            self.laser_beams.update(dt)
+            with Profiler.section("update.groups"):
+                self.background.update(dt)
+                self.heros.update(dt, move_dir)
+                self.enemies.update(dt)
+                self.bosses.update(dt)
+                self.drones.update(dt, self.bullets)
+                self.bullets.update(dt)
+                self.boss_bullets.update(dt)
+                self.meteors.update(dt)
+                self.items.update(dt)
+                self.shields.update(dt)
+                self.speeds.update(dt)
+                self.laser_beams.update(dt)
 
             if not self.hero.alive():
                 self.game_state = GAME_STATE_GAME_OVER
 
         # ระเบิดทำงานต่อในทุก state
-        self.explosions.update(dt)
+        with Profiler.section("update.groups"):
+            self.explosions.update(dt)
+
+        # เสียงที่ค้างใน tick นี้ (รวมเสียงซ้ำแล้ว) → SoundManager
+        SoundBus.flush()
 
     def draw_world(self, game_state_for_ui: str):
         """วาดทุกอย่าง + UI"""
-        self.screen.fill(GREY)
-        self.background.draw(self.screen)
-        self.meteors.draw(self.screen)
-        self.enemies.draw(self.screen)
-        self.bosses.draw(self.screen)
-        self.items.draw(self.screen)
-        self.heros.draw(self.screen)
-        self.speeds.draw(self.screen)
-        self.shields.draw(self.screen)
-        self.drones.draw(self.screen)
-        self.bullets.draw(self.screen)
-        self.boss_bullets.draw(self.screen)
-        self.laser_beams.draw(self.screen)
-        self.explosions.draw(self.screen)
+        queue = self.render_queue
+        queue.begin()
+
+        # dirty-rect ใช้เฉพาะตอนเล่น (pause / game over / overlay ของ profiler = วาดทั้งจอ)
+        dirty = self.dirty_renderer
+        if game_state_for_ui != GAME_STATE_PLAYING or Profiler.overlay_visible:
+            dirty = None
+
+        with Profiler.section("draw.background"):
+            if dirty is None:
+                self.screen.fill(GREY)
+                self.background.enqueue(queue, self.screen.get_size())
+                queue.flush(self.screen)
+            else:
+                # ชั้น tile อยู่ใน cache ของ renderer, planet วาดเป็น sprite (ขยับแทบทุกเฟรม)
+                dirty.begin(self.screen, self.background.scroll_key(), self._draw_background_tiles, queue)
+
+        with Profiler.section("draw.sprites"), self.interpolator.apply(self.render_alpha):
+            if dirty is not None:
+                self.background.enqueue_planet(queue)
+            for name in SPRITE_DRAW_ORDER:
+                queue.add_group(name, self.groups[name])
+            queue.flush(self.screen, dirty.rects if dirty is not None else None)
 
         hero_for_ui = self.hero if self.hero else None
 
-        self.ui.render(
-            screen=self.screen,
-            hero=hero_for_ui,
-            score=self.score,
-            current_stage=self.current_stage,
-            max_stage=self.max_stage,
-            bosses=self.bosses,
-            game_state=game_state_for_ui,
-            drones=self.drones,
-            shields=self.shields,
-        )
+        with Profiler.section("draw.ui"):
+            ui_rects = self.ui.render(
+                screen=self.screen,
+                hero=hero_for_ui,
+                score=self.score,
+                current_stage=self.current_stage,
+                max_stage=self.max_stage,
+                bosses=self.bosses,
+                game_state=game_state_for_ui,
+            )
+
+        if dirty is not None:
+            dirty.add(ui_rects)
+            dirty.end()
+
+        if Profiler.overlay_visible:
+            self.ui.draw_profiler(self.screen, Profiler.summary(), Profiler.summary_version)
+
+    def _draw_background_tiles(self, surface: pygame.Surface):
+        """พื้นหลังชั้น tile ทั้งจอ (ไม่รวม planet) ลง surface (cache ของ DirtyRenderer)"""
+        queue = self.render_queue
+        surface.fill(GREY)
+        self.background.enqueue_tiles(queue, surface.get_size())
+        queue.flush(surface)
+
+    def present(self):
+        """ส่งเฟรมที่วาดเสร็จขึ้นจอ (flip ทั้งจอ หรือเฉพาะ rect ที่เปลี่ยนในโหมด dirty-rect)"""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.present()
+        else:
+            pygame.display.flip()
 
     # --------------------------------------------------
     # Game Loop หลัก
     # --------------------------------------------------
 
     def run(self):
+        """
+        Fixed timestep:
+        - เวลาจริงของแต่ละเฟรมสะสมใน accumulator
+        - update ทีละ fixed_dt จนกว่า accumulator จะน้อยกว่า 1 step
+          (สูงสุด MAX_CATCHUP_STEPS ต่อเฟรม ที่เหลือทิ้งไป กันเกมค้างเป็นลูกโซ่)
+        - วาดโดย interpolate ระหว่าง state ก่อนหน้ากับ state ล่าสุด
+        """
+        step = self.fixed_dt
+        accumulator = 0.0
+
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            accumulator += self.clock.tick(FPS) / 1000.0
 
             # ปิดหน้าต่าง
             if not InputManager.handle_quit_events():
                 break
 
-            # ให้ SceneManager จัดการ input + update + render
-            self.scene_manager.update(dt)
-            self.scene_manager.render(self.screen)
+            # ภาพที่ prefetch เสร็จแล้ว → convert บน main thread
+            ResourceManager.poll()
 
-            pygame.display.flip()
+            with Profiler.section("frame"):
+                # ให้ SceneManager จัดการ input + update ทีละ step
+                steps = 0
+                with Profiler.section("update"):
+                    while accumulator >= step and steps < MAX_CATCHUP_STEPS:
+                        self.interpolator.snapshot()
+                        self.scene_manager.update(step)
+                        accumulator -= step
+                        steps += 1
+
+                if accumulator >= step:
+                    accumulator %= step
+
+                self.render_alpha = accumulator / step
+                with Profiler.section("draw"):
+                    self.scene_manager.render(self.screen)
+
+                with Profiler.section("flip"):
+                    self.present()
+
+            Profiler.end_frame()
+
+    # --------------------------------------------------
+    # Headless: จำลองเกมเร็วที่สุดเท่าที่ CPU ไหว (ไม่วาด ไม่รอ clock)
+    # --------------------------------------------------
+
+    def run_headless(
+        self,
+        max_frames: int,
+        dt: float = HEADLESS_DT,
+        restart: bool = True,
+    ) -> dict:
+        """
+        เดิน update_world_playing ด้วย dt คงที่ จนครบ max_frames
+        - ข้าม draw_world / display.flip ทั้งหมด
+        - restart=True → จบเกม (แพ้/ชนะ) แล้วเริ่มเกมใหม่ต่อทันที
+        คืนค่า dict สถิติ รวม frames_per_second (เฟรมจำลองต่อวินาทีจริง)
+        """
+        runs = 0
+        stages_cleared = 0
+        wins = 0
+        frames = 0
+
+        self.start_new_game()
+        start = time.perf_counter()
+
+        while frames < max_frames and self.running:
+            ResourceManager.poll()
+            SoundManager.pump()
+            with Profiler.section("update"):
+                self.update_world_playing(dt)
+            Profiler.end_frame()
+            frames += 1
+
+            if self.game_state != GAME_STATE_PLAYING:
+                runs += 1
+                stages_cleared += self.current_stage - 1
+                if self.game_state == GAME_STATE_WIN:
+                    wins += 1
+                    stages_cleared += 1
+
+                if not restart:
+                    break
+                self.start_new_game()
+
+        wall_time = time.perf_counter() - start
+
+        return {
+            "frames": frames,
+            "sim_seconds": frames * dt,
+            "wall_seconds": wall_time,
+            "frames_per_second": frames / wall_time if wall_time > 0 else 0.0,
+            "runs": runs,
+            "wins": wins,
+            "stages_cleared": stages_cleared,
+            "stage": self.current_stage,
+            "score": self.score,
+            "digest": self.state_digest(),
+        }
@@ -1,14 +1,153 @@
 # main.py
 
+import argparse
+import os
+import random
+
 import pygame
 from game import Game  # ไฟล์ใหม่ที่เราจะสร้างด้านล่าง
+from settings.config import HEADLESS_DT, PROFILER_CSV, ASSET_CACHE_DIR
+from managers.replay_manager import InputReplay
+from managers.profiler import Profiler
+from managers.resource_manager import ResourceManager
+from managers.sound_manager import SoundManager
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Spaceship")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="จำลองเกมโดยไม่เปิดหน้าต่าง/เสียง (SDL dummy driver) เร็วเท่าที่ CPU ไหว",
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=60 * 60,
+        help="จำนวนเฟรมจำลองในโหมด headless",
+    )
+    parser.add_argument(
+        "--dt",
+        type=float,
+        default=HEADLESS_DT,
+        help="dt คงที่ต่อเฟรมในโหมด headless (วินาที)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed ของ RNG (seed เดิม + input เดิม = เกมเดิมทุกบิต)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="อัด input ทุก tick ลงไฟล์ replay ตอนออกเกม",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="เล่นไฟล์ replay (seed / dt อ่านจากไฟล์)",
+    )
+    parser.add_argument(
+        "--bake-assets",
+        action="store_true",
+        help="decode + scale ภาพต้นฉบับทั้งหมดใหม่ แล้วเขียนลง cache (ASSET_CACHE_DIR) จากนั้นออก",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="เปิด profiler ตั้งแต่เริ่ม (F3 = overlay), ใช้คู่กับ --profile-csv เพื่อเขียนสรุปตอนออกเกม",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        default=None,
+        help="ระหว่างเล่น update จอเฉพาะส่วนที่เปลี่ยน (พื้นหลังเลื่อนเมื่อไหร่ก็ flip ทั้งจอ)",
+    )
+    parser.add_argument(
+        "--profile-csv",
+        metavar="PATH",
+        default=PROFILER_CSV,
+        help="เขียน CSV สรุปเวลาแต่ละส่วน (p50 / p95 / p99) ลงไฟล์นี้ตอนออกเกม (ไม่ใส่ = ไม่เขียน)",
+    )
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+
+    if args.headless or args.bake_assets:
+        # ต้องตั้งก่อน pygame.init()
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
     pygame.init()
     pygame.mixer.init()
 
-    game = Game()
-    game.run()          # วน loop ผ่าน SceneManager
+    if args.bake_assets:
+        # convert_alpha() ต้องมี display mode ก่อน
+        pygame.display.set_mode((1, 1))
+        ResourceManager.init(rebuild_cache=True, lazy=False)
+        report = ResourceManager.load_report
+        print(f"baked {report['decoded_files']} images in {report['seconds']:.2f}s")
+
+        manifest_path = os.path.join(ASSET_CACHE_DIR, "asset_manifest.json")
+        ResourceManager.write_asset_manifest(manifest_path)
+        print(f"asset manifest written to {manifest_path}")
+        pygame.quit()
+        return
+
+    replay = InputReplay.load(args.replay) if args.replay else None
+
+    seed = args.seed
+    if replay is not None:
+        seed = replay.seed
+    elif args.record and seed is None:
+        # อัด replay ต้องรู้ seed เสมอ
+        seed = random.randrange(2 ** 32)
+
+    if args.profile:
+        Profiler.enable()
+
+    game = Game(headless=args.headless, seed=seed, dirty_rects=args.dirty_rects)
+    if replay is not None:
+        game.enable_replay(replay)
+    if args.record:
+        game.enable_recording()
+
+    if args.headless:
+        if replay is not None:
+            # เล่นครบทุก tick ในไฟล์ แล้วหยุด (ไม่เริ่มเกมใหม่)
+            stats = game.run_headless(max_frames=len(replay), dt=replay.dt, restart=False)
+        else:
+            stats = game.run_headless(max_frames=args.frames, dt=args.dt)
+        print(
+            f"simulated {stats['frames']} frames ({stats['sim_seconds']:.1f}s game time) "
+            f"in {stats['wall_seconds']:.2f}s wall → {stats['frames_per_second']:.0f} frames/s"
+        )
+        print(
+            f"runs={stats['runs']} wins={stats['wins']} "
+            f"stages_cleared={stats['stages_cleared']} stage={stats['stage']} score={stats['score']}"
+        )
+        print(f"seed={seed} digest={stats['digest']}")
+    else:
+        if replay is not None:
+            game.start_new_game()   # ข้ามเมนู เริ่มเล่น replay ทันที
+        game.run()          # วน loop ผ่าน SceneManager
+
+    if args.record:
+        game.recorder.save(args.record)
+        print(
+            f"recorded {len(game.recorder.ticks)} ticks to {args.record} "
+            f"(seed={seed} digest={game.state_digest()})"
+        )
+
+    ResourceManager.shutdown()
+    game.background.planet_scales.shutdown()
+    SoundManager.shutdown()
+
+    if args.profile_csv and Profiler.dump_csv(args.profile_csv):
+        print(f"profile written to {args.profile_csv}")
 
     pygame.quit()
 
@@ -0,0 +1,95 @@
+# managers/asset_cache.py
+
+import hashlib
+import os
+import struct
+import zlib
+
+import pygame
+
+
+# ไฟล์ cache 1 ไฟล์ต่อ 1 ชุดเฟรม (binary, little-endian):
+#   header : magic "SSAC" | version (uint16) | fingerprint (sha1 20 bytes) | frame_count (uint16)
+#   frame  : width (uint16) | height (uint16) | data_len (uint32) | zlib(RGBA)
+CACHE_MAGIC = b"SSAC"
+CACHE_VERSION = 1
+_HEADER = struct.Struct("<4sH20sH")
+_FRAME = struct.Struct("<HHI")
+
+
+class AssetCache:
+    """
+    cache ของเฟรมที่ scale แล้ว (bake ครั้งแรก, ครั้งต่อไปโหลดจาก cache ได้เลย)
+
+    fingerprint = sha1(path + mtime + ขนาดไฟล์ต้นฉบับทุกไฟล์ + scale)
+    → แก้ไฟล์ภาพ หรือเปลี่ยนค่า *_SCALE เมื่อไหร่ cache ของชุดนั้นจะ "เก่า" แล้วถูก bake ใหม่อัตโนมัติ
+
+    ใช้จาก worker thread ได้ (ไม่แตะ display): read() คืน Surface ที่ยังไม่ convert
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def fingerprint(paths: list[str], scale: float) -> bytes:
+        digest = hashlib.sha1()
+        digest.update(struct.pack("<Hd", CACHE_VERSION, scale))
+        for path in paths:
+            st = os.stat(path)
+            digest.update(os.path.basename(path).encode())
+            digest.update(struct.pack("<qq", st.st_mtime_ns, st.st_size))
+        return digest.digest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def read(self, key: str, fingerprint: bytes) -> list[pygame.Surface] | None:
+        """คืนเฟรมจาก cache (ยังไม่ convert) หรือ None ถ้าไม่มี / เก่า / ไฟล์เสีย"""
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            magic, version, stored_fp, count = _HEADER.unpack_from(data)
+            if magic != CACHE_MAGIC or version != CACHE_VERSION or stored_fp != fingerprint:
+                return None
+
+            frames = []
+            offset = _HEADER.size
+            for _ in range(count):
+                w, h, size = _FRAME.unpack_from(data, offset)
+                offset += _FRAME.size
+                pixels = zlib.decompress(data[offset:offset + size])
+                offset += size
+                frames.append(pygame.image.frombytes(pixels, (w, h), "RGBA"))
+        except (struct.error, zlib.error, ValueError):
+            return None
+
+        return frames
+
+    def store(self, key: str, fingerprint: bytes, frames: list[pygame.Surface]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        parts = [_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, fingerprint, len(frames))]
+        for frame in frames:
+            w, h = frame.get_size()
+            pixels = zlib.compress(pygame.image.tobytes(frame, "RGBA"), 1)
+            parts.append(_FRAME.pack(w, h, len(pixels)))
+            parts.append(pixels)
+
+        # เขียนไฟล์ชั่วคราวก่อนแล้วค่อย replace (ปิดเกมกลางทางจะไม่ได้ cache ครึ่ง ๆ)
+        path = self._path(key)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(b"".join(parts))
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """ลบ cache ทั้งหมด (ใช้วัด cold startup)"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".bin") or name.endswith(".tmp"):
+                os.remove(os.path.join(self.cache_dir, name))
@@ -1,9 +1,12 @@
 # managers/background_manager.py
 
 import random
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import pygame
 from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT
 from managers.resource_manager import ResourceManager
+from managers.render_queue import RenderQueue
 
 
 # ============================================================
@@ -33,6 +36,7 @@ PLANET_CONFIG = {
     "min_speed": 40.0,           
     "max_speed": 60.0,           
     "scale_range": (3.0, 5.0),   
+    "scale_buckets": 8,          # scale สุ่มได้แค่ 8 ขั้นใน scale_range (scale ล่วงหน้าบน thread เบื้องหลัง)
 }
 
 
@@ -44,6 +48,10 @@ class TiledLayer:
     """
     พื้นหลังที่ใช้ภาพ 1 รูป แล้วปูกระเบื้องทั้งจอ
     เลื่อนลงตามแกน Y ด้วยความเร็วที่กำหนด
+
+    ปูกระเบื้องครั้งเดียวลง "strip" กว้างเท่าจอ สูงเท่าจำนวนแถวที่พอคลุมจอ (ภาพต่อกันเป็นวง)
+    → แต่ละเฟรมวาดแค่ช่วงของ strip ตาม offset: 1 blit (หรือ 2 ตอนช่วงนั้นวนกลับหัว strip)
+    ภาพกว้างเท่าจอและสูงพอแล้ว = ใช้ภาพเดิมเป็น strip เลย (ไม่เปลือง memory เพิ่ม)
     """
 
     def __init__(self, image: pygame.Surface, speed: float):
@@ -51,37 +59,155 @@ class TiledLayer:
         self.speed = speed          # px/s
         self.offset_y = 0.0
 
+        self._strip: pygame.Surface | None = None
+        self._strip_size: tuple[int, int] | None = None
+
     def update(self, dt: float):
         self.offset_y += self.speed * dt
         h = self.image.get_height()
         if h > 0:
             self.offset_y %= h
 
-    def draw(self, surface: pygame.Surface):
+    def invalidate(self):
+        """ทิ้ง strip (ปูใหม่ตอนวาดครั้งถัดไป)"""
+        self._strip = None
+        self._strip_size = None
+
+    def strip(self, surf_w: int, surf_h: int) -> pygame.Surface:
+        if self._strip is None or self._strip_size != (surf_w, surf_h):
+            self._strip = self._build_strip(surf_w, surf_h)
+            self._strip_size = (surf_w, surf_h)
+        return self._strip
+
+    def _build_strip(self, surf_w: int, surf_h: int) -> pygame.Surface:
+        image = self.image
+        img_w, img_h = image.get_size()
+        rows = -(-surf_h // img_h)
+
+        if img_w == surf_w and rows == 1:
+            return image
+
+        positions = [
+            (x, y)
+            for y in range(0, rows * img_h, img_h)
+            for x in range(0, surf_w, img_w)
+        ]
+
+        if image.get_flags() & pygame.SRCALPHA:
+            strip = pygame.Surface((surf_w, rows * img_h), pygame.SRCALPHA).convert_alpha()
+            strip.fill((0, 0, 0, 0))
+            # copy ลงพื้นใส (BLEND_RGBA_MAX) → pixel / alpha ตรงกับภาพเดิมทุกจุด
+            strip.blits([(image, pos, None, pygame.BLEND_RGBA_MAX) for pos in positions], doreturn=False)
+            return strip
+
+        # ภาพทึบ / colorkey (ดู ResourceManager.detect_format) → strip แบบเดียวกัน
+        strip = pygame.Surface((surf_w, rows * img_h)).convert()
+        colorkey = image.get_colorkey()
+        if colorkey is not None:
+            strip.fill(colorkey)
+            strip.set_colorkey(colorkey, pygame.RLEACCEL)
+        strip.blits([(image, pos) for pos in positions], doreturn=False)
+        return strip
+
+    def tiles(self, surf_w: int, surf_h: int) -> list[tuple]:
+        """(strip, ตำแหน่ง, ช่วงของ strip) ที่คลุมพื้นที่ surf_w x surf_h (ส่งเข้า blits ได้เลย)"""
         img_w, img_h = self.image.get_size()
         if img_w <= 0 or img_h <= 0:
-            return
+            return []
 
-        surf_w, surf_h = surface.get_size()
+        strip = self.strip(surf_w, surf_h)
+        strip_h = strip.get_height()
+        top = int(self.offset_y) % strip_h
 
-        start_y = -self.offset_y
-        y = start_y
-        while y < surf_h:
-            x = 0
-            while x < surf_w:
-                surface.blit(self.image, (x, y))
-                x += img_w
-            y += img_h
+        # ช่วง top → ท้าย strip แล้ววนกลับหัว strip ถ้ายังไม่เต็มจอ
+        first_h = min(surf_h, strip_h - top)
+        tiles = [(strip, (0, 0), pygame.Rect(0, top, surf_w, first_h))]
+        if first_h < surf_h:
+            tiles.append((strip, (0, first_h), pygame.Rect(0, 0, surf_w, surf_h - first_h)))
+        return tiles
+
+    def draw(self, surface: pygame.Surface):
+        surface.blits(self.tiles(*surface.get_size()), doreturn=False)
 
 
 # ============================================================
 # สไปรต์พาราแล็กซ์เดี่ยว ๆ (ใช้สำหรับ planet)
 # ============================================================
 
+def scale_surface(image: pygame.Surface, scale: float) -> pygame.Surface:
+    w = max(1, int(image.get_width() * scale))
+    h = max(1, int(image.get_height() * scale))
+    return pygame.transform.smoothscale(image, (w, h))
+
+
+class PlanetScaleCache:
+    """
+    ภาพ planet ที่ scale ไว้ล่วงหน้า: scale ถูกปัดเป็น buckets ขั้นเท่า ๆ กันใน scale_range
+    (ภาพ i, ขั้น b) → smoothscale บน thread เบื้องหลังก่อนถึงเวลาใช้ แทนการ scale ตอน spawn
+
+        cache.prefetch(i, b)       # เริ่ม scale ล่วงหน้า (ไม่รอ)
+        image = cache.take(i, b)   # ตอน spawn: เสร็จแล้วได้เลย / ยังไม่เสร็จก็รอ / ไม่เคยสั่งก็ scale ตอนนี้
+
+    ไม่เก็บทุกขั้นของทุกภาพไว้ (ภาพ planet ขยาย 3-5 เท่า: ทุกขั้นรวมกันหลายสิบ MB)
+    → scale เฉพาะขั้นที่ planet ดวงถัดไปจะใช้ และคืนภาพให้ sprite ไปเลยตอน take
+    """
+
+    def __init__(self, images: list[pygame.Surface], scale_range, buckets: int):
+        self.images = images
+        lo, hi = scale_range
+        buckets = max(1, buckets)
+        if buckets == 1:
+            self.scales = [(lo + hi) / 2.0]
+        else:
+            self.scales = [lo + (hi - lo) * i / (buckets - 1) for i in range(buckets)]
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[tuple[int, int], Future] = {}
+
+        self.ready_hits = 0     # take ตอนที่ scale เสร็จแล้ว
+        self.waits = 0          # take ตอนที่ยัง scale ไม่เสร็จ (ต้องรอ)
+        self.misses = 0         # take โดยไม่เคย prefetch (scale บน main thread)
+
+    def _scale(self, index: int, bucket: int) -> pygame.Surface:
+        return scale_surface(self.images[index], self.scales[bucket])
+
+    def prefetch(self, index: int, bucket: int):
+        key = (index, bucket)
+        if key in self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="planet-scale")
+        self._pending[key] = self._executor.submit(self._scale, index, bucket)
+
+    def ready(self, index: int, bucket: int) -> bool:
+        """prefetch แล้ว + scale เสร็จแล้ว (take ตอนนี้ไม่ต้องรอ)"""
+        future = self._pending.get((index, bucket))
+        return future is not None and future.done()
+
+    def take(self, index: int, bucket: int) -> pygame.Surface:
+        future = self._pending.pop((index, bucket), None)
+        if future is None:
+            self.misses += 1
+            return self._scale(index, bucket)
+
+        if future.done():
+            self.ready_hits += 1
+        else:
+            self.waits += 1
+        return future.result()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+
 class ParallaxSprite(pygame.sprite.Sprite):
     """
     สำหรับวัตถุที่ลอยลง (ดาว / ดาวเคราะห์ ใกล้สายตา)
     - มีความเร็วของตัวเอง
+    - scaled_image = ภาพที่ scale มาแล้ว (เช่นจาก PlanetScaleCache) → ไม่สุ่ม / ไม่ scale เอง
+    - ตำแหน่งแนวตั้งเก็บใน self.y (float) แล้วค่อยปัดลง rect
     """
 
     def __init__(
@@ -91,21 +217,26 @@ class ParallaxSprite(pygame.sprite.Sprite):
         max_speed: float,
         scale_range=(0.5, 1.0),
         start_random_inside: bool = False,
+        rng=None,
+        scaled_image: pygame.Surface | None = None,
     ):
         super().__init__()
 
+        # random.Random ที่ใช้สุ่ม (None = ใช้ module random)
+        self.rng = rng if rng is not None else random
+
         self.screen_w = SCREEN_WIDTH
         self.screen_h = SCREEN_HEIGHT
 
-        # random scale รอบสุดท้าย
-        scale = random.uniform(*scale_range)
-        w = max(1, int(image.get_width() * scale))
-        h = max(1, int(image.get_height() * scale))
         self.original_image = image
-        self.image = pygame.transform.smoothscale(image, (w, h))
+        if scaled_image is None:
+            # random scale รอบสุดท้าย
+            scale = self.rng.uniform(*scale_range)
+            scaled_image = scale_surface(image, scale)
+        self.image = scaled_image
         self.rect = self.image.get_rect()
 
-        self.speed = random.uniform(min_speed, max_speed)
+        self.speed = self.rng.uniform(min_speed, max_speed)
 
         self.reset(start_random_inside=start_random_inside)
 
@@ -131,7 +262,7 @@ class ParallaxSprite(pygame.sprite.Sprite):
         MAX_HIDDEN = PLANET_WIDTH - MIN_VISIBLE # 60% คือส่วนที่ซ่อนได้มากที่สุด
 
         # 3. เลือกบริเวณ: 0 = ขอบซ้าย, 1 = ขอบขวา
-        side = random.choice([0, 1])
+        side = self.rng.choice([0, 1])
 
         if side == 0:
             # เกิดบริเวณขอบซ้าย (Center X ต้องอยู่ระหว่าง):
@@ -152,7 +283,7 @@ class ParallaxSprite(pygame.sprite.Sprite):
                 # กรณีภาพใหญ่มาก ให้เกิดที่ตำแหน่งเห็น 40% พอดี
                 self.rect.centerx = MIN_X
             else:
-                self.rect.centerx = random.randint(MIN_X, MAX_X)
+                self.rect.centerx = self.rng.randint(MIN_X, MAX_X)
                  
         else:
             # เกิดบริเวณขอบขวา (Center X ต้องอยู่ระหว่าง):
@@ -174,20 +305,23 @@ class ParallaxSprite(pygame.sprite.Sprite):
                 # กรณีภาพใหญ่มาก ให้เกิดที่ตำแหน่งเห็น 40% พอดี
                 self.rect.centerx = MIN_X 
             else:
-                 self.rect.centerx = random.randint(MIN_X, MAX_X)
+                 self.rect.centerx = self.rng.randint(MIN_X, MAX_X)
         
         # ----------------------------------------------------
         
         if start_random_inside:
-            self.rect.y = random.randint(-self.screen_h, self.screen_h)
+            self.rect.y = self.rng.randint(-self.screen_h, self.screen_h)
         else:
             # กำหนดตำแหน่งเริ่มต้นเหนือจอ
-            y_offset = random.randint(20, 150) 
+            y_offset = self.rng.randint(20, 150) 
             self.rect.bottom = -y_offset
 
+        # ตำแหน่งจริงแบบ float (rect เป็น int: ขยับทีละไม่ถึง 1 px ต่อ step จะถูกปัดทิ้งทุกครั้ง)
+        self.y = float(self.rect.y)
+
     def update(self, dt: float):
-        self.rect.y += self.speed * dt
-        # ลบ self.reset() ออก (โค้ดถูกต้องแล้ว)
+        self.y += self.speed * dt
+        self.rect.y = round(self.y)
 
 
 # ============================================================
@@ -196,9 +330,13 @@ class ParallaxSprite(pygame.sprite.Sprite):
 
 class BackgroundManager:
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        # random.Random สำหรับดาวเคราะห์ (None = ใช้ module random)
+        self.rng = rng if rng is not None else random
+
         # ---------- สร้าง layer แบบ tile ----------
         self.layers: dict[str, TiledLayer] = {}
+        self.stage = 1
 
         for cfg in BACKGROUND_LAYERS:
             img = ResourceManager.get_image(cfg["image_key"])
@@ -235,6 +373,14 @@ class BackgroundManager:
         # ตัวแปรสำหรับวนซ้ำภาพ
         self.planet_index = 0
 
+        # scale ของ planet ดวงถัดไปถูกสุ่ม + scale ไว้ล่วงหน้าตั้งแต่ตอน spawn ดวงก่อน
+        self.planet_scales = PlanetScaleCache(
+            self.planet_base_images,
+            self.planet_scale_range,
+            PLANET_CONFIG.get("scale_buckets", 8),
+        )
+        self._next_planet_bucket = self.rng.randrange(len(self.planet_scales.scales))
+
         self._spawn_close_planet()
 
 
@@ -258,18 +404,44 @@ class BackgroundManager:
         self._update_close_planet(dt)
 
     def draw(self, screen: pygame.Surface):
-        
+        queue = RenderQueue()
+        self.enqueue(queue, screen.get_size())
+        queue.flush(screen)
+
+    def enqueue(self, queue: RenderQueue, size: tuple[int, int]):
+        """ใส่ทุกชั้นของพื้นหลังเข้า render queue ตามลำดับการวาด (1 layer = 1 blits)"""
         # 1. วาดชั้นพื้นหลังที่เป็น Tiled Layer (ชั้นไกล) ก่อน
-        #    *** โค้ดที่แก้ไขแล้ว: ย้ายการวาด planet ลงไปด้านล่าง ***
+        self.enqueue_tiles(queue, size)
+
+        # 2. วาด Parallax Sprite (Planet ใกล้ตา) ทีหลัง
+        self.enqueue_planet(queue)
+
+    def enqueue_tiles(self, queue: RenderQueue, size: tuple[int, int]):
+        w, h = size
         for cfg in BACKGROUND_LAYERS:
             name = cfg["name"]
             layer = self.layers.get(name)
             if layer is not None:
-                layer.draw(screen)
-        
-        # 2. วาด Parallax Sprite (Planet ใกล้ตา) ทีหลัง
+                queue.add(f"bg.{name}", layer.tiles(w, h))
+
+    def enqueue_planet(self, queue: RenderQueue):
         if self.close_planet is not None:
-            screen.blit(self.close_planet.image, self.close_planet.rect)
+            queue.add("bg.planet", [(self.close_planet.image, self.close_planet.rect)])
+
+    def set_stage(self, stage: int):
+        """เปลี่ยนด่าน → ปู strip ของทุกชั้นใหม่"""
+        if stage == self.stage:
+            return
+        self.stage = stage
+        for layer in self.layers.values():
+            layer.invalidate()
+
+    def scroll_key(self) -> tuple:
+        """
+        ตำแหน่ง (pixel) ของชั้น tile ทุกชั้น + ด่าน → ค่าเท่าเดิม = ภาพชั้น tile เหมือนเฟรมก่อนทุก pixel
+        ใช้กับ DirtyRenderer: เปลี่ยนเมื่อไหร่ = ต้องวาดพื้นหลังใหม่ทั้งจอ
+        """
+        return (self.stage,) + tuple(int(layer.offset_y) for layer in self.layers.values())
 
 
     # ------------------------------------------------
@@ -294,7 +466,8 @@ class BackgroundManager:
             return
         
         # เลือกภาพตามดัชนีที่กำหนด
-        img = self.planet_base_images[self.planet_index]
+        index = self.planet_index
+        img = self.planet_base_images[index]
         
         # เลื่อนดัชนีไปภาพถัดไป และวนกลับไป 0 เมื่อถึงปลายลิสต์
         self.planet_index = (self.planet_index + 1) % len(self.planet_base_images)
@@ -305,6 +478,12 @@ class BackgroundManager:
             max_speed=self.planet_max_speed,
             scale_range=self.planet_scale_range,
             start_random_inside=False, 
+            rng=self.rng,
+            scaled_image=self.planet_scales.take(index, self._next_planet_bucket),
         )
+
+        # ดวงถัดไป: สุ่มขั้น scale ตอนนี้เลย แล้ว scale บน thread เบื้องหลังระหว่างที่ดวงนี้ลอยอยู่
+        self._next_planet_bucket = self.rng.randrange(len(self.planet_scales.scales))
+        self.planet_scales.prefetch(self.planet_index, self._next_planet_bucket)
         
         self.close_planet = planet
\ No newline at end of file
@@ -4,463 +4,176 @@ import pygame
 from nodes.explosion_node import ExplosionNode
 from nodes.drone_node import DroneNode
 from nodes.shield_node import ShieldNode
-from nodes.speed_flame_node import SpeedFlameNode
+from managers.spatial_hash import SpatialHash
+from managers.pool_manager import PoolManager
+from managers.sound_bus import SoundBus
+from settings.collision_config import COLLISION_MATRIX
 
 
-class CollisionManager:
-
-    # -------------------------------------------------
-    # 1) Bullet vs Enemy
-    # -------------------------------------------------
-    @staticmethod
-    def handle_bullet_enemy_collisions(
-        bullets, enemies,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            bullets, enemies,
-            True, True,
-            pygame.sprite.collide_mask
-        )
-
-        for bullet, enemy_list in hits.items():
-            for enemy in enemy_list:
-                if explosion_frames:
-                    expl = ExplosionNode(enemy.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 10  # ปรับคะแนนตามที่ต้องการได้
-
-        return score
-
-    # -------------------------------------------------
-    # 2) Hero vs Enemy
-    # -------------------------------------------------
-    @staticmethod
-    def handle_hero_enemy_collisions(
-        heros, enemies,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            heros, enemies,
-            True, True,
-            pygame.sprite.collide_mask
-        )
-
-        for hero, enemy_list in hits.items():
-            for enemy in enemy_list:
-                cx = (hero.rect.centerx + enemy.rect.centerx) // 2
-                cy = (hero.rect.centery + enemy.rect.centery) // 2
-
-                if explosion_frames:
-                    expl = ExplosionNode((cx, cy), explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 3) Hero vs Meteor
-    # -------------------------------------------------
-    @staticmethod
-    def handle_hero_meteor_collisions(
-        heros, meteors,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            heros, meteors,
-            True, True,
-            pygame.sprite.collide_mask
-        )
-
-        for hero, meteor_list in hits.items():
-            for meteor in meteor_list:
-                cx = (hero.rect.centerx + meteor.rect.centerx) // 2
-                cy = (hero.rect.centery + meteor.rect.centery) // 2
-
-                if explosion_frames:
-                    expl = ExplosionNode((cx, cy), explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 4) Bullet vs Meteor
-    # -------------------------------------------------
-    @staticmethod
-    def handle_bullet_meteor_collisions(
-        bullets, meteors,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            bullets, meteors,
-            True, True,
-            pygame.sprite.collide_mask
-        )
-
-        for bullet, meteor_list in hits.items():
-            for meteor in meteor_list:
-                if explosion_frames:
-                    expl = ExplosionNode(meteor.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 5
-
-        return score
-
-    # -------------------------------------------------
-    # 5) Hero vs Item (Drone / Shield / Speed / Laser / Buckshot)
-    # -------------------------------------------------
-    @staticmethod
-    def handle_hero_item_collisions(
-        heros, items,
-        drones, shields, speeds,
-        pickup_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            heros, items,
-            False, True,
-            pygame.sprite.collide_mask
-        )
-
-        for hero, item_list in hits.items():
-            for item in item_list:
-                item_type = getattr(item, "type", None)
-
-                # เล่นเสียงเก็บ item
-                if pickup_sound is not None:
-                    try:
-                        pickup_sound.play()
-                    except Exception:
-                        pass
-
-                # single / double / shield เดิม
-                if item_type == "single":
-                    drone_right = DroneNode(hero, side="right")
-                    drones.add(drone_right)
-
-                elif item_type == "double":
-                    drone_left = DroneNode(hero, side="left")
-                    drone_right = DroneNode(hero, side="right")
-                    drones.add(drone_left, drone_right)
-
-                elif item_type == "shield":
-                    shield = ShieldNode(hero, max_hp=3)
-                    shields.add(shield)
-
-                # ของใหม่: speed / laser
-                elif item_type == "speed":
-                    if hasattr(hero, "start_speed_boost"):
-                        hero.start_speed_boost(duration=5.0, multiplier=1.5)
-                        speed_flame = SpeedFlameNode(hero)
-                        speeds.add(speed_flame)
-
-
-                elif item_type == "laser":
-                    if hasattr(hero, "activate_laser"):
-                        hero.activate_laser(duration=5.0)
-                
-                # buckshot
-                elif item_type == "buckshot":
-                    if hasattr(hero, "activate_buckshot"):
-                        hero.activate_buckshot(duration=5.0)
-
-    # -------------------------------------------------
-    # 6) Shield vs Meteor
-    # -------------------------------------------------
-    @staticmethod
-    def handle_shield_meteor_collisions(
-        shields, meteors,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            shields, meteors,
-            False, True,
-            pygame.sprite.collide_circle
-        )
-
-        for shield, meteor_list in hits.items():
-            for meteor in meteor_list:
-                shield.take_hit(1)
-
-                if explosion_frames:
-                    expl = ExplosionNode(meteor.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 7) Shield vs Enemy
-    # -------------------------------------------------
-    @staticmethod
-    def handle_shield_enemy_collisions(
-        shields, enemies,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            shields, enemies,
-            False, True,
-            pygame.sprite.collide_circle
-        )
+# ชื่อวิธีเช็คใน COLLISION_MATRIX → ฟังก์ชันของ pygame
+COLLIDE_FUNCS = {
+    "mask": pygame.sprite.collide_mask,
+    "circle": pygame.sprite.collide_circle,
+    "rect": pygame.sprite.collide_rect,
+}
 
-        for shield, enemy_list in hits.items():
-            for enemy in enemy_list:
-                shield.take_hit(1)
 
-                if explosion_frames:
-                    expl = ExplosionNode(enemy.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 8) Bullet vs Boss
-    # -------------------------------------------------
-    @staticmethod
-    def handle_bullet_boss_collisions(
-        bullets, bosses,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            bullets, bosses,
-            True, False,
-            pygame.sprite.collide_mask
-        )
-
-        for bullet, boss_list in hits.items():
-            for boss in boss_list:
-                died = boss.take_damage(1)
-
-                if explosion_frames:
-                    expl = ExplosionNode(bullet.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 15
-                if died:
-                    # บอสตายแล้ว อาจให้โบนัสเพิ่มพิเศษได้
-                    score += 50
-
-        return score
-
-    # -------------------------------------------------
-    # 9) Hero vs Boss
-    # -------------------------------------------------
-    @staticmethod
-    def handle_hero_boss_collisions(
-        heros, bosses,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            heros, bosses,
-            True, False,
-            pygame.sprite.collide_mask
-        )
-
-        for hero, boss_list in hits.items():
-            for boss in boss_list:
-                # Hero หาย, Boss ยังอยู่ (อาจลด HP ถ้าต้องการ)
-                if explosion_frames:
-                    expl = ExplosionNode(hero.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 10) Shield vs Boss
-    # -------------------------------------------------
-    @staticmethod
-    def handle_shield_boss_collisions(
-        shields, bosses,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            shields, bosses,
-            False, False,
-            pygame.sprite.collide_circle
-        )
-
-        for shield, boss_list in hits.items():
-            for boss in boss_list:
-                shield.take_hit(1)
-                died = boss.take_damage(1)
-
-                if explosion_frames:
-                    expl = ExplosionNode(boss.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 10
-                if died:
-                    score += 50
-
-        return score
-
-    # -------------------------------------------------
-    # 11) Hero vs Boss Bullets
-    # -------------------------------------------------
-    @staticmethod
-    def handle_hero_bossbullet_collisions(
-        heros, boss_bullets,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            heros, boss_bullets,
-            True, True,
-            pygame.sprite.collide_mask
-        )
-
-        for hero, bullet_list in hits.items():
-            for bullet in bullet_list:
-                if explosion_frames:
-                    expl = ExplosionNode(hero.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-    # -------------------------------------------------
-    # 12) Shield vs Boss Bullets
+class CollisionManager:
+    """
+    เช็คการชนทั้งหมดของเฟรมตาม COLLISION_MATRIX
+    - สร้าง spatial hash ครั้งเดียวต่อเฟรม จากทุก group ที่เป็นฝั่งเป้า
+    - ไล่ทีละกฎตามลำดับ แล้วคืนคะแนน + รายการการชนทั้งหมดในครั้งเดียว
+    """
+
+    # broadphase ที่สร้างใหม่ทุกเฟรมใน resolve()
+    _broadphase = SpatialHash()
+
+    @classmethod
+    def resolve(
+        cls,
+        groups: dict,
+        explosion_frames,
+        explosion_sound,
+        pickup_sound,
+        matrix=COLLISION_MATRIX,
+    ) -> tuple[int, list]:
+        """
+        groups : dict ชื่อ group → pygame.sprite.Group (ดู Game.groups)
+        return : (คะแนนที่ได้ในเฟรมนี้, [(ชื่อกฎ, sprite_a, sprite_b), ...])
+        """
+        ctx = {
+            "groups": groups,
+            "explosion_frames": explosion_frames,
+            "explosion_sound": explosion_sound,
+            "pickup_sound": pickup_sound,
+        }
+
+        # broadphase รอบเดียว: index ทุก group ที่เป็นฝั่งเป้า
+        targets = []
+        for rule in matrix:
+            group = groups[rule["b"]]
+            if group not in targets:
+                targets.append(group)
+        cls._broadphase.build(targets)
+
+        score = 0
+        hits = []
+        for rule in matrix:
+            group_a = groups[rule["a"]]
+            group_b = groups[rule["b"]]
+            if not group_a or not group_b:
+                continue
+
+            result = cls._broadphase.groupcollide(
+                group_a, group_b,
+                rule["kill_a"], rule["kill_b"],
+                COLLIDE_FUNCS[rule["collide"]],
+            )
+            if not result:
+                continue
+
+            effects = [getattr(cls, "_effect_" + name) for name in rule["effects"]]
+            for sprite_a, hit_list in result.items():
+                for sprite_b in hit_list:
+                    score += rule["score"]
+                    for effect in effects:
+                        score += effect(ctx, rule, sprite_a, sprite_b)
+                    hits.append((rule["name"], sprite_a, sprite_b))
+
+        return score, hits
+
+    @classmethod
+    def get_pair_tests(cls) -> int:
+        """จำนวนคู่ที่ถูกเช็คละเอียดในเฟรมล่าสุด (ใช้ดูผลของ broadphase)"""
+        return cls._broadphase.pair_tests
+
+    # -------------------------------------------------
+    # Effects (คืนค่าคะแนนพิเศษ ถ้ามี)
     # -------------------------------------------------
     @staticmethod
-    def handle_shield_bossbullet_collisions(
-        shields, boss_bullets,
-        explosions,
-        explosion_frames, explosion_sound
-    ):
-        hits = pygame.sprite.groupcollide(
-            shields, boss_bullets,
-            False, True,
-            pygame.sprite.collide_circle
+    def _explode(ctx, pos):
+        explosion_frames = ctx["explosion_frames"]
+        if explosion_frames:
+            expl = PoolManager.acquire(ExplosionNode, pos, explosion_frames)
+            ctx["groups"]["explosions"].add(expl)
+
+        # รวมเสียงระเบิดทั้ง tick เป็นเสียงเดียว (ดู SoundBus)
+        SoundBus.emit(
+            ctx["explosion_sound"],
+            pos=pos,
+            priority=5,
+            volume=0.8,
+            max_simultaneous=6,
         )
 
-        for shield, bullet_list in hits.items():
-            for bullet in bullet_list:
-                shield.take_hit(1)
+    @classmethod
+    def _effect_explode_a(cls, ctx, rule, a, b) -> int:
+        cls._explode(ctx, a.rect.center)
+        return 0
 
-                if explosion_frames:
-                    expl = ExplosionNode(bullet.rect.center, explosion_frames)
-                    explosions.add(expl)
+    @classmethod
+    def _effect_explode_b(cls, ctx, rule, a, b) -> int:
+        cls._explode(ctx, b.rect.center)
+        return 0
 
-                if explosion_sound is not None:
-                    explosion_sound.play()
+    @classmethod
+    def _effect_explode_mid(cls, ctx, rule, a, b) -> int:
+        cx = (a.rect.centerx + b.rect.centerx) // 2
+        cy = (a.rect.centery + b.rect.centery) // 2
+        cls._explode(ctx, (cx, cy))
+        return 0
 
-    # -------------------------------------------------
-    # 13) LaserBeam vs Enemy
-    # -------------------------------------------------
     @staticmethod
-    def handle_laser_enemy_collisions(
-        lasers, enemies,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        # laser ไม่หาย, enemy หาย
-        hits = pygame.sprite.groupcollide(
-            lasers, enemies,
-            False, True,
-            pygame.sprite.collide_rect
-        )
-
-        for laser, enemy_list in hits.items():
-            for enemy in enemy_list:
-                if explosion_frames:
-                    expl = ExplosionNode(enemy.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 10
-
-        return score
+    def _effect_shield_hit(ctx, rule, shield, other) -> int:
+        shield.take_hit(1)
+        return 0
 
-    # -------------------------------------------------
-    # 14) LaserBeam vs Meteor
-    # -------------------------------------------------
     @staticmethod
-    def handle_laser_meteor_collisions(
-        lasers, meteors,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            lasers, meteors,
-            False, True,
-            pygame.sprite.collide_rect
-        )
-
-        for laser, meteor_list in hits.items():
-            for meteor in meteor_list:
-                if explosion_frames:
-                    expl = ExplosionNode(meteor.rect.center, explosion_frames)
-                    explosions.add(expl)
+    def _effect_boss_damage(ctx, rule, attacker, boss) -> int:
+        died = boss.take_damage(1)
+        if died:
+            # บอสตายแล้ว ให้โบนัสเพิ่มพิเศษ
+            return rule.get("kill_bonus", 0)
+        return 0
 
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 5
-
-        return score
-
-    # -------------------------------------------------
-    # 15) LaserBeam vs Boss
-    # -------------------------------------------------
     @staticmethod
-    def handle_laser_boss_collisions(
-        lasers, bosses,
-        explosions,
-        explosion_frames, explosion_sound,
-        score: int
-    ) -> int:
-        hits = pygame.sprite.groupcollide(
-            lasers, bosses,
-            False, False,
-            pygame.sprite.collide_rect
-        )
-
-        for laser, boss_list in hits.items():
-            for boss in boss_list:
-                died = boss.take_damage(1)
-
-                if explosion_frames:
-                    expl = ExplosionNode(boss.rect.center, explosion_frames)
-                    explosions.add(expl)
-
-                if explosion_sound is not None:
-                    explosion_sound.play()
-
-                score += 15
-                if died:
-                    score += 50
-
-        return score
+    def _effect_pickup(ctx, rule, hero, item) -> int:
+        """Hero เก็บ Item (Drone / Shield / Speed / Laser / Buckshot)"""
+        groups = ctx["groups"]
+        item_type = getattr(item, "type", None)
+
+        # เล่นเสียงเก็บ item
+        SoundBus.emit(ctx["pickup_sound"], pos=item.rect.center, priority=9)
+
+        # single / double / shield เดิม
+        if item_type == "single":
+            drone_right = DroneNode(hero, side="right")
+            groups["drones"].add(drone_right)
+
+        elif item_type == "double":
+            drone_left = DroneNode(hero, side="left")
+            drone_right = DroneNode(hero, side="right")
+            groups["drones"].add(drone_left, drone_right)
+
+        elif item_type == "shield":
+            shield = ShieldNode(hero, max_hp=3)
+            groups["shields"].add(shield)
+
+        # ของใหม่: speed / laser
+        elif item_type == "speed":
+            if hasattr(hero, "start_speed_boost"):
+                hero.start_speed_boost(duration=5.0, multiplier=1.5)
+                # ไอพ่นสร้างใน start_speed_boost (1 อันต่อ Hero) → แค่ใส่ group ให้ update / วาด
+                if hero.speed_flame is not None:
+                    groups["speeds"].add(hero.speed_flame)
+
+        elif item_type == "laser":
+            if hasattr(hero, "activate_laser"):
+                hero.activate_laser(duration=5.0)
+
+        # buckshot
+        elif item_type == "buckshot":
+            if hasattr(hero, "activate_buckshot"):
+                hero.activate_buckshot(duration=5.0)
+
+        return 0
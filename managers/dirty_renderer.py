@@ -0,0 +1,113 @@
+# managers/dirty_renderer.py
+
+import pygame
+
+from settings.config import DIRTY_RECTS_MAX
+
+
+class DirtyRenderer:
+    """
+    วาด + ส่งขึ้นจอเฉพาะส่วนที่เปลี่ยน (dirty rect) แทน fill + วาดพื้นหลัง + flip ทั้งจอทุกเฟรม
+
+        full = renderer.begin(screen, background.scroll_key(), draw_background, queue)
+        ...วาด sprite / HUD ลง screen แล้ว renderer.add(rect ที่วาด)...
+        renderer.end()
+        renderer.present()      # แทน pygame.display.flip()
+
+    - พื้นหลังชั้น tile ถูกวาดเก็บไว้ใน self.background (cache)
+    - เฟรมที่พื้นหลังไม่ขยับ (scroll_key เท่าเดิม): เอา cache แปะทับเฉพาะ rect ที่วาดเมื่อเฟรมก่อน
+      แล้ว display.update(rect ของเฟรมก่อน + เฟรมนี้)
+    - พื้นหลังเลื่อน / เฟรมก่อนไม่ได้วาดผ่าน renderer (เมนู, pause) / rect เยอะเกิน DIRTY_RECTS_MAX
+      → วาดใหม่ทั้งจอ + flip เหมือนเดิม
+    """
+
+    def __init__(self, size: tuple[int, int]):
+        self.background = pygame.Surface(size).convert()
+        self._bg_key = None
+        self._valid = False      # หน้าจอตอนนี้ = ผลจาก renderer เฟรมก่อน ไหม
+
+        self._full = True
+        self._drawn = False      # เฟรมนี้วาดผ่าน begin / end แล้วหรือยัง
+        self._rects: list[pygame.Rect] = []
+        self._prev_rects: list[pygame.Rect] = []
+        self._update_rects: list[pygame.Rect] | None = None
+
+        self.full_frames = 0
+        self.dirty_frames = 0
+        self.updated_pixels = 0  # พื้นที่ที่ส่งขึ้นจอในเฟรมล่าสุด
+
+    @property
+    def rects(self) -> list[pygame.Rect]:
+        """rect ที่วาดในเฟรมนี้ (ส่งให้ RenderQueue.flush เก็บต่อได้เลย)"""
+        return self._rects
+
+    def invalidate(self):
+        """หน้าจอถูกวาดทับจากที่อื่น → เฟรมถัดไปวาดใหม่ทั้งจอ"""
+        self._valid = False
+
+    def begin(self, screen: pygame.Surface, bg_key, draw_background, queue) -> bool:
+        """
+        เตรียมพื้นหลังของเฟรม (return True = วาดใหม่ทั้งจอ)
+        draw_background(surface) = วาดพื้นหลังชั้น tile ลง surface (เรียกเฉพาะตอนพื้นหลังเปลี่ยน)
+        """
+        self._drawn = True
+        self._rects = []
+
+        if bg_key != self._bg_key:
+            draw_background(self.background)
+            self._bg_key = bg_key
+            self._valid = False
+
+        # เฟรมก่อนวาดไว้หลายจุดเกิน → แปะทั้งจอเร็วกว่าแปะทีละ rect
+        if not self._valid or len(self._prev_rects) > DIRTY_RECTS_MAX:
+            queue.add("dirty.background", [(self.background, (0, 0))])
+            self._full = True
+        else:
+            background = self.background
+            queue.add("dirty.restore", [(background, rect, rect) for rect in self._prev_rects])
+            self._full = False
+
+        queue.flush(screen)
+        return self._full
+
+    def add(self, rects):
+        self._rects.extend(rects)
+
+    def end(self):
+        rects = self._rects
+        if not self._full and len(self._prev_rects) + len(rects) > DIRTY_RECTS_MAX:
+            self._full = True
+
+        if self._full:
+            self._update_rects = None
+            self.updated_pixels = self.background.get_width() * self.background.get_height()
+            self.full_frames += 1
+        else:
+            self._update_rects = self._prev_rects + rects
+            self.updated_pixels = sum(rect.width * rect.height for rect in self._update_rects)
+            self.dirty_frames += 1
+
+        self._prev_rects = rects
+        self._valid = True
+
+    def present(self):
+        """ส่งเฟรมขึ้นจอ: update เฉพาะ rect ที่เปลี่ยน หรือ flip ทั้งจอ"""
+        if not self._drawn:
+            # เฟรมนี้ไม่ได้วาดผ่าน renderer (เช่นเมนู) → flip ตามปกติ และเฟรมถัดไปต้องวาดใหม่ทั้งจอ
+            self._valid = False
+            self.updated_pixels = self.background.get_width() * self.background.get_height()
+            pygame.display.flip()
+        elif self._update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self._update_rects)
+
+        self._drawn = False
+        self._update_rects = None
+
+    def stats(self) -> dict:
+        return {
+            "full_frames": self.full_frames,
+            "dirty_frames": self.dirty_frames,
+            "updated_pixels": self.updated_pixels,
+        }
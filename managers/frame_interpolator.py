@@ -0,0 +1,60 @@
+# managers/frame_interpolator.py
+
+from contextlib import contextmanager
+
+
+class FrameInterpolator:
+    """
+    วาด sprite ที่ตำแหน่ง "ระหว่าง" 2 state ของ simulation (fixed timestep)
+
+        interpolator.snapshot()             # ก่อน update 1 step → จำตำแหน่งเดิม
+        game.update_world_playing(FIXED_DT)
+        ...
+        with interpolator.apply(alpha):     # alpha = เวลาที่เหลือใน accumulator / FIXED_DT
+            group.draw(screen)
+
+    apply() ขยับ rect ไปตำแหน่ง lerp ชั่วคราวแล้วคืนค่าเดิมหลังวาด
+    → logic / collision ไม่เคยเห็นตำแหน่งที่ interpolate
+    """
+
+    # ขยับเกินนี้ใน 1 step = วาร์ป (เช่น sprite จาก pool ถูก reset) → ไม่ lerp
+    MAX_JUMP = 64
+
+    def __init__(self, groups):
+        self.groups = list(groups)
+        self._prev: dict = {}
+
+    def snapshot(self):
+        """จำตำแหน่งกึ่งกลางของทุก sprite ก่อน step ถัดไป"""
+        self._prev = {
+            sprite: sprite.rect.center
+            for group in self.groups
+            for sprite in group
+        }
+
+    def clear(self):
+        self._prev = {}
+
+    @contextmanager
+    def apply(self, alpha: float):
+        max_jump = self.MAX_JUMP
+        moved = []
+
+        for sprite, (px, py) in self._prev.items():
+            if not sprite.alive():
+                continue
+
+            cx, cy = sprite.rect.center
+            dx = cx - px
+            dy = cy - py
+            if (dx == 0 and dy == 0) or abs(dx) > max_jump or abs(dy) > max_jump:
+                continue
+
+            moved.append((sprite, cx, cy))
+            sprite.rect.center = (round(px + dx * alpha), round(py + dy * alpha))
+
+        try:
+            yield
+        finally:
+            for sprite, cx, cy in moved:
+                sprite.rect.center = (cx, cy)
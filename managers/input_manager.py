@@ -3,35 +3,132 @@
 import pygame
 
 
+# bit ของ input ต่อ 1 tick (ใช้กับการอัด / เล่น replay)
+INPUT_LEFT = 1 << 0
+INPUT_RIGHT = 1 << 1
+INPUT_UP = 1 << 2
+INPUT_DOWN = 1 << 3
+INPUT_FIRE = 1 << 4
+
+
 class InputManager:
-    @staticmethod
-    def handle_quit_events():
+    # แหล่ง input ของ tick ปัจจุบัน (ดู begin_tick)
+    _recorder = None      # InputRecorder: อัด input ทุก tick
+    _replay = None        # InputReplay: อ่าน input จากไฟล์แทนคีย์บอร์ด
+    _tick_bits: int | None = None
+
+    # ปุ่มลัดที่ทำงานตอนกด (KEYDOWN) เช่น F3 = profiler overlay
+    _key_bindings: dict = {}
+
+    # event ชนิดอื่นที่มีคนรอรับ เช่น END_EVENT ของ SoundManager: event.type → callback(event)
+    _event_bindings: dict = {}
+
+    @classmethod
+    def bind_key(cls, key: int, callback):
+        cls._key_bindings[key] = callback
+
+    @classmethod
+    def bind_event(cls, event_type: int, callback):
+        cls._event_bindings[event_type] = callback
+
+    @classmethod
+    def handle_quit_events(cls):
         """คืนค่า False ถ้าผู้ใช้กดปิดหน้าต่าง, True ถ้ายังเล่นต่อ"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
+            if event.type == pygame.KEYDOWN:
+                callback = cls._key_bindings.get(event.key)
+                if callback is not None:
+                    callback()
+                continue
+            handler = cls._event_bindings.get(event.type)
+            if handler is not None:
+                handler(event)
         return True
 
+    # ------------------------------------------------
+    # Record / Replay
+    # ------------------------------------------------
+    @classmethod
+    def set_recorder(cls, recorder):
+        cls._recorder = recorder
+
+    @classmethod
+    def set_replay(cls, replay):
+        cls._replay = replay
+
+    @classmethod
+    def begin_tick(cls) -> int:
+        """
+        เรียก 1 ครั้งต้น tick ของเกม (Game.update_world_playing)
+        - อ่าน input จาก replay (ถ้ามี) หรือจากคีย์บอร์ด
+        - ส่งให้ recorder (ถ้ามี)
+        - get_move_direction / is_space_pressed ใน tick นี้จะใช้ค่านี้
+        """
+        if cls._replay is not None:
+            bits = cls._replay.next_tick()
+        else:
+            bits = cls.read_keyboard_bits()
+
+        if cls._recorder is not None:
+            cls._recorder.record(bits)
+
+        cls._tick_bits = bits
+        return bits
+
     @staticmethod
-    def get_move_direction() -> pygame.math.Vector2:
+    def read_keyboard_bits() -> int:
+        """อ่านปุ่มลูกศร / WASD / Space ปัจจุบันเป็น bitmask"""
+        keys = pygame.key.get_pressed()
+        bits = 0
+
+        # ซ้าย-ขวา
+        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+            bits |= INPUT_LEFT
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            bits |= INPUT_RIGHT
+
+        # ขึ้น-ลง
+        if keys[pygame.K_UP] or keys[pygame.K_w]:
+            bits |= INPUT_UP
+        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            bits |= INPUT_DOWN
+
+        if keys[pygame.K_SPACE]:
+            bits |= INPUT_FIRE
+
+        return bits
+
+    @classmethod
+    def _current_bits(cls) -> int:
+        if cls._tick_bits is not None:
+            return cls._tick_bits
+        return cls.read_keyboard_bits()
+
+    # ------------------------------------------------
+    # API เดิม
+    # ------------------------------------------------
+    @classmethod
+    def get_move_direction(cls) -> pygame.math.Vector2:
         """
         อ่านปุ่มลูกศร / WASD แล้วคืนค่า Vector2 ทิศทางการเคลื่อนที่
         - ปกติใช้กับ Hero: hero.update(dt, move_dir)
         """
-        keys = pygame.key.get_pressed()
+        bits = cls._current_bits()
         dx = 0
         dy = 0
 
         # ซ้าย-ขวา
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if bits & INPUT_LEFT:
             dx -= 1
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if bits & INPUT_RIGHT:
             dx += 1
 
         # ขึ้น-ลง
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
+        if bits & INPUT_UP:
             dy -= 1
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+        if bits & INPUT_DOWN:
             dy += 1
 
         vec = pygame.math.Vector2(dx, dy)
@@ -40,8 +137,7 @@ class InputManager:
 
         return vec
 
-    @staticmethod
-    def is_space_pressed() -> bool:
+    @classmethod
+    def is_space_pressed(cls) -> bool:
         """เช็คว่าปุ่ม Space ถูกกดอยู่หรือไม่"""
-        keys = pygame.key.get_pressed()
-        return keys[pygame.K_SPACE]
+        return bool(cls._current_bits() & INPUT_FIRE)
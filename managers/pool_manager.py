@@ -0,0 +1,110 @@
+# managers/pool_manager.py
+
+import pygame
+
+
+class SpritePool:
+    """
+    Pool ของ sprite ชนิดเดียว (เช่น BulletNode)
+    - acquire(): ถ้ามี sprite ที่ตายแล้วใน free list → reset() แล้วใช้ซ้ำ
+                 ถ้าไม่มี → สร้างใหม่ด้วย sprite_cls(*args)
+    - release(): เรียกจาก kill() ของ sprite → คืนกลับเข้า free list
+
+    sprite_cls ต้องมีเมธอด reset(*args) ที่รับพารามิเตอร์ชุดเดียวกับ __init__
+    """
+
+    def __init__(self, sprite_cls, max_free: int = 256):
+        self.sprite_cls = sprite_cls
+        self.max_free = max_free
+        self._free: list[pygame.sprite.Sprite] = []
+
+        # สถิติ
+        self.created = 0      # จำนวนที่สร้างใหม่ทั้งหมด
+        self.reused = 0       # จำนวนครั้งที่ดึงจาก free list
+        self.released = 0     # จำนวนครั้งที่คืนเข้า pool
+        self.dropped = 0      # คืนมาตอน free list เต็ม → ปล่อยให้ GC เก็บ
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            sprite = self._free.pop()
+            # radius ที่ collide_circle cache ไว้บน instance จากรอบก่อน → ขนาด/รูปใหม่ต้องคิดใหม่
+            sprite.__dict__.pop("radius", None)
+            sprite.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            sprite = self.sprite_cls(*args, **kwargs)
+            sprite._pool = self
+            self.created += 1
+
+        sprite._in_pool = False
+        return sprite
+
+    def release(self, sprite):
+        # กัน kill() ซ้ำสองครั้ง แล้วเข้า free list ซ้ำ
+        if sprite._in_pool:
+            return
+        sprite._in_pool = True
+        self.released += 1
+
+        if len(self._free) < self.max_free:
+            self._free.append(sprite)
+        else:
+            self.dropped += 1
+
+    def stats(self) -> dict:
+        acquires = self.created + self.reused
+        return {
+            "size": self.created - self.dropped,    # sprite ที่ pool ดูแลอยู่ทั้งหมด
+            "free": len(self._free),
+            "in_use": self.created - self.dropped - len(self._free),
+            "acquires": acquires,
+            "hit_rate": self.reused / acquires if acquires else 0.0,
+        }
+
+
+class PoolManager:
+    """
+    ตัวจัดการ pool ของ sprite ที่เกิด/ตายบ่อย (กระสุน, ระเบิด, อุกาบาต)
+
+        bullet = PoolManager.acquire(BulletNode, pos)
+        bullet.kill()    # → คืนเข้า pool อัตโนมัติ (ถ้า kill() ของคลาสเรียก release)
+    """
+
+    _pools: dict[type, SpritePool] = {}
+
+    @classmethod
+    def get_pool(cls, sprite_cls) -> SpritePool:
+        pool = cls._pools.get(sprite_cls)
+        if pool is None:
+            pool = SpritePool(sprite_cls)
+            cls._pools[sprite_cls] = pool
+        return pool
+
+    @classmethod
+    def acquire(cls, sprite_cls, *args, **kwargs):
+        return cls.get_pool(sprite_cls).acquire(*args, **kwargs)
+
+    @staticmethod
+    def release(sprite):
+        """เรียกจาก kill() ของ sprite ที่รองรับ pool (sprite ที่ไม่ได้มาจาก pool จะถูกข้าม)"""
+        pool = getattr(sprite, "_pool", None)
+        if pool is not None:
+            pool.release(sprite)
+
+    @staticmethod
+    def release_group(group: pygame.sprite.AbstractGroup):
+        """
+        ล้าง group ที่มี sprite จาก pool (แทน group.empty())
+        empty() ไม่เรียก kill() → sprite ไม่ได้คืนเข้า pool และ pool ต้องสร้างใหม่หมด
+        """
+        for sprite in group.sprites():
+            sprite.kill()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """{ชื่อคลาส: {size, free, in_use, acquires, hit_rate}}"""
+        return {sprite_cls.__name__: pool.stats() for sprite_cls, pool in cls._pools.items()}
+
+    @classmethod
+    def clear(cls):
+        cls._pools.clear()
@@ -0,0 +1,176 @@
+# managers/profiler.py
+
+import csv
+import time
+from collections import deque
+from contextlib import nullcontext
+
+from settings.config import PROFILER_WINDOW, PROFILER_SUMMARY_INTERVAL
+
+
+# คืนตัวนี้ตัวเดียวตอนปิด profiler → `with Profiler.section(...)` แทบไม่มีต้นทุน
+_NULL_SECTION = nullcontext()
+
+
+class _Section:
+    """จับเวลา 1 ช่วง แล้วบวกเข้ายอดรวมของเฟรมปัจจุบัน"""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        totals = Profiler._frame_totals
+        totals[self.name] = totals.get(self.name, 0.0) + (time.perf_counter() - self.start)
+        return False
+
+
+class _Stats:
+    """histogram แบบ rolling (PROFILER_WINDOW เฟรมล่าสุด) + ยอดรวมทั้งเกม (ms)"""
+
+    __slots__ = ("window", "count", "total", "max")
+
+    def __init__(self):
+        self.window: deque[float] = deque(maxlen=PROFILER_WINDOW)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        self.window.append(ms)
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    def summary(self) -> dict:
+        samples = sorted(self.window)
+        return {
+            "frames": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": _percentile(samples, 50),
+            "p95_ms": _percentile(samples, 95),
+            "p99_ms": _percentile(samples, 99),
+            "max_ms": self.max,
+            "total_ms": self.total,
+        }
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    """nearest-rank percentile"""
+    if not sorted_samples:
+        return 0.0
+    rank = int(round(pct / 100.0 * len(sorted_samples) + 0.5)) - 1
+    return sorted_samples[min(max(rank, 0), len(sorted_samples) - 1)]
+
+
+class Profiler:
+    """
+    จับเวลาแต่ละส่วนของเฟรม (update / collision / draw / UI ...)
+
+        with Profiler.section("update.collision"):
+            ...
+        Profiler.end_frame()     # เรียกครั้งเดียวท้ายเฟรม → เก็บยอดของเฟรมเข้า histogram
+
+    - ส่วนที่ถูกเรียกหลายครั้งในเฟรมเดียว (เช่นหลาย step ของ fixed timestep) จะถูกรวมเป็นค่าเดียว
+    - ปิดอยู่ (enabled = False) → section() คืน nullcontext ตัวเดียวกันทุกครั้ง
+    - summary() ให้ p50 / p95 / p99 ต่อส่วน, dump_csv() เขียนไฟล์ตอนออกเกม
+    """
+
+    enabled = False
+    overlay_visible = False
+
+    _sections: dict[str, _Section] = {}
+    _stats: dict[str, _Stats] = {}
+    _frame_totals: dict[str, float] = {}
+
+    _frames_since_summary = 0
+    _summary_cache: list[dict] = []
+    summary_version = 0
+
+    @classmethod
+    def enable(cls, enabled: bool = True):
+        cls.enabled = enabled
+        cls._frame_totals.clear()
+
+    @classmethod
+    def toggle_overlay(cls):
+        """สลับการแสดง overlay (เปิด overlay = เปิด profiler ด้วย)"""
+        cls.overlay_visible = not cls.overlay_visible
+        if cls.overlay_visible and not cls.enabled:
+            cls.enable()
+
+    @classmethod
+    def reset(cls):
+        cls._stats.clear()
+        cls._frame_totals.clear()
+        cls._summary_cache = []
+        cls._frames_since_summary = 0
+        cls.summary_version += 1
+
+    @classmethod
+    def section(cls, name: str):
+        if not cls.enabled:
+            return _NULL_SECTION
+
+        section = cls._sections.get(name)
+        if section is None:
+            section = _Section(name)
+            cls._sections[name] = section
+        return section
+
+    @classmethod
+    def end_frame(cls):
+        if not cls.enabled:
+            return
+
+        for name, seconds in cls._frame_totals.items():
+            stats = cls._stats.get(name)
+            if stats is None:
+                stats = _Stats()
+                cls._stats[name] = stats
+            stats.add(seconds * 1000.0)
+        cls._frame_totals.clear()
+
+        cls._frames_since_summary += 1
+
+    @classmethod
+    def summary(cls) -> list[dict]:
+        """
+        [{name, frames, mean_ms, p50_ms, p95_ms, p99_ms, max_ms, total_ms}, ...] เรียงตามชื่อ
+        คำนวณใหม่ทุก PROFILER_SUMMARY_INTERVAL เฟรม (overlay เรียกได้ทุกเฟรม)
+        """
+        if cls._frames_since_summary >= PROFILER_SUMMARY_INTERVAL or not cls._summary_cache:
+            cls._summary_cache = [
+                {"name": name, **stats.summary()}
+                for name, stats in sorted(cls._stats.items())
+            ]
+            cls._frames_since_summary = 0
+            cls.summary_version += 1
+        return cls._summary_cache
+
+    @classmethod
+    def dump_csv(cls, path: str) -> bool:
+        """เขียนสรุปทุกส่วนลง CSV (คืน False ถ้ายังไม่มีข้อมูล)"""
+        if not cls._stats:
+            return False
+
+        cls._frames_since_summary = PROFILER_SUMMARY_INTERVAL   # บังคับคำนวณใหม่
+        rows = cls.summary()
+
+        fields = ["name", "frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms", "total_ms"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow({
+                    key: (f"{value:.4f}" if isinstance(value, float) else value)
+                    for key, value in row.items()
+                })
+        return True
@@ -0,0 +1,213 @@
+# managers/projectile_group.py
+
+import pygame
+
+from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+try:
+    import numpy as np
+except ImportError:  # ไม่มี numpy → ขยับทีละตัวด้วยกติกาเดียวกัน (ดู _update_python)
+    np = None
+
+
+class ProjectileGroup(pygame.sprite.Group):
+    """
+    Group สำหรับกระสุนจำนวนมาก (BulletNode / BossBulletNode)
+    เก็บสถานะแบบ structure-of-arrays ใน NumPy:
+        pos, velocity, lifetime, frame_time, frame_index (1 แถว = 1 กระสุน = 1 slot)
+
+    update(dt) ขยับ + นับอายุ + เปลี่ยนเฟรม + ลบกระสุนที่หลุดจอ / หมดอายุ ด้วย vector op ไม่กี่ครั้ง
+    แล้วเขียนตำแหน่งกลับเข้า pos + rect ของ sprite แต่ละตัว
+    (ไม่มี numpy → _update_python ทำแบบเดียวกันทีละตัว ผลเท่ากัน)
+    → sprite ยังเป็น "view" ที่ใช้วาด (group.draw) และเช็คการชน (rect / mask) ได้ตามปกติ
+
+    sprite ที่จะใส่ใน group นี้ต้องมี:
+        pos (Vector2, จุดกึ่งกลาง), velocity (Vector2, px/s), lifetime (วินาที)
+        frames / masks / frame_duration / frame_index / time_since_last (ถ้ามีแอนิเมชัน)
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self, *sprites):
+        self._slot_sprites: list = []
+        self._free_slots: list[int] = []
+        self._high = 0   # slot สูงสุดที่เคยใช้ + 1
+
+        if np is not None:
+            self._alloc(self.INITIAL_CAPACITY)
+
+        super().__init__(*sprites)
+
+    # ------------------------------------------------
+    # จัดการ slot (pygame เรียกผ่าน add() / remove() / kill() / empty())
+    # ------------------------------------------------
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        if np is None:
+            return
+
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = self._high
+            if slot >= len(self._slot_sprites):
+                self._alloc(len(self._slot_sprites) * 2)
+            self._high += 1
+
+        sprite._slot = slot
+        self._slot_sprites[slot] = sprite
+
+        frames = getattr(sprite, "frames", None) or [sprite.image]
+        w, h = sprite.image.get_size()
+
+        self._pos[slot] = sprite.pos
+        self._vel[slot] = sprite.velocity
+        self._life[slot] = sprite.lifetime
+        self._frame_time[slot] = getattr(sprite, "time_since_last", 0.0)
+        self._frame_index[slot] = getattr(sprite, "frame_index", 0)
+        self._frame_count[slot] = len(frames)
+        self._frame_duration[slot] = getattr(sprite, "frame_duration", 0.0)
+        self._half[slot] = (w / 2, h / 2)
+        self._active[slot] = True
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if np is None:
+            return
+
+        slot = sprite._slot
+        # คืนตำแหน่งล่าสุดให้ sprite (เผื่อมีคนอ่าน pos หลังลบออกจาก group)
+        x, y = self._pos[slot].tolist()
+        sprite.pos.update(x, y)
+        self._active[slot] = False
+        self._slot_sprites[slot] = None
+        self._free_slots.append(slot)
+
+    def _alloc(self, capacity: int):
+        old = len(self._slot_sprites)
+
+        def grow(array, shape, dtype):
+            new = np.zeros(shape, dtype=dtype)
+            if old:
+                new[:old] = array
+            return new
+
+        self._pos = grow(getattr(self, "_pos", None), (capacity, 2), np.float64)
+        self._vel = grow(getattr(self, "_vel", None), (capacity, 2), np.float64)
+        self._half = grow(getattr(self, "_half", None), (capacity, 2), np.float64)
+        self._life = grow(getattr(self, "_life", None), capacity, np.float64)
+        self._frame_time = grow(getattr(self, "_frame_time", None), capacity, np.float64)
+        self._frame_duration = grow(getattr(self, "_frame_duration", None), capacity, np.float64)
+        self._frame_index = grow(getattr(self, "_frame_index", None), capacity, np.int32)
+        self._frame_count = grow(getattr(self, "_frame_count", None), capacity, np.int32)
+        self._active = grow(getattr(self, "_active", None), capacity, bool)
+        self._slot_sprites.extend([None] * (capacity - old))
+
+    # ------------------------------------------------
+    # อัปเดตทุกเฟรม
+    # ------------------------------------------------
+    def update(self, dt, *args, **kwargs):
+        if np is None:
+            self._update_python(dt)
+            return
+
+        n = self._high
+        if n == 0:
+            return
+
+        active = self._active[:n]
+        pos = self._pos[:n]
+
+        # 1) ขยับทุกนัดพร้อมกัน + นับอายุ
+        pos += self._vel[:n] * dt
+        life = self._life[:n]
+        life -= dt
+
+        # 2) แอนิเมชัน (เฉพาะกระสุนที่มีมากกว่า 1 เฟรม)
+        frame_time = self._frame_time[:n]
+        frame_time += dt
+        advance = active & (self._frame_count[:n] > 1) & (frame_time >= self._frame_duration[:n])
+        advance_slots = np.flatnonzero(advance)
+        if advance_slots.size:
+            frame_time[advance_slots] = 0.0
+            self._frame_index[advance_slots] = (
+                (self._frame_index[advance_slots] + 1) % self._frame_count[advance_slots]
+            )
+
+        # เขียนเฟรมใหม่กลับเข้า sprite (image / mask / rect) + ขนาดครึ่งหนึ่งของภาพใหม่ก่อนเช็คหลุดจอ
+        # (เฟรมแต่ละภาพขนาดไม่เท่ากันได้ → ต้องเช็คกับภาพปัจจุบันเหมือน _update_python)
+        sprites = self._slot_sprites
+        for slot, index in zip(advance_slots.tolist(), self._frame_index[advance_slots].tolist()):
+            sprite = sprites[slot]
+            sprite.frame_index = index
+            sprite.image = sprite.frames[index]
+            sprite.mask = sprite.masks[index]
+            sprite.rect = sprite.image.get_rect(center=sprite.rect.center)
+            w, h = sprite.image.get_size()
+            self._half[slot] = (w / 2, h / 2)
+
+        # 3) หลุดจอ (ทั้งตัว) หรือหมดอายุ → ลบ
+        half = self._half[:n]
+        x = pos[:, 0]
+        y = pos[:, 1]
+        dead = active & (
+            (life <= 0.0)
+            | (x + half[:, 0] < 0)
+            | (x - half[:, 0] > SCREEN_WIDTH)
+            | (y + half[:, 1] < 0)
+            | (y - half[:, 1] > SCREEN_HEIGHT)
+        )
+
+        # 4) เขียนตำแหน่งกลับเข้า sprite (pos / rect)
+        alive_slots = np.flatnonzero(active & ~dead)
+        for slot, cx, cy in zip(
+            alive_slots.tolist(),
+            x[alive_slots].tolist(),
+            y[alive_slots].tolist(),
+        ):
+            sprite = sprites[slot]
+            sprite.pos.update(cx, cy)
+            sprite.rect.center = (cx, cy)
+
+        for slot in np.flatnonzero(dead).tolist():
+            sprites[slot].kill()
+
+        # หด _high ถ้า slot ท้าย ๆ ว่างหมดแล้ว (ลดงานของเฟรมถัดไป)
+        while self._high > 0 and not self._active[self._high - 1]:
+            self._high -= 1
+        if self._high < n:
+            self._free_slots = [s for s in self._free_slots if s < self._high]
+
+    def _update_python(self, dt):
+        """update() แบบไม่มี numpy: ขั้นตอน + เงื่อนไขลบเหมือน path ของ numpy ทุกข้อ"""
+        dead = []
+        for sprite in self.sprites():
+            pos = sprite.pos
+            pos += sprite.velocity * dt
+            sprite.lifetime -= dt
+
+            frames = getattr(sprite, "frames", None)
+            if frames is not None and len(frames) > 1:
+                sprite.time_since_last += dt
+                if sprite.time_since_last >= sprite.frame_duration:
+                    sprite.time_since_last = 0.0
+                    sprite.frame_index = (sprite.frame_index + 1) % len(frames)
+                    sprite.image = frames[sprite.frame_index]
+                    sprite.mask = sprite.masks[sprite.frame_index]
+                    sprite.rect = sprite.image.get_rect(center=sprite.rect.center)
+
+            half_w = sprite.image.get_width() / 2
+            half_h = sprite.image.get_height() / 2
+            if (
+                sprite.lifetime <= 0.0
+                or pos.x + half_w < 0
+                or pos.x - half_w > SCREEN_WIDTH
+                or pos.y + half_h < 0
+                or pos.y - half_h > SCREEN_HEIGHT
+            ):
+                dead.append(sprite)
+            else:
+                sprite.rect.center = (pos.x, pos.y)
+
+        for sprite in dead:
+            sprite.kill()
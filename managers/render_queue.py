@@ -0,0 +1,56 @@
+# managers/render_queue.py
+
+import pygame
+
+
+class RenderQueue:
+    """
+    รวมคำสั่งวาด (surface, ตำแหน่ง) ของแต่ละ layer ตามลำดับการวาด
+    แล้วส่งทีละ layer ด้วย Surface.blits() ครั้งเดียว (แทน blit ทีละตัวจาก Python)
+
+        queue.begin()                           # ต้นเฟรม → เริ่มนับใหม่
+        queue.add("bg.far_stars", tiles)        # [(surface, (x, y) หรือ Rect), ...]
+        queue.add_group("meteors", meteors)     # sprite ทุกตัวใน group (image, rect)
+        queue.flush(screen)                     # วาดทุก layer ที่ค้างอยู่ตามลำดับ add
+
+    - rect ถูกอ่านตอน flush → ถ้าใช้ FrameInterpolator.apply() ต้อง flush ภายใน with เดียวกัน
+    - stats(): จำนวน blit ต่อ layer + จำนวนครั้งที่เรียก blits() ตั้งแต่ begin() ล่าสุด
+    """
+
+    def __init__(self):
+        self._layers: list[tuple[str, list]] = []
+
+        # ยอดของเฟรมปัจจุบัน (สะสมข้ามหลาย flush จนกว่าจะ begin ใหม่)
+        self.blit_counts: dict[str, int] = {}
+        self.blits = 0
+        self.calls = 0
+
+    def begin(self):
+        self._layers.clear()
+        self.blit_counts = {}
+        self.blits = 0
+        self.calls = 0
+
+    def add(self, name: str, pairs: list):
+        if pairs:
+            self._layers.append((name, pairs))
+
+    def add_group(self, name: str, group: pygame.sprite.AbstractGroup):
+        self.add(name, [(sprite.image, sprite.rect) for sprite in group.sprites()])
+
+    def flush(self, surface: pygame.Surface, rects: list | None = None):
+        """วาดทุก layer ที่ค้างอยู่ (rects = list ที่จะเก็บ Rect ที่ถูกวาดจริงต่อท้าย, ใช้กับ DirtyRenderer)"""
+        counts = self.blit_counts
+        for name, pairs in self._layers:
+            if rects is None:
+                surface.blits(pairs, doreturn=False)
+            else:
+                rects.extend(surface.blits(pairs))
+            counts[name] = counts.get(name, 0) + len(pairs)
+            self.blits += len(pairs)
+            self.calls += 1
+        self._layers.clear()
+
+    def stats(self) -> dict:
+        """{blits, calls, layers: {name: blit}}"""
+        return {"blits": self.blits, "calls": self.calls, "layers": dict(self.blit_counts)}
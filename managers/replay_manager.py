@@ -0,0 +1,79 @@
+# managers/replay_manager.py
+
+import struct
+
+
+# ไฟล์ replay (binary, little-endian):
+#   header : magic "SSRP" | version (uint16) | seed (uint64) | dt (float64) | tick_count (uint32)
+#   body   : 1 byte ต่อ 1 tick = bitmask ของ input (ดู INPUT_* ใน InputManager)
+REPLAY_MAGIC = b"SSRP"
+REPLAY_VERSION = 1
+_HEADER = struct.Struct("<4sHQdI")
+
+
+class InputRecorder:
+    """
+    อัด input ทีละ tick (1 byte / tick) ระหว่างเล่น
+    ใช้คู่กับ seed ของเกม → เล่นซ้ำได้เหมือนเดิมทุกบิตด้วย InputReplay
+    """
+
+    def __init__(self, seed: int, dt: float):
+        self.seed = seed
+        self.dt = dt
+        self.ticks = bytearray()
+
+    def reset(self):
+        """เริ่มอัดใหม่ (เรียกตอนเริ่มเกมใหม่)"""
+        self.ticks.clear()
+
+    def record(self, bits: int):
+        self.ticks.append(bits & 0xFF)
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.dt, len(self.ticks)))
+            f.write(self.ticks)
+
+
+class InputReplay:
+    """เล่น input ที่อัดไว้กลับทีละ tick (หมดแล้วคืน 0 = ไม่กดอะไร)"""
+
+    def __init__(self, seed: int, dt: float, ticks: bytes):
+        self.seed = seed
+        self.dt = dt
+        self.ticks = bytes(ticks)
+        self.index = 0
+
+    @classmethod
+    def load(cls, path: str) -> "InputReplay":
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Replay file '{path}' is too short")
+
+        magic, version, seed, dt, count = _HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ValueError(f"'{path}' is not a replay file")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        ticks = data[_HEADER.size:_HEADER.size + count]
+        if len(ticks) != count:
+            raise ValueError(f"Replay file '{path}' is truncated")
+
+        return cls(seed, dt, ticks)
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @property
+    def finished(self) -> bool:
+        return self.index >= len(self.ticks)
+
+    def next_tick(self) -> int:
+        if self.finished:
+            return 0
+        bits = self.ticks[self.index]
+        self.index += 1
+        return bits
@@ -1,7 +1,25 @@
 # managers/resource_manager.py
 
 import pygame
+import json
 import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from settings.config import (
+    ASSET_CACHE_DIR,
+    ASSET_LOADER_THREADS,
+    ASSET_PREFETCH_THREADS,
+    ASSET_STREAMING,
+    ATLAS_ENABLED,
+    ATLAS_PAGE_SIZE,
+    ATLAS_PADDING,
+    ASSET_MEMORY_BUDGET_MB,
+)
+from settings.asset_manifest import SCENE_ASSETS
+from managers.asset_cache import AssetCache
+from managers.texture_atlas import TextureAtlas
 
 # -----------------------------------------
 #  ค่า scale สำหรับ asset ต่าง ๆ
@@ -24,6 +42,39 @@ EXPLOSION_SCALE  = 0.20
 SPEED_FLAME_SCALE = 0.1
 
 
+# -----------------------------------------
+#  ชุดเฟรม: key ใน _frame_sets → (โฟลเดอร์ใน assets/images, pattern ชื่อไฟล์, จำนวนเฟรม, scale)
+# -----------------------------------------
+FRAME_ASSETS = {
+    "hero_frames":        ("hero",        "hero_0{}.png",        4, HERO_SCALE),
+    "enemy_frames":       ("enemy",       "enemy_0{}.png",       4, ENEMY_SCALE),
+    "boss_frames":        ("boss",        "boss_0{}.png",        4, BOSS_SCALE),
+    "meteor_frames":      ("meteor",      "meteor_0{}.png",      4, METEOR_SCALE),
+    "drone_frames":       ("drone",       "drone_0{}.png",       4, DRONE_SCALE),
+    "boss_bullet_frames": ("boss_bullet", "boss_bullet_0{}.png", 4, BOSS_BULLET_SCALE),
+    "shield_frames":      ("shield",      "shield_0{}.png",      4, SHIELD_SCALE),
+    "speed_frames":       ("speed",       "speed_0{}.png",       4, SPEED_FLAME_SCALE),
+    "explosion_frames":   ("explosion",   "explosion_0{}.png",   4, EXPLOSION_SCALE),
+}
+
+# ภาพเดี่ยวที่ใช้เฟรมแรกของชุด เช่น get_image("hero")
+FIRST_FRAME_ALIASES = {
+    "hero": "hero_frames",
+    "enemy": "enemy_frames",
+    "boss": "boss_frames",
+    "boss_bullet": "boss_bullet_frames",
+}
+
+ITEM_PATTERNS = {
+    "single": "item_single_0{}.png",
+    "double": "item_double_0{}.png",
+    "shield": "item_shield_0{}.png",
+    "speed":  "item_speed_0{}.png",
+    "laser":  "item_laser_0{}.png",
+    "buckshot": "item_buckshot_0{}.png",
+}
+
+
 
 def scale_image(image: pygame.Surface, scale_factor: float) -> pygame.Surface:
     """Scale ภาพ 1 รูปตาม scale_factor"""
@@ -46,275 +97,592 @@ def scale_frames(frames, scale_factor: float):
     return scaled
 
 
+# รูปแบบ Surface หลัง convert (ดู detect_format)
+FORMAT_OPAQUE = "opaque"        # convert()          : ทึบทุก pixel → blit แบบ copy ตรง ๆ
+FORMAT_COLORKEY = "colorkey"    # convert() + colorkey (RLEACCEL) : alpha มีแค่ 0 / 255
+FORMAT_ALPHA = "alpha"          # convert_alpha()    : มี alpha ระหว่างกลาง (ขอบนุ่ม / เงา / แสง)
+
+# สีที่ลองใช้เป็น colorkey (เอาสีแรกที่ไม่มีใน pixel ทึบของทุกเฟรม)
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253)]
+
+
+def detect_format(frames) -> tuple[str, tuple | None]:
+    """
+    ดู alpha ของทุกเฟรม (ยังไม่ convert, ใช้จาก worker thread ได้)
+    return: (FORMAT_*, สี colorkey หรือ None)
+    """
+    if not frames:
+        return FORMAT_ALPHA, None
+
+    opaque = True
+    for frame in frames:
+        w, h = frame.get_size()
+        solid = pygame.mask.from_surface(frame, 254).count()        # alpha = 255
+        if solid == w * h:
+            continue
+        opaque = False
+        if pygame.mask.from_surface(frame, 0).count() != solid:     # มี alpha 1..254
+            return FORMAT_ALPHA, None
+
+    if opaque:
+        return FORMAT_OPAQUE, None
+
+    # alpha แค่ 0 / 255 → หาสีที่ไม่ชนกับ pixel ทึบ
+    for color in COLORKEY_CANDIDATES:
+        in_use = False
+        for frame in frames:
+            solid = pygame.mask.from_surface(frame, 254)
+            same = pygame.mask.from_threshold(frame, color, (1, 1, 1, 255))
+            if same.overlap_area(solid, (0, 0)):
+                in_use = True
+                break
+        if not in_use:
+            return FORMAT_COLORKEY, color
+
+    return FORMAT_ALPHA, None
+
+
+def convert_frame(frame: pygame.Surface, fmt: str, colorkey=None) -> pygame.Surface:
+    """(main thread) convert ตาม detect_format"""
+    if fmt == FORMAT_OPAQUE:
+        return frame.convert()
+
+    if fmt == FORMAT_COLORKEY:
+        out = pygame.Surface(frame.get_size()).convert()
+        out.fill(colorkey)
+        out.blit(frame, (0, 0))     # pixel ทึบ copy ตรง ๆ, pixel ใส = สี colorkey
+        out.set_colorkey(colorkey, pygame.RLEACCEL)
+        return out
+
+    return frame.convert_alpha()
+
+
 class ResourceManager:
     """
     ตัวจัดการ resource ทั้งหมดของเกม:
-    - รูปภาพ (images / frames)
+    - รูปภาพ (ชุดเฟรม, key ตาม _frame_set_jobs เช่น "hero_frames", "item_laser", "bg_01")
     - เสียง (sounds)
+
+    โหลดภาพแบบ lazy (ASSET_STREAMING = True):
+    - init() โหลดแค่ที่เมนูต้องใช้ (SCENE_ASSETS["menu"])
+    - ชุดอื่นโหลดตอนเรียก getter ครั้งแรก หรือ ensure() / prefetch() ล่วงหน้าตาม manifest
+    - prefetch() decode บน thread เบื้องหลัง แล้ว poll() / ensure() ค่อย convert บน main thread
+
+    งบหน่วยความจำ (ASSET_MEMORY_BUDGET_MB):
+    - นับ byte ของเฟรมที่ decode แล้วต่อชุด + หน้า atlas ทั้งหน้า, _frame_sets เรียงตามการใช้ล่าสุด (LRU)
+    - เกินงบ → ทิ้งชุดที่เก่าสุดที่ไม่ถูก pin (pin(keys) / unpin(keys) นับจำนวนครั้ง เช่น Game pin ชุดของด่านที่เล่นอยู่)
+    - ชุดที่อยู่ในหน้า atlas ถูกทิ้งเป็นหน้า: ทิ้งพร้อมทุกชุดที่ใช้หน้าเดียวกัน (ดู TextureAtlas.page_group)
+      ได้เฉพาะเมื่อไม่มีชุดไหนในกลุ่มถูก pin → หน้าถูกปล่อยทั้งหน้า ไม่มีพื้นที่ค้างกลางหน้า
+    - ชุดที่ถูกทิ้งโหลดใหม่เองตอนเรียก getter ครั้งถัดไป (ส่วนใหญ่มาจาก AssetCache → เร็ว)
+    - memory_stats() ให้ byte / hit / miss / eviction
     """
 
-    _images = {}
+    # LRU: ชุดที่เพิ่งใช้อยู่ท้ายสุด
+    _frame_sets: OrderedDict[str, list[pygame.Surface]] = OrderedDict()
+    _formats: dict[str, str] = {}       # key → FORMAT_* ที่ใช้ convert
     _sounds = {}
-    _explosion_frames = None
+    _masks = {}
+
+    # ทุกชุดเฟรมที่โหลดได้: key → (path ที่มีอยู่จริง, scale)
+    _jobs: dict[str, tuple[list[str], float]] = {}
+    _threads: int | None = None
+
+    # prefetch: key → Future ของ _prepare_frames (ยังไม่ convert)
+    _prefetcher: ThreadPoolExecutor | None = None
+    _pending: dict = {}
+
+    # งบหน่วยความจำ: byte ต่อชุด (ไม่นับเฟรมที่อยู่ในหน้า atlas) + จำนวน pin ต่อชุด
+    _budget_bytes: int | None = None
+    _set_bytes: dict[str, int] = {}
+    _pins: dict[str, int] = {}
+    _evicted: set[str] = set()
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _reloads = 0
+
+    # เฟรม sprite ทั้งหมดอยู่ในหน้า atlas (getter คืน subsurface) ดู TextureAtlas
+    _atlas: TextureAtlas | None = None
+
+    # cache ของเฟรมที่ scale แล้ว (ดู AssetCache)
+    _cache: AssetCache | None = None
+    _rebuild_cache = False
+    _decoded_files = 0
+    _cache_hits = 0
+    _cache_misses = 0
+
+    # เวลาโหลด + cache hit/miss ของ init() ล่าสุด
+    load_report: dict = {}
 
     @classmethod
-    def init(cls):
-        """เรียกครั้งเดียวหลัง pygame.init() / pygame.mixer.init()"""
+    def init(
+        cls,
+        use_cache: bool = True,
+        rebuild_cache: bool = False,
+        threads: int | None = None,
+        lazy: bool | None = None,
+    ):
+        """
+        เรียกครั้งเดียวหลัง pygame.init() / pygame.mixer.init() (และหลัง set_mode)
+        - use_cache     : โหลดเฟรมที่ scale แล้วจาก ASSET_CACHE_DIR (ถ้ายังไม่เก่า)
+        - rebuild_cache : บังคับ decode + scale จากต้นฉบับใหม่ทั้งหมด แล้ว bake ทับ
+        - threads       : จำนวน thread ที่ใช้ decode (None = ASSET_LOADER_THREADS / เท่าจำนวน core)
+        - lazy          : True = โหลดแค่ของเมนู, False = โหลดทุกชุดตอนนี้เลย (None = ASSET_STREAMING)
+        """
+        started = time.perf_counter()
+        threads = threads or ASSET_LOADER_THREADS or os.cpu_count() or 1
+        if lazy is None:
+            lazy = ASSET_STREAMING
+
         base_dir = os.path.dirname(os.path.dirname(__file__))
         assets_dir = os.path.join(base_dir, "assets")
+        images_dir = os.path.join(assets_dir, "images")
+
+        cls._cache = AssetCache(os.path.join(base_dir, ASSET_CACHE_DIR)) if use_cache else None
+        cls._rebuild_cache = rebuild_cache
+        cls._threads = threads
+        cls._decoded_files = 0
+        cls._cache_hits = 0
+        cls._cache_misses = 0
+
+        cls.shutdown()
+        cls._frame_sets.clear()
+        cls._formats.clear()
+        cls._masks.clear()
+        cls._set_bytes.clear()
+        cls._pins.clear()
+        cls._evicted.clear()
+        cls._hits = 0
+        cls._misses = 0
+        cls._evictions = 0
+        cls._reloads = 0
+        budget_mb = ASSET_MEMORY_BUDGET_MB
+        cls._budget_bytes = None if budget_mb is None else int(budget_mb * 1024 * 1024)
+        cls._atlas = TextureAtlas(ATLAS_PAGE_SIZE, ATLAS_PADDING) if ATLAS_ENABLED else None
+        cls._jobs = {
+            key: ([path for path in paths if os.path.exists(path)], scale)
+            for key, (paths, scale) in cls._frame_set_jobs(images_dir).items()
+        }
 
         # --------------------------------------------------
-        # HERO: hero_01.png - hero_04.png
+        # ภาพ: lazy = ของเมนูก่อน / eager = ทุกชุด (decode / scale บน thread pool)
         # --------------------------------------------------
-        hero_dir = os.path.join(assets_dir, "images", "hero")
-        hero_frames = []
-        for i in range(1, 5):
-            path = os.path.join(hero_dir, f"hero_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                hero_frames.append(img)
-
-        hero_frames = scale_frames(hero_frames, HERO_SCALE)
-        cls._images["hero_frames"] = hero_frames
-        cls._images["hero"] = hero_frames[0] if hero_frames else None
+        if lazy:
+            cls.ensure(SCENE_ASSETS["menu"])
+        else:
+            cls.ensure(cls._jobs.keys())
 
         # --------------------------------------------------
-        # ENEMY: enemy_01.png - enemy_04.png
+        # SOUNDS
         # --------------------------------------------------
-        enemy_dir = os.path.join(assets_dir, "images", "enemy")
-        enemy_frames = []
-        for i in range(1, 5):
-            path = os.path.join(enemy_dir, f"enemy_0{i}.png")
+        sounds_dir = os.path.join(assets_dir, "sounds")
+
+        def load_sound(name):
+            path = os.path.join(sounds_dir, name)
             if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                enemy_frames.append(img)
+                return pygame.mixer.Sound(path)
+            return None
 
-        enemy_frames = scale_frames(enemy_frames, ENEMY_SCALE)
-        cls._images["enemy_frames"] = enemy_frames
-        cls._images["enemy"] = enemy_frames[0] if enemy_frames else None
+        cls._sounds["explosion"] = load_sound("explosion.wav")
+        cls._sounds["hit"]       = load_sound("hit.wav")
+        cls._sounds["bullet"]    = load_sound("bullet.wav")
+        cls._sounds["pickup"]    = load_sound("pickup.wav")
+        cls._sounds["laser"]     = load_sound("laser.wav")
 
-        # --------------------------------------------------
-        # BOSS: boss_01.png - boss_04.png
-        # --------------------------------------------------
-        boss_dir = os.path.join(assets_dir, "images", "boss")
-        boss_frames = []
-        for i in range(1, 5):
-            path = os.path.join(boss_dir, f"boss_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                boss_frames.append(img)
+        cls.load_report = {
+            "seconds": time.perf_counter() - started,
+            "cache_hits": cls._cache_hits,
+            "cache_misses": cls._cache_misses,
+            "decoded_files": cls._decoded_files,
+            "threads": threads,
+            "lazy": lazy,
+            "loaded_sets": len(cls._frame_sets),
+            "total_sets": len(cls._jobs),
+        }
 
-        boss_frames = scale_frames(boss_frames, BOSS_SCALE)
-        cls._images["boss_frames"] = boss_frames
-        cls._images["boss"] = boss_frames[0] if boss_frames else None
+    @staticmethod
+    def _frame_set_jobs(images_dir: str) -> dict[str, tuple[list[str], float]]:
+        """ทุกชุดเฟรมที่โหลดได้: key → (path ของแต่ละเฟรม, scale)"""
+        jobs = {}
 
-        # --------------------------------------------------
-        # METEOR: meteor_01.png - meteor_04.png
-        # --------------------------------------------------
-        meteor_dir = os.path.join(assets_dir, "images", "meteor")
-        meteor_frames = []
-        for i in range(1, 5):
-            path = os.path.join(meteor_dir, f"meteor_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                meteor_frames.append(img)
+        for key, (folder, pattern, count, scale) in FRAME_ASSETS.items():
+            paths = [os.path.join(images_dir, folder, pattern.format(i)) for i in range(1, count + 1)]
+            jobs[key] = (paths, scale)
 
-        meteor_frames = scale_frames(meteor_frames, METEOR_SCALE)
-        cls._images["meteor_frames"] = meteor_frames
+        jobs["bullet"] = ([os.path.join(images_dir, "bullet", "bullet_01.png")], BULLET_SCALE)
 
-        # --------------------------------------------------
-        # DRONE: drone_01.png - drone_04.png
-        # --------------------------------------------------
-        drone_dir = os.path.join(assets_dir, "images", "drone")
-        drone_frames = []
-        for i in range(1, 5):
-            path = os.path.join(drone_dir, f"drone_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                drone_frames.append(img)
+        for item_type, pattern in ITEM_PATTERNS.items():
+            paths = [os.path.join(images_dir, "item", pattern.format(i)) for i in range(1, 5)]
+            jobs[f"item_{item_type}"] = (paths, ITEM_SCALE)
 
-        drone_frames = scale_frames(drone_frames, DRONE_SCALE)
-        cls._images["drone_frames"] = drone_frames
+        # background ไม่ scale (ถ้าอยาก scale ให้เท่าหน้าจอ ก็ไปทำใน BackgroundManager แทนได้)
+        for i in range(1, 7):
+            key = f"bg_0{i}"
+            jobs[key] = ([os.path.join(images_dir, "background", f"{key}.png")], 1.0)
 
-        # --------------------------------------------------
-        # BULLET (Hero): bullet_01.png
-        # --------------------------------------------------
-        bullet_path = os.path.join(assets_dir, "images", "bullet", "bullet_01.png")
-        if os.path.exists(bullet_path):
-            bullet_img = pygame.image.load(bullet_path).convert_alpha()
-            cls._images["bullet"] = scale_image(bullet_img, BULLET_SCALE)
-        else:
-            cls._images["bullet"] = None
+        return jobs
 
-        # --------------------------------------------------
-        # BOSS BULLET: boss_bullet_01.png - boss_bullet_04.png
-        #   โฟลเดอร์: assets/images/boss_bullet/
-        # --------------------------------------------------
-        boss_bullet_dir = os.path.join(assets_dir, "images", "boss_bullet")
-        boss_bullet_frames = []
-        for i in range(1, 5):
-            path = os.path.join(boss_bullet_dir, f"boss_bullet_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                boss_bullet_frames.append(img)
+    # ------------------------------------------------------
+    #  โหลด / prefetch
+    # ------------------------------------------------------
+    @classmethod
+    def ensure(cls, keys):
+        """
+        ให้ชุดเฟรมใน keys พร้อมใช้ก่อน return
+        - ชุดที่ prefetch ค้างอยู่ → รอผลแล้ว convert
+        - ชุดที่เหลือ → decode / scale พร้อมกันบน thread pool (ดู _load_frame_sets)
+        """
+        missing = [key for key in keys if key not in cls._frame_sets]
+        if not missing:
+            return
+
+        for key in missing:
+            future = cls._pending.pop(key, None)
+            if future is not None:
+                cls._install(key, *future.result())
+
+        rest = [key for key in missing if key not in cls._frame_sets]
+        if rest:
+            cls._load_frame_sets(rest, cls._threads)
+
+        cls._enforce_budget(keep=keys)
 
-        boss_bullet_frames = scale_frames(boss_bullet_frames, BOSS_BULLET_SCALE)
-        cls._images["boss_bullet_frames"] = boss_bullet_frames
-        cls._images["boss_bullet"] = boss_bullet_frames[0] if boss_bullet_frames else None
+    @classmethod
+    def prefetch(cls, keys):
+        """เริ่ม decode ชุดเฟรมล่วงหน้าบน thread เบื้องหลัง (ไม่รอ)"""
+        for key in keys:
+            if key in cls._frame_sets or key in cls._pending or key not in cls._jobs:
+                continue
+            if cls._prefetcher is None:
+                cls._prefetcher = ThreadPoolExecutor(
+                    max_workers=ASSET_PREFETCH_THREADS,
+                    thread_name_prefix="asset-prefetch",
+                )
+            cls._pending[key] = cls._prefetcher.submit(cls._prepare_frames, key)
 
-        # --------------------------------------------------
-        # ITEM: item_single_0x.png / item_double_0x.png / item_shield_0x.png
-        # --------------------------------------------------
-        item_dir = os.path.join(assets_dir, "images", "item")
-        cls._images["item_frames"] = {}
-
-        item_patterns = {
-            "single": "item_single_0{}.png",
-            "double": "item_double_0{}.png",
-            "shield": "item_shield_0{}.png",
-            "speed":  "item_speed_0{}.png",
-            "laser":  "item_laser_0{}.png",
-            "buckshot": "item_buckshot_0{}.png",
-        }
+    @classmethod
+    def poll(cls) -> int:
+        """
+        เรียกทุกเฟรมจาก main thread: ติดตั้งชุดที่ prefetch เสร็จแล้ว (ไม่รอ)
+        return: จำนวนชุดที่ติดตั้งในรอบนี้
+        """
+        if not cls._pending:
+            return 0
+
+        done = [key for key, future in cls._pending.items() if future.done()]
+        for key in done:
+            cls._install(key, *cls._pending.pop(key).result())
+        if done:
+            cls._enforce_budget(keep=done)
+        return len(done)
 
-        for item_type, pattern in item_patterns.items():
-            frames = []
-            for i in range(1, 5):
-                path = os.path.join(item_dir, pattern.format(i))
-                if os.path.exists(path):
-                    img = pygame.image.load(path).convert_alpha()
-                    frames.append(img)
+    @classmethod
+    def shutdown(cls):
+        """หยุด prefetcher (งานที่ยังไม่เริ่มถูกยกเลิก)"""
+        if cls._prefetcher is not None:
+            cls._prefetcher.shutdown(wait=True, cancel_futures=True)
+            cls._prefetcher = None
+        cls._pending.clear()
 
-            frames = scale_frames(frames, ITEM_SCALE)
-            cls._images["item_frames"][item_type] = frames
+    @classmethod
+    def is_loaded(cls, key: str) -> bool:
+        return key in cls._frame_sets
 
-        # --------------------------------------------------
-        # SHIELD: shield_01.png - shield_04.png
-        # --------------------------------------------------
-        shield_dir = os.path.join(assets_dir, "images", "shield")
-        shield_frames = []
-        for i in range(1, 5):
-            path = os.path.join(shield_dir, f"shield_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                shield_frames.append(img)
+    # ------------------------------------------------------
+    #  งบหน่วยความจำ / LRU
+    # ------------------------------------------------------
+    @classmethod
+    def pin(cls, keys):
+        """ห้ามทิ้งชุดใน keys จนกว่าจะ unpin (เรียกซ้อนกันได้ ต้อง unpin เท่าจำนวนครั้งที่ pin)"""
+        for key in keys:
+            cls._pins[key] = cls._pins.get(key, 0) + 1
 
-        shield_frames = scale_frames(shield_frames, SHIELD_SCALE)
-        cls._images["shield_frames"] = shield_frames
+    @classmethod
+    def unpin(cls, keys):
+        for key in keys:
+            count = cls._pins.get(key, 0) - 1
+            if count > 0:
+                cls._pins[key] = count
+            else:
+                cls._pins.pop(key, None)
 
-        # --------------------------------------------------
-        # SPEED: speed_01.png - speed_04.png
-        # --------------------------------------------------
-        speed_dir = os.path.join(assets_dir, "images", "speed")
-        speed_frames = []
-        for i in range(1, 5):
-            path = os.path.join(speed_dir, f"speed_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                speed_frames.append(img)
+    @classmethod
+    def is_pinned(cls, key: str) -> bool:
+        return cls._pins.get(key, 0) > 0
 
-        speed_frames = scale_frames(speed_frames, SPEED_FLAME_SCALE)
-        cls._images["speed_frames"] = speed_frames
+    @classmethod
+    def in_atlas(cls, key: str) -> bool:
+        """มีเฟรมของชุดนี้อยู่ในหน้า atlas (ชุดแบบนี้ถูกทิ้งเป็นกลุ่มตามหน้า ดู _enforce_budget)"""
+        return cls._atlas is not None and cls._atlas.contains(key)
 
-        # --------------------------------------------------
-        # EXPLOSION: explosion_01.png - explosion_04.png
-        # --------------------------------------------------
-        explosion_dir = os.path.join(assets_dir, "images", "explosion")
-        explosion_frames = []
-        for i in range(1, 5):
-            path = os.path.join(explosion_dir, f"explosion_0{i}.png")
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                explosion_frames.append(img)
+    @classmethod
+    def _used_bytes(cls) -> int:
+        used = sum(cls._set_bytes.values())
+        if cls._atlas is not None:
+            used += cls._atlas.page_bytes()
+        return used
 
-        explosion_frames = scale_frames(explosion_frames, EXPLOSION_SCALE)
-        cls._explosion_frames = explosion_frames
-        cls._images["explosion_frames"] = explosion_frames
+    @classmethod
+    def trim(cls, keep=()) -> int:
+        """
+        ทิ้งชุดที่ไม่ได้ใช้นานที่สุด (ที่ไม่ถูก pin และไม่อยู่ใน keep) จนกว่าจะไม่เกินงบ
+        return: จำนวนชุดที่ทิ้ง
+        """
+        return cls._enforce_budget(keep)
 
-        # --------------------------------------------------
-        # BACKGROUND: bg_01.png - bg_06.png
-        # โฟลเดอร์: assets/images/background/bg_01.png, ...
-        # --------------------------------------------------
-        bg_dir = os.path.join(assets_dir, "images", "background")
+    @classmethod
+    def _enforce_budget(cls, keep=()) -> int:
+        budget = cls._budget_bytes
+        if budget is None:
+            return 0
+        used = cls._used_bytes()
+        if used <= budget:
+            return 0
+
+        keep = set(keep)
+        evicted = 0
+        for key in list(cls._frame_sets):
+            if used <= budget:
+                break
+            if key not in cls._frame_sets:
+                continue    # ถูกทิ้งไปพร้อมหน้า atlas ของชุดก่อนหน้าแล้ว
+
+            # ชุดใน atlas: ต้องทิ้งทุกชุดที่ใช้หน้าเดียวกัน หน้าถึงจะถูกปล่อยจริง
+            group = cls._atlas.page_group(key) if cls.in_atlas(key) else [key]
+            if any(k in keep or cls.is_pinned(k) for k in group):
+                continue
+            for k in group:
+                cls._evict(k)
+            evicted += len(group)
+            used = cls._used_bytes()
+        return evicted
 
-        for i in range(1, 7):
-            filename = f"bg_0{i}.png"     # bg_01.png ... bg_06.png
-            path = os.path.join(bg_dir, filename)
-            key = f"bg_0{i}"              # ใช้เรียกผ่าน ResourceManager.get_image("bg_01")
+    @classmethod
+    def _evict(cls, key: str):
+        frames = cls._frame_sets.pop(key)
+        for frame in frames:
+            cls._masks.pop(frame, None)
+        if cls._atlas is not None:
+            cls._atlas.remove(key)
+        cls._set_bytes.pop(key, None)
+        cls._evicted.add(key)
+        cls._evictions += 1
 
-            if os.path.exists(path):
-                img = pygame.image.load(path).convert_alpha()
-                # ถ้าอยาก scale ให้เท่าหน้าจอ ก็สามารถไปทำใน BackgroundManager แทนได้
-                cls._images[key] = img
-            else:
-                # ถ้าหาไฟล์ไม่เจอ จะไม่ใส่ภาพจริง แต่ใส่ None ไว้
-                cls._images[key] = None
+    @classmethod
+    def memory_stats(cls) -> dict:
+        """
+        {bytes, budget, sets, pinned, hits, misses, evictions, reloads, atlas_pages, atlas_bytes}
+        - bytes : byte ที่นับกับงบ = เฟรมที่ไม่ได้อยู่ใน atlas ของทุกชุดที่ยังโหลดอยู่ + atlas_bytes
+        - hits / misses : getter เจอชุดที่โหลดอยู่แล้ว / ต้องโหลดตอนนั้น
+        - reloads : ชุดที่เคยถูกทิ้งแล้วต้องโหลดใหม่
+        """
+        atlas = cls._atlas
+        return {
+            "bytes": cls._used_bytes(),
+            "budget": cls._budget_bytes,
+            "sets": len(cls._frame_sets),
+            "pinned": sum(1 for key in cls._frame_sets if cls.is_pinned(key)),
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "evictions": cls._evictions,
+            "reloads": cls._reloads,
+            "atlas_pages": len(atlas.pages) if atlas is not None else 0,
+            "atlas_bytes": atlas.page_bytes() if atlas is not None else 0,
+        }
 
-        # --------------------------------------------------
-        # SOUNDS
-        # --------------------------------------------------
-        sounds_dir = os.path.join(assets_dir, "sounds")
+    @classmethod
+    def atlas_manifest(cls) -> dict:
+        """ตำแหน่งเฟรมทุกชุดในหน้า atlas (ดู TextureAtlas.manifest)"""
+        if cls._atlas is None:
+            return {}
+        return cls._atlas.manifest()
 
-        def load_sound(name):
-            path = os.path.join(sounds_dir, name)
-            if os.path.exists(path):
-                return pygame.mixer.Sound(path)
-            return None
+    @classmethod
+    def asset_manifest(cls) -> dict:
+        """
+        {
+          "formats": { key: "opaque" / "colorkey" / "alpha" },   # ชุดที่โหลดอยู่
+          "atlas": atlas_manifest(),
+        }
+        """
+        return {
+            "formats": {key: cls._formats[key] for key in cls._frame_sets if key in cls._formats},
+            "atlas": cls.atlas_manifest(),
+        }
 
-        cls._sounds["explosion"] = load_sound("explosion.wav")
-        cls._sounds["hit"]       = load_sound("hit.wav")
-        cls._sounds["bullet"]    = load_sound("bullet.wav")
-        cls._sounds["pickup"]    = load_sound("pickup.wav")
-        cls._sounds["laser"]     = load_sound("laser.wav")
+    @classmethod
+    def write_asset_manifest(cls, path: str):
+        with open(path, "w") as f:
+            json.dump(cls.asset_manifest(), f, indent=1)
+
+    @classmethod
+    def _load_frame_sets(cls, keys: list[str], threads: int | None = None):
+        """
+        โหลดหลายชุดเฟรมพร้อมกัน
+        - worker (thread pool): อ่าน cache หรือ decode PNG + smoothscale + bake ลง cache
+          (งานพวกนี้ไม่แตะ display และ pygame ปล่อย GIL ระหว่างทำ)
+        - main thread: convert_alpha ทีละชุด เรียงตามลำดับ keys
+        → ผลลัพธ์เหมือนโหลดทีละไฟล์ทุกครั้ง ไม่ขึ้นกับจำนวน thread
+        """
+        workers = threads or os.cpu_count() or 1
+        if workers > 1 and len(keys) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(cls._prepare_frames, keys))
+        else:
+            results = [cls._prepare_frames(key) for key in keys]
+
+        for key, result in zip(keys, results):
+            cls._install(key, *result)
+
+    @classmethod
+    def _install(
+        cls,
+        key: str,
+        from_cache: bool,
+        frames: list[pygame.Surface],
+        fmt: str = FORMAT_ALPHA,
+        colorkey=None,
+    ):
+        """(main thread) convert เฟรมที่เตรียมไว้ + สร้าง mask แล้วเก็บเข้า _frame_sets"""
+        paths = cls._jobs.get(key, ([], 1.0))[0]
+        if paths and cls._cache is not None:
+            if from_cache:
+                cls._cache_hits += 1
+            else:
+                cls._cache_misses += 1
+        if not from_cache:
+            cls._decoded_files += len(paths)
+
+        frames = [convert_frame(frame, fmt, colorkey) for frame in frames]
+        cls._formats[key] = fmt
+
+        if not key.startswith("bg_"):
+            # ย้ายเข้า atlas → ใช้ subsurface แทน Surface แยกชิ้น
+            # (หน้า atlas เป็น per-pixel alpha → ชุดที่ทึบ / colorkey อยู่แยกเพื่อคง blit แบบเร็ว)
+            if cls._atlas is not None and fmt == FORMAT_ALPHA:
+                frames = cls._atlas.add(key, frames)
+
+            # MASKS: สร้าง mask ของทุกเฟรมไว้ครั้งเดียวตอนโหลด
+            # (node สลับแค่ reference ตอนเปลี่ยนเฟรม ไม่ต้อง from_surface ใหม่)
+            cls.get_masks(frames)
+
+        if key in cls._evicted:
+            cls._evicted.discard(key)
+            cls._reloads += 1
+
+        cls._frame_sets[key] = frames
+        # subsurface ของหน้า atlas ไม่มี pixel ของตัวเอง (นับรวมใน page_bytes แล้ว)
+        cls._set_bytes[key] = sum(
+            frame.get_width() * frame.get_height() * frame.get_bytesize()
+            for frame in frames
+            if frame.get_parent() is None
+        )
+
+    @classmethod
+    def _prepare_frames(cls, key: str) -> tuple:
+        """
+        (ทำงานใน worker thread) เตรียมชุดเฟรมที่ scale แล้ว ยังไม่ convert + เลือกรูปแบบ Surface
+        return: (มาจาก cache ไหม, เฟรม, FORMAT_*, colorkey)
+        """
+        paths, scale = cls._jobs.get(key, ([], 1.0))
+        if not paths:
+            return False, [], FORMAT_ALPHA, None
+
+        cache = cls._cache
+        fingerprint = None
+        frames = None
+        if cache is not None:
+            fingerprint = AssetCache.fingerprint(paths, scale)
+            if not cls._rebuild_cache:
+                frames = cache.read(key, fingerprint)
+
+        from_cache = frames is not None
+        if not from_cache:
+            frames = scale_frames([pygame.image.load(path) for path in paths], scale)
+            if cache is not None:
+                cache.store(key, fingerprint, frames)
+
+        return (from_cache, frames) + detect_format(frames)
 
     # ------------------------------------------------------
     #  Getter ต่าง ๆ
     # ------------------------------------------------------
+    @classmethod
+    def get_frames(cls, key: str) -> list[pygame.Surface]:
+        """ชุดเฟรมตาม key (โหลดตอนนี้ถ้ายังไม่เคยโหลด, ไม่มีไฟล์ = [])"""
+        frames = cls._frame_sets.get(key)
+        if frames is None:
+            cls._misses += 1
+            cls.ensure([key])
+            frames = cls._frame_sets.get(key, [])
+        else:
+            cls._hits += 1
+            cls._frame_sets.move_to_end(key)
+        return frames
+
     @classmethod
     def get_image(cls, key):
-        """ใช้กับภาพเดี่ยว เช่น 'hero', 'enemy', 'bullet'"""
-        return cls._images.get(key)
+        """ใช้กับภาพเดี่ยว เช่น 'hero', 'enemy', 'bullet', 'bg_01' (= เฟรมแรกของชุด)"""
+        frames = cls.get_frames(FIRST_FRAME_ALIASES.get(key, key))
+        return frames[0] if frames else None
 
     @classmethod
     def get_hero_frames(cls):
-        return cls._images.get("hero_frames", [])
+        return cls.get_frames("hero_frames")
 
     @classmethod
     def get_enemy_frames(cls):
-        return cls._images.get("enemy_frames", [])
+        return cls.get_frames("enemy_frames")
 
     @classmethod
     def get_boss_frames(cls):
-        return cls._images.get("boss_frames", [])
+        return cls.get_frames("boss_frames")
 
     @classmethod
     def get_meteor_frames(cls):
-        return cls._images.get("meteor_frames", [])
+        return cls.get_frames("meteor_frames")
 
     @classmethod
     def get_drone_frames(cls):
-        return cls._images.get("drone_frames", [])
+        return cls.get_frames("drone_frames")
 
     @classmethod
     def get_item_frames(cls, item_type):
-        return cls._images.get("item_frames", {}).get(item_type, [])
+        return cls.get_frames(f"item_{item_type}")
 
     @classmethod
     def get_shield_frames(cls):
-        return cls._images.get("shield_frames", [])
-    
+        return cls.get_frames("shield_frames")
+
     @classmethod
     def get_speed_frames(cls):
-        return cls._images.get("speed_frames", [])
+        return cls.get_frames("speed_frames")
 
     @classmethod
     def get_explosion_frames(cls):
-        return cls._explosion_frames
+        return cls.get_frames("explosion_frames")
 
     @classmethod
     def get_boss_bullet_frames(cls):
         """เฟรมของกระสุน Boss"""
-        return cls._images.get("boss_bullet_frames", [])
+        return cls.get_frames("boss_bullet_frames")
+
+    @classmethod
+    def get_mask(cls, surface: pygame.Surface) -> pygame.mask.Mask:
+        """
+        mask ของ surface (สร้างครั้งแรกครั้งเดียว แล้ว cache ไว้)
+        ใช้ได้กับ surface ที่สร้างเองนอก init ด้วย เช่น fallback ของกระสุนบอส
+        """
+        mask = cls._masks.get(surface)
+        if mask is None:
+            mask = pygame.mask.from_surface(surface)
+            cls._masks[surface] = mask
+        return mask
+
+    @classmethod
+    def get_masks(cls, frames) -> list:
+        """mask ของทุกเฟรม เรียงตรงกับ frames (frames[i] ↔ masks[i])"""
+        return [cls.get_mask(frame) for frame in frames]
 
     @classmethod
     def get_sound(cls, key):
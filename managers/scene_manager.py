@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import Optional, TYPE_CHECKING
 import pygame
 
+from managers.text_cache import TextCache
+
 from settings.game_constants import (
     GAME_STATE_PLAYING,
     GAME_STATE_GAME_OVER,
@@ -103,8 +105,9 @@ class MenuScene(SceneBase):
         center_x = screen.get_rect().centerx
         center_y = screen.get_rect().centery
 
-        title = self.title_font.render("SPACE SHOOTER", True, (255, 255, 255))
-        hint1 = self.hint_font.render(
+        title = TextCache.render(self.title_font, "SPACE SHOOTER", True, (255, 255, 255))
+        hint1 = TextCache.render(
+            self.hint_font,
             "Press ENTER or SPACE to Start",
             True,
             (255, 255, 0),
@@ -0,0 +1,104 @@
+# managers/sound_bus.py
+
+import pygame
+
+from settings.config import SCREEN_WIDTH, SOUND_BUS_VOLUME_STEP, SOUND_BUS_PAN
+from managers.sound_manager import SoundManager
+
+
+class _Pending:
+    __slots__ = ("sound", "volume", "max_simultaneous", "priority", "count", "x_total", "x_count")
+
+    def __init__(self, sound, volume, max_simultaneous, priority):
+        self.sound = sound
+        self.volume = volume
+        self.max_simultaneous = max_simultaneous
+        self.priority = priority
+        self.count = 0
+        self.x_total = 0.0
+        self.x_count = 0
+
+
+class SoundBus:
+    """
+    คิวเสียงต่อ tick: ระหว่าง tick ใครจะเล่นเสียงก็ emit() เข้าคิวไว้ก่อน
+    แล้ว flush() ท้าย tick ส่งเข้า SoundManager.play() ครั้งเดียวต่อเสียง
+
+        SoundBus.emit(explosion_sound, pos=meteor.rect.center, priority=5)   # ใน collision handler
+        SoundBus.flush()                                                    # ท้าย Game.update_world_playing
+
+    - เสียงเดียวกันหลายครั้งใน tick เดียว (buckshot โดนอุกาบาต 5 ลูก) → เล่น 1 เสียง
+      ดังขึ้น SOUND_BUS_VOLUME_STEP ต่อครั้งที่ซ้ำ (ไม่เกิน 1.0), priority = ค่าสูงสุดที่ emit มา
+    - pos = ตำแหน่งบนจอ → แพนซ้าย/ขวาตามค่าเฉลี่ยของ x (สูงสุด SOUND_BUS_PAN ที่ขอบจอ)
+    - ลำดับการเล่นตามลำดับที่ emit ครั้งแรก
+    """
+
+    _pending: dict = {}
+
+    emitted = 0
+    dispatched = 0
+
+    @classmethod
+    def emit(
+        cls,
+        sound: pygame.mixer.Sound | None,
+        pos=None,
+        priority: int = 0,
+        volume: float = 1.0,
+        max_simultaneous: int | None = None,
+    ):
+        if sound is None:
+            return
+
+        pending = cls._pending.get(sound)
+        if pending is None:
+            pending = _Pending(sound, volume, max_simultaneous, priority)
+            cls._pending[sound] = pending
+        else:
+            pending.volume = max(pending.volume, volume)
+            pending.priority = max(pending.priority, priority)
+
+        pending.count += 1
+        if pos is not None:
+            pending.x_total += pos[0]
+            pending.x_count += 1
+        cls.emitted += 1
+
+    @classmethod
+    def flush(cls):
+        """เล่นทุกเสียงที่ค้างใน tick นี้ผ่าน SoundManager แล้วล้างคิว"""
+        if not cls._pending:
+            return
+
+        for pending in cls._pending.values():
+            volume = min(1.0, pending.volume * (1.0 + SOUND_BUS_VOLUME_STEP * (pending.count - 1)))
+
+            pan = None
+            if SOUND_BUS_PAN and pending.x_count:
+                x = pending.x_total / pending.x_count
+                pan = max(-1.0, min(1.0, x / SCREEN_WIDTH * 2.0 - 1.0)) * SOUND_BUS_PAN
+
+            SoundManager.play(
+                pending.sound,
+                volume=volume,
+                max_simultaneous=pending.max_simultaneous,
+                priority=pending.priority,
+                pan=pan,
+            )
+            cls.dispatched += 1
+
+        cls._pending.clear()
+
+    @classmethod
+    def clear(cls):
+        """ทิ้งเสียงที่ค้าง (เช่นเริ่มเกมใหม่กลาง tick)"""
+        cls._pending.clear()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """{emitted, dispatched, coalesced: emit ที่ถูกรวมเข้ากับเสียงอื่นใน tick เดียวกัน}"""
+        return {
+            "emitted": cls.emitted,
+            "dispatched": cls.dispatched,
+            "coalesced": cls.emitted - cls.dispatched - sum(p.count for p in cls._pending.values()),
+        }
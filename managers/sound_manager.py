@@ -1,7 +1,9 @@
 # managers/sound_manager.py
 
+import heapq
+import itertools
+
 import pygame
-import time
 
 
 class SoundManager:
@@ -9,13 +11,33 @@ class SoundManager:
     ระบบจัดการเสียงแบบ SoundPool + Recycle Channel
     - จำกัดจำนวนเสียงชนิดเดียวกันที่เล่นพร้อมกัน (max_simultaneous)
     - เลือก channel ที่ว่าง หรือ recycle channel ที่ priority ต่ำสุด / เก่าสุด
+
+    play() ไม่ไล่ถาม channel ทุกช่อง (O(1) / O(log n) ต่อครั้ง):
+    - _free: set ของ channel ที่ว่าง
+    - _sound_channels: เสียง → set ของ channel ที่กำลังเล่นเสียงนั้น (นับ instance)
+    - _busy_heap: (priority, ลำดับที่เล่น, channel, generation) ของ channel ที่ไม่ว่าง
+      ตัวบนสุด = priority ต่ำสุด + เก่าสุด (รายการที่ generation ไม่ตรงแล้ว = ค้าง ข้ามไป)
+    - ทุก channel ตั้ง set_endevent(END_EVENT) ไว้ เสียงจบ → event (code = index ของ channel)
+      → on_channel_end() คืน channel เข้า _free
+      event ถูกส่งต่อมาจาก InputManager (bind_event) หรือเรียก pump() เองในลูปที่ไม่อ่าน event
     """
 
+    END_EVENT: int | None = None
+
     _initialized = False
     _channels: list[pygame.mixer.Channel] = []
     _channel_priority: list[int] = []
     _channel_sound: list[pygame.mixer.Sound | None] = []
-    _last_play_time: list[float] = []
+    _generation: list[int] = []
+
+    _free: set[int] = set()
+    _sound_channels: dict = {}
+    _busy_heap: list[tuple[int, int, int, int]] = []
+    _order = itertools.count()
+
+    plays = 0
+    steals = 0
+    limited = 0       # ไม่ได้เล่นเพราะเกิน max_simultaneous
 
     @classmethod
     def init(cls, num_channels: int = 32):
@@ -25,13 +47,38 @@ class SoundManager:
         if cls._initialized:
             return
 
+        if cls.END_EVENT is None:
+            cls.END_EVENT = pygame.event.custom_type()
+
         pygame.mixer.set_num_channels(num_channels)
         cls._channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        for ch in cls._channels:
+            ch.set_endevent(cls.END_EVENT)
+
         cls._channel_priority = [0] * num_channels
         cls._channel_sound = [None] * num_channels
-        cls._last_play_time = [0.0] * num_channels
+        cls._generation = [0] * num_channels
+        cls._free = {i for i, ch in enumerate(cls._channels) if not ch.get_busy()}
+        cls._sound_channels = {}
+        cls._busy_heap = []
+        cls._order = itertools.count()
+        cls.plays = 0
+        cls.steals = 0
+        cls.limited = 0
         cls._initialized = True
 
+    @classmethod
+    def shutdown(cls):
+        """หยุดทุกเสียง + ปลด endevent (เรียก init ใหม่ได้ เช่นเปลี่ยนจำนวน channel)"""
+        if not cls._initialized:
+            return
+        for ch in cls._channels:
+            ch.set_endevent()
+            ch.stop()
+        if cls.END_EVENT is not None:
+            pygame.event.clear(cls.END_EVENT)
+        cls._initialized = False
+
     @classmethod
     def play(
         cls,
@@ -39,6 +86,7 @@ class SoundManager:
         volume: float = 1.0,
         max_simultaneous: int | None = None,
         priority: int = 0,
+        pan: float | None = None,
     ):
         """
         เล่นเสียงโดยใช้ SoundPool
@@ -46,6 +94,7 @@ class SoundManager:
         - volume: 0.0 - 1.0
         - max_simultaneous: จำกัดจำนวน instance ของเสียงนี้ที่เล่นพร้อมกัน (None = ไม่จำกัด)
         - priority: ค่ามาก = สำคัญกว่า เมื่อจำเป็นต้องแย่ง channel
+        - pan: -1.0 (ซ้าย) ถึง 1.0 (ขวา), None = กลาง
         """
         if sound is None:
             return
@@ -55,32 +104,129 @@ class SoundManager:
 
         # จำกัดจำนวนเสียงชนิดเดียวกันที่เล่นพร้อมกัน
         if max_simultaneous is not None:
-            same_count = 0
-            for ch in cls._channels:
-                if ch.get_busy() and ch.get_sound() is sound:
-                    same_count += 1
-            if same_count >= max_simultaneous:
-                return
-
-        now = time.time()
-
-        # หาช่องว่างก่อน
-        selected_index = None
-        for idx, ch in enumerate(cls._channels):
-            if not ch.get_busy():
-                selected_index = idx
-                break
+            playing = cls._sound_channels.get(sound)
+            if playing is not None and len(playing) >= max_simultaneous:
+                # ครบโควตา → เช็คเฉพาะ channel ของเสียงนี้ว่าจบไปแล้วแต่ event ยังไม่มาหรือเปล่า
+                cls._reap(playing)
+                if len(playing) >= max_simultaneous:
+                    cls.limited += 1
+                    return
+
+        selected_index = cls._take_free()
 
         # ถ้าไม่มีช่องว่าง → เลือกช่องที่ priority ต่ำสุด และเก่าสุด
         if selected_index is None:
-            lowest_pri = min(cls._channel_priority)
-            candidates = [i for i, p in enumerate(cls._channel_priority) if p == lowest_pri]
-            selected_index = min(candidates, key=lambda i: cls._last_play_time[i])
+            selected_index = cls._take_lowest()
+            cls._release(selected_index)
+            cls.steals += 1
 
         ch = cls._channels[selected_index]
-        ch.set_volume(volume)
+        if pan:
+            ch.set_volume(volume * min(1.0, 1.0 - pan), volume * min(1.0, 1.0 + pan))
+        else:
+            ch.set_volume(volume)
         ch.play(sound)
 
         cls._channel_priority[selected_index] = priority
         cls._channel_sound[selected_index] = sound
-        cls._last_play_time[selected_index] = now
+        cls._sound_channels.setdefault(sound, set()).add(selected_index)
+        heapq.heappush(
+            cls._busy_heap,
+            (priority, next(cls._order), selected_index, cls._generation[selected_index]),
+        )
+        cls.plays += 1
+
+        # รายการค้างใน heap เยอะเกิน → สร้างใหม่จาก channel ที่ไม่ว่างจริง
+        if len(cls._busy_heap) > 4 * len(cls._channels):
+            cls._compact_heap()
+
+    # ------------------------------------------------
+    # End event
+    # ------------------------------------------------
+    @classmethod
+    def on_channel_end(cls, index: int):
+        """
+        channel index เล่นจบ (จาก END_EVENT)
+        event มาช้าได้: ถ้า channel ถูกเล่นเสียงใหม่ไปแล้ว (ยังไม่ว่าง) หรือคืนไปแล้ว → ไม่ทำอะไร
+        """
+        if not cls._initialized or not 0 <= index < len(cls._channels):
+            return
+        if index in cls._free or cls._channels[index].get_busy():
+            return
+        cls._release(index)
+        cls._free.add(index)
+
+    @classmethod
+    def handle_event(cls, event: pygame.event.Event):
+        cls.on_channel_end(getattr(event, "code", -1))
+
+    @classmethod
+    def pump(cls):
+        """อ่านเฉพาะ END_EVENT จากคิว (ใช้ในลูปที่ไม่ได้เรียก InputManager.handle_quit_events เช่น headless)"""
+        if not cls._initialized:
+            return
+        for event in pygame.event.get(cls.END_EVENT):
+            cls.handle_event(event)
+
+    # ------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------
+    @classmethod
+    def _take_free(cls) -> int | None:
+        free = cls._free
+        while free:
+            index = free.pop()
+            # channel ที่ถูกใช้จากที่อื่น (Sound.play() ตรง ๆ) → ไม่แย่ง, END_EVENT จะคืนมาเองตอนจบ
+            if not cls._channels[index].get_busy():
+                return index
+        return None
+
+    @classmethod
+    def _take_lowest(cls) -> int:
+        heap = cls._busy_heap
+        generation = cls._generation
+        while heap:
+            _, _, index, gen = heapq.heappop(heap)
+            if gen == generation[index]:
+                return index
+
+        # ทุก channel ถูกใช้จากนอก SoundManager → เลือกตัวแรกตามแบบเดิม
+        return 0
+
+    @classmethod
+    def _release(cls, index: int):
+        """ลบ channel ออกจากบัญชีเสียงที่กำลังเล่น (ไม่ได้ใส่คืน _free)"""
+        sound = cls._channel_sound[index]
+        if sound is not None:
+            playing = cls._sound_channels.get(sound)
+            if playing is not None:
+                playing.discard(index)
+                if not playing:
+                    del cls._sound_channels[sound]
+        cls._channel_sound[index] = None
+        cls._channel_priority[index] = 0
+        cls._generation[index] += 1
+
+    @classmethod
+    def _reap(cls, playing: set[int]):
+        for index in [i for i in playing if not cls._channels[i].get_busy()]:
+            cls._release(index)
+            cls._free.add(index)
+
+    @classmethod
+    def _compact_heap(cls):
+        generation = cls._generation
+        cls._busy_heap = [entry for entry in cls._busy_heap if entry[3] == generation[entry[2]]]
+        heapq.heapify(cls._busy_heap)
+
+    @classmethod
+    def stats(cls) -> dict:
+        """{channels, free, voices: จำนวนเสียงที่กำลังเล่น, plays, steals, limited}"""
+        return {
+            "channels": len(cls._channels),
+            "free": len(cls._free),
+            "voices": sum(len(playing) for playing in cls._sound_channels.values()),
+            "plays": cls.plays,
+            "steals": cls.steals,
+            "limited": cls.limited,
+        }
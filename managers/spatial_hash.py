@@ -0,0 +1,162 @@
+# managers/spatial_hash.py
+
+import pygame
+
+from settings.game_constants import COLLISION_CELL_SIZE
+
+
+class SpatialHash:
+    """
+    Broadphase แบบ uniform grid สำหรับ CollisionManager
+    - build() ครั้งเดียวต่อเฟรม จาก group ที่เป็นฝั่ง "เป้า" (enemies, meteors, ...)
+    - groupcollide() ทำงานเหมือน pygame.sprite.groupcollide ทุกอย่าง
+      (ลำดับผลลัพธ์ + dokill เหมือนเดิม) แต่เทียบเฉพาะ sprite ที่อยู่ cell เดียวกัน
+    - pair_tests นับจำนวนคู่ที่ถูกส่งไปเช็คละเอียด (narrowphase) ในเฟรมนั้น
+    """
+
+    def __init__(self, cell_size: int = COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self._grids: dict[pygame.sprite.AbstractGroup, dict] = {}
+        self._order: dict[pygame.sprite.AbstractGroup, dict] = {}
+        self.pair_tests = 0
+
+    # ------------------------------------------------
+    # สร้าง grid ใหม่ทั้งหมด (เรียกต้นเฟรม ก่อนเช็ค collision)
+    # ------------------------------------------------
+    def build(self, groups):
+        self._grids.clear()
+        self._order.clear()
+        self.pair_tests = 0
+
+        cs = self.cell_size
+        for group in groups:
+            grid = {}
+            order = {}
+            for index, sprite in enumerate(group.sprites()):
+                order[sprite] = index
+                left, top, right, bottom = self._bounds(sprite)
+                for cx in range(left // cs, max(left, right - 1) // cs + 1):
+                    for cy in range(top // cs, max(top, bottom - 1) // cs + 1):
+                        cell = grid.get((cx, cy))
+                        if cell is None:
+                            grid[(cx, cy)] = [sprite]
+                        else:
+                            cell.append(sprite)
+
+            self._grids[group] = grid
+            self._order[group] = order
+
+    def is_indexed(self, group) -> bool:
+        """
+        group นี้ถูก index ไว้ และทุก sprite ที่อยู่ใน group ตอนนี้อยู่ใน grid
+        (ดูสมาชิกจริง ไม่ใช่แค่จำนวน: เพิ่ม 1 ลบ 1 หลัง build() จำนวนเท่าเดิมแต่ตัวใหม่ไม่อยู่ใน grid)
+        sprite ที่ถูกลบออกหลัง build() ไม่เป็นไร (_spritecollide ข้ามตัวที่ไม่อยู่ใน group แล้ว)
+        """
+        order = self._order.get(group)
+        return order is not None and group.spritedict.keys() <= order.keys()
+
+    # ------------------------------------------------
+    # แทน pygame.sprite.groupcollide
+    # ------------------------------------------------
+    def groupcollide(self, groupa, groupb, dokilla, dokillb, collided=None):
+        if not self.is_indexed(groupb):
+            # ไม่ได้ index ไว้ → ใช้แบบเดิม (เทียบทุกคู่)
+            self.pair_tests += len(groupa) * len(groupb)
+            return pygame.sprite.groupcollide(groupa, groupb, dokilla, dokillb, collided)
+
+        circle_radius = None
+        if collided is pygame.sprite.collide_circle and groupa:
+            # collide_circle ของ pygame จะ cache radius ลงใน sprite ทุกตัวที่ถูกเช็ค
+            # ต้องทำแบบเดียวกัน ไม่งั้นผลของเฟรมถัดไปจะต่างจาก groupcollide เดิม
+            circle_radius = self._cache_radii(groupb)
+
+        crashed = {}
+        for sprite in groupa.sprites():
+            collision = self._spritecollide(sprite, groupb, dokillb, collided, circle_radius)
+            if collision:
+                crashed[sprite] = collision
+                if dokilla:
+                    sprite.kill()
+        return crashed
+
+    # ------------------------------------------------
+    # ภายใน
+    # ------------------------------------------------
+    def _spritecollide(self, sprite, group, dokill, collided, circle_radius):
+        order = self._order[group]
+        candidates = self._candidates(sprite, group, collided, circle_radius)
+        if not candidates:
+            return []
+
+        crashed = []
+        for other in sorted(candidates, key=order.__getitem__):
+            # ถูก kill ไปแล้วในเฟรมนี้ (เช่นโดนกระสุนนัดก่อนหน้า)
+            if other not in group:
+                continue
+
+            self.pair_tests += 1
+            if collided is not None:
+                hit = collided(sprite, other)
+            else:
+                hit = sprite.rect.colliderect(other.rect)
+
+            if hit:
+                if dokill:
+                    other.kill()
+                crashed.append(other)
+        return crashed
+
+    def _candidates(self, sprite, group, collided, circle_radius) -> set:
+        if circle_radius is not None:
+            # วงกลมชนกันได้ถ้าจุดศูนย์กลางห่างไม่เกินผลรวมรัศมี
+            radius = self._radius(sprite) + circle_radius
+            cx, cy = sprite.rect.center
+            left, top = int(cx - radius), int(cy - radius)
+            right, bottom = int(cx + radius) + 1, int(cy + radius) + 1
+        else:
+            left, top, right, bottom = self._bounds(sprite)
+
+        cs = self.cell_size
+        grid = self._grids[group]
+        found = set()
+        for cx in range(left // cs, max(left, right - 1) // cs + 1):
+            for cy in range(top // cs, max(top, bottom - 1) // cs + 1):
+                cell = grid.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return found
+
+    @staticmethod
+    def _bounds(sprite):
+        """ขอบเขตที่ครอบทั้ง rect และ mask (collide_mask ใช้ขนาดของ mask)"""
+        rect = sprite.rect
+        mask = getattr(sprite, "mask", None)
+        if mask is not None:
+            w, h = mask.get_size()
+        else:
+            image = getattr(sprite, "image", None)
+            w, h = image.get_size() if image is not None else rect.size
+        return (
+            rect.left,
+            rect.top,
+            rect.left + max(rect.width, w),
+            rect.top + max(rect.height, h),
+        )
+
+    @staticmethod
+    def _radius(sprite) -> float:
+        radius = getattr(sprite, "radius", None)
+        if radius is None:
+            rect = sprite.rect
+            radius = 0.5 * ((rect.width ** 2 + rect.height ** 2) ** 0.5)
+        return radius
+
+    @classmethod
+    def _cache_radii(cls, group) -> float:
+        max_radius = 0.0
+        for sprite in group:
+            if not hasattr(sprite, "radius"):
+                sprite.radius = cls._radius(sprite)
+            if sprite.radius > max_radius:
+                max_radius = sprite.radius
+        return max_radius
@@ -6,6 +6,9 @@ from nodes.item_node import ItemNode
 from nodes.speed_item_node import SpeedItemNode
 from nodes.laser_item_node import LaserItemNode
 from nodes.buckshot_item_node import BuckshotItemNode 
+from managers.pool_manager import PoolManager
+from managers.resource_manager import ResourceManager
+from settings.asset_manifest import stage_assets
 
 
 class SpawnManager:
@@ -25,9 +28,14 @@ class SpawnManager:
         }
     """
 
-    def __init__(self, stage_configs: dict, initial_stage: int = 1):
+    def __init__(self, stage_configs: dict, initial_stage: int = 1, rng=None):
+        """
+        rng: random.Random ตัวเดียวที่ใช้สุ่มทุกอย่างตอน spawn
+             (ส่ง seed เดิม → spawn ออกมาเหมือนเดิมทุกครั้ง, None = ใช้ module random)
+        """
         self.stage_configs = stage_configs
         self.current_stage = None
+        self.rng = rng if rng is not None else random
 
         # ตัวแปร timer ภายใน
         self.meteor_timer = 0.0
@@ -50,6 +58,10 @@ class SpawnManager:
         self.item_interval   = cfg.get("item_interval", 5.0)
         self.item_weights    = cfg.get("item_weights", {"single": 1.0})
 
+        # โหลดภาพของด่านนี้ (item / บอส) + ด่านถัดไปล่วงหน้าบน thread เบื้องหลัง
+        ResourceManager.prefetch(stage_assets(stage))
+        ResourceManager.prefetch(stage_assets(stage + 1))
+
         # reset timer ให้เริ่มนับใหม่
         self.meteor_timer = 0.0
         self.item_timer   = 0.0
@@ -63,7 +75,7 @@ class SpawnManager:
         self.meteor_timer -= dt
         if self.meteor_timer <= 0:
             self.meteor_timer += self.meteor_interval
-            meteors_group.add(MeteorNode())
+            meteors_group.add(PoolManager.acquire(MeteorNode, self.rng))
 
         # ----------------- Item -------------------
         self.item_timer -= dt
@@ -73,19 +85,19 @@ class SpawnManager:
             # สุ่มชนิดไอเท็มตาม weights ของด่าน
             types = list(self.item_weights.keys())
             weights = list(self.item_weights.values())
-            item_type = random.choices(types, weights=weights, k=1)[0]
+            item_type = self.rng.choices(types, weights=weights, k=1)[0]
 
             # แปลง item_type → instance จริง
             if item_type in ("single", "double", "shield"):
-                item = ItemNode(item_type)
+                item = ItemNode(item_type, rng=self.rng)
             elif item_type == "speed":
-                item = SpeedItemNode()
+                item = SpeedItemNode(rng=self.rng)
             elif item_type == "laser":
-                item = LaserItemNode()
+                item = LaserItemNode(rng=self.rng)
             elif item_type == "buckshot":
-                item = BuckshotItemNode()
+                item = BuckshotItemNode(rng=self.rng)
             else:
                 # กันพังกรณี config พิมพ์ผิด
-                item = ItemNode("single")
+                item = ItemNode("single", rng=self.rng)
 
             items_group.add(item)
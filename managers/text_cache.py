@@ -0,0 +1,123 @@
+# managers/text_cache.py
+
+import re
+from collections import OrderedDict
+
+import pygame
+
+from settings.config import TEXT_CACHE_SIZE
+
+_DIGIT_SPLIT = re.compile(r"[0-9]|[^0-9]+")
+
+
+class TextCache:
+    """
+    cache ของ Surface ข้อความ (แทน font.render ทุกเฟรม)
+
+        TextCache.render(font, "PAUSED", True, (255, 255, 0))         # ข้อความคงที่
+        TextCache.render_numeric(font, f"Score: {score}", True, WHITE)  # ข้อความที่มีตัวเลขเปลี่ยนบ่อย
+
+    - key = (font, text, antialias, color), เก็บได้ TEXT_CACHE_SIZE รายการ เกินแล้วทิ้งอันที่ไม่ได้ใช้นานสุด (LRU)
+    - render_numeric(): ข้อความทั้งบรรทัดเคยวาดแล้ว = ได้จาก cache เลย
+      ไม่เคย → ประกอบจากชิ้นที่ cache ไว้: ตัวเลขทีละหลัก (ตาราง 0-9 ต่อ font / สี ใช้ซ้ำได้ทุกค่า) + ข้อความระหว่างตัวเลข
+      → คะแนนเปลี่ยนทุกเฟรมก็ไม่ต้องเรียก font.render อีก (ระยะห่างตัวอักษรอาจต่างจาก render ทั้งบรรทัด 1-2 px)
+    - Surface ที่คืนให้ใช้ร่วมกัน ห้ามวาดทับ
+    """
+
+    _entries: OrderedDict = OrderedDict()
+    _glyphs: dict = {}          # (font, antialias, color) → {'0'-'9': Surface}
+
+    hits = 0
+    misses = 0
+    evictions = 0
+    font_renders = 0
+
+    @classmethod
+    def render(cls, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color))
+        surface = cls._entries.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._entries.move_to_end(key)
+            return surface
+
+        cls.misses += 1
+        cls.font_renders += 1
+        surface = font.render(text, antialias, color)
+        cls._store(key, surface)
+        return surface
+
+    @classmethod
+    def render_numeric(cls, font: pygame.font.Font, text: str, antialias: bool, color) -> pygame.Surface:
+        key = (font, text, antialias, tuple(color))
+        surface = cls._entries.get(key)
+        if surface is not None:
+            cls.hits += 1
+            cls._entries.move_to_end(key)
+            return surface
+
+        cls.misses += 1
+        glyphs = cls._digit_glyphs(font, antialias, key[3])
+        parts = [
+            glyphs[part] if part in glyphs else cls.render(font, part, antialias, color)
+            for part in _split_digits(text)
+        ]
+        if len(parts) <= 1:
+            surface = parts[0] if parts else cls.render(font, text, antialias, color)
+        else:
+            width = 0
+            height = 0
+            blits = []
+            for part in parts:
+                w, h = part.get_size()
+                blits.append((part, (width, 0), None, pygame.BLEND_RGBA_MAX))
+                width += w
+                height = max(height, h)
+
+            # Surface ใหม่ใสทั้งแผ่นอยู่แล้ว + รูปแบบ pixel เดียวกับที่ font.render คืนมา (ไม่ต้อง convert / fill)
+            # ชิ้นไม่ทับกัน + ชิดบนเหมือนกันทุกชิ้น (font.render วาดจาก ascent ลงมา) → copy ตรง ๆ ด้วย RGBA_MAX
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            surface.blits(blits, doreturn=False)
+
+        cls._store(key, surface)
+        return surface
+
+    @classmethod
+    def _digit_glyphs(cls, font: pygame.font.Font, antialias: bool, color: tuple) -> dict:
+        """ตาราง '0'-'9' → Surface ของ font / สีนี้ (ชุดละ 10 ภาพ ไม่นับรวมใน LRU)"""
+        style = (font, antialias, color)
+        glyphs = cls._glyphs.get(style)
+        if glyphs is None:
+            glyphs = {digit: font.render(digit, antialias, color) for digit in "0123456789"}
+            cls.font_renders += len(glyphs)
+            cls._glyphs[style] = glyphs
+        return glyphs
+
+    @classmethod
+    def _store(cls, key, surface: pygame.Surface):
+        entries = cls._entries
+        entries[key] = surface
+        while len(entries) > TEXT_CACHE_SIZE:
+            entries.popitem(last=False)
+            cls.evictions += 1
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._glyphs.clear()
+
+    @classmethod
+    def stats(cls) -> dict:
+        """{entries, hits, misses, evictions, font_renders}"""
+        return {
+            "entries": len(cls._entries),
+            "hits": cls.hits,
+            "misses": cls.misses,
+            "evictions": cls.evictions,
+            "font_renders": cls.font_renders,
+        }
+
+
+def _split_digits(text: str) -> list[str]:
+    """'Score: 120' → ['Score: ', '1', '2', '0'] (ตัวเลขแยกทีละหลัก)"""
+    return _DIGIT_SPLIT.findall(text)
@@ -0,0 +1,204 @@
+# managers/texture_atlas.py
+
+import pygame
+
+
+class _Shelf:
+    __slots__ = ("y", "height", "x")
+
+    def __init__(self, y: int, height: int):
+        self.y = y
+        self.height = height
+        self.x = 0
+
+
+class AtlasPage:
+    """
+    Surface ใหญ่ 1 หน้า + ตัวจัดวางแบบ shelf (เรียงเป็นแถว ๆ จากบนลงล่าง)
+    เพิ่มภาพทีละชุดได้เรื่อย ๆ จนกว่าจะเต็ม
+    """
+
+    def __init__(self, index: int, size: int, padding: int):
+        self.index = index
+        self.size = size
+        self.padding = padding
+        self.surface = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self._shelves: list[_Shelf] = []
+        self._next_y = 0
+        self.used_pixels = 0
+        self.live_sets = 0      # จำนวนชุดที่ยังมีเฟรมอยู่ในหน้านี้
+
+    def place(self, w: int, h: int) -> tuple[int, int] | None:
+        """หาตำแหน่งว่างขนาด w x h (คืน None ถ้าหน้านี้เต็ม)"""
+        pad = self.padding
+        need_w = w + pad
+        need_h = h + pad
+
+        # shelf ที่สูงพอและเตี้ยที่สุด (เปลืองที่น้อยสุด)
+        best = None
+        for shelf in self._shelves:
+            if need_h <= shelf.height and shelf.x + need_w <= self.size:
+                if best is None or shelf.height < best.height:
+                    best = shelf
+
+        if best is None:
+            if self._next_y + need_h > self.size or need_w > self.size:
+                return None
+            best = _Shelf(self._next_y, need_h)
+            self._shelves.append(best)
+            self._next_y += need_h
+
+        pos = (best.x, best.y)
+        best.x += need_w
+        self.used_pixels += w * h
+        return pos
+
+
+class TextureAtlas:
+    """
+    รวมเฟรมเล็ก ๆ หลายชุดไว้ใน Surface ใหญ่ไม่กี่หน้า (ATLAS_PAGE_SIZE)
+    แล้วคืน subsurface (view ที่ชี้ไปยัง pixel ของหน้าเดิม) แทนเฟรมเดิม
+
+        frames = atlas.add("hero_frames", frames)    # → subsurface ของหน้า atlas
+        atlas.manifest()                              # → ตำแหน่งทุกเฟรม (ใช้ debug / renderer อื่น)
+
+    - เฟรมที่ใหญ่กว่าหน้า atlas จะไม่ถูกรวม (คืน Surface เดิม)
+    - pixel ใน view ตรงกับเฟรมเดิมทุกจุด (copy ด้วย BLEND_RGBA_MAX ลงหน้าที่ใส)
+    - remove() ชุดสุดท้ายของหน้าไหน หน้านั้นถูกทิ้ง (คืน memory จริง)
+      แต่พื้นที่ของชุดที่ remove กลางหน้าไม่ถูกนำกลับมาใช้ → อย่าสลับ add / remove ชุดเดิมไปมา
+      จะคืนพื้นที่ต้อง remove ทั้ง page_group(key) (ResourceManager ทิ้งชุดใน atlas แบบนี้)
+    """
+
+    def __init__(self, page_size: int = 1024, padding: int = 1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages: list[AtlasPage] = []
+        self._next_index = 0
+
+        # key → [(หน้า, Rect), ...] เรียงตามเฟรม (None = ไม่ได้อยู่ใน atlas)
+        self._entries: dict[str, list] = {}
+
+    def add(self, key: str, frames: list[pygame.Surface]) -> list[pygame.Surface]:
+        views = []
+        entries = []
+
+        for frame in frames:
+            w, h = frame.get_size()
+            placed = self._place(w, h)
+            if placed is None:
+                views.append(frame)
+                entries.append(None)
+                continue
+
+            page, (x, y) = placed
+            page.surface.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+            rect = pygame.Rect(x, y, w, h)
+            views.append(page.surface.subsurface(rect))
+            entries.append((page.index, rect))
+
+        self.remove(key)
+        self._entries[key] = entries
+        for page in self._pages_of(entries):
+            page.live_sets += 1
+        return views
+
+    def _pages_of(self, entries) -> list[AtlasPage]:
+        indices = {entry[0] for entry in entries if entry is not None}
+        return [page for page in self.pages if page.index in indices]
+
+    def _place(self, w: int, h: int):
+        if w + self.padding > self.page_size or h + self.padding > self.page_size:
+            return None
+
+        for page in self.pages:
+            pos = page.place(w, h)
+            if pos is not None:
+                return page, pos
+
+        page = AtlasPage(self._next_index, self.page_size, self.padding)
+        self._next_index += 1
+        self.pages.append(page)
+        return page, page.place(w, h)
+
+    def contains(self, key: str) -> bool:
+        """มีเฟรมของชุดนี้อย่างน้อย 1 เฟรมอยู่ในหน้า atlas"""
+        entries = self._entries.get(key)
+        return entries is not None and any(entry is not None for entry in entries)
+
+    def page_group(self, key: str) -> list[str]:
+        """
+        ชุดที่ต้อง remove พร้อม key เพื่อให้ทุกหน้าที่ key ใช้อยู่ถูกปล่อยทั้งหน้า
+        (ชุดที่อยู่หน้าเดียวกัน + ชุดที่อยู่หน้าเดียวกับชุดพวกนั้นต่อไปเรื่อย ๆ) เรียงตามลำดับที่ add
+        """
+        page_sets: dict[int, list[str]] = {}
+        for other, entries in self._entries.items():
+            for index in {entry[0] for entry in entries if entry is not None}:
+                page_sets.setdefault(index, []).append(other)
+
+        group = {key}
+        todo = [key]
+        while todo:
+            entries = self._entries.get(todo.pop(), [])
+            for index in {entry[0] for entry in entries if entry is not None}:
+                for other in page_sets[index]:
+                    if other not in group:
+                        group.add(other)
+                        todo.append(other)
+
+        return [other for other in self._entries if other in group] or [key]
+
+    def remove(self, key: str):
+        """
+        ลืมตำแหน่งของชุดนี้ (พื้นที่ว่างกลางหน้าไม่ถูกนำกลับมาใช้)
+        หน้าที่ไม่เหลือชุดไหนแล้วถูกทิ้งทั้งหน้า (view ที่ยังมีคนถืออยู่ยังใช้ได้ต่อ)
+        """
+        entries = self._entries.pop(key, None)
+        if entries is None:
+            return
+
+        for page in self._pages_of(entries):
+            page.live_sets -= 1
+            if page.live_sets <= 0:
+                self.pages.remove(page)
+
+    def clear(self):
+        self.pages.clear()
+        self._entries.clear()
+        self._next_index = 0
+
+    def page_bytes(self) -> int:
+        """byte ของ pixel ทุกหน้าที่ยังถืออยู่ (ทั้งหน้า ไม่ใช่แค่ส่วนที่มีเฟรม)"""
+        return sum(
+            page.surface.get_width() * page.surface.get_height() * page.surface.get_bytesize()
+            for page in self.pages
+        )
+
+    def manifest(self) -> dict:
+        """
+        {
+          "page_size": ..., "pages": [index ของหน้าที่ยังอยู่, ...],
+          "frames": { key: [ {"page": i, "rect": [x, y, w, h]} หรือ None, ... ] }
+        }
+        """
+        return {
+            "page_size": self.page_size,
+            "pages": [page.index for page in self.pages],
+            "frames": {
+                key: [
+                    None if entry is None else {"page": entry[0], "rect": list(entry[1])}
+                    for entry in entries
+                ]
+                for key, entries in self._entries.items()
+            },
+        }
+
+    def stats(self) -> dict:
+        total = len(self.pages) * self.page_size * self.page_size
+        used = sum(page.used_pixels for page in self.pages)
+        return {
+            "pages": len(self.pages),
+            "sets": len(self._entries),
+            "frames": sum(len(entries) for entries in self._entries.values()),
+            "fill": used / total if total else 0.0,
+        }
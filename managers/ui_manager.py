@@ -2,6 +2,7 @@
 
 import pygame
 from settings.config import SCREEN_WIDTH
+from managers.text_cache import TextCache
 
 
 class UIManager:
@@ -17,6 +18,21 @@ class UIManager:
         self.font_small = font_small
         self.font_big = font_big
 
+        # overlay ของ profiler: วาดใหม่เฉพาะตอนข้อมูลเปลี่ยน (ดู draw_profiler)
+        self._profiler_font = pygame.font.Font(None, 20)
+        self._profiler_panel: pygame.Surface | None = None
+        self._profiler_version = -1
+
+        # HUD แบบ retained: Surface ที่ประกอบแล้ว + ค่าที่ใช้ประกอบ (ดู _draw_hud / _draw_boss_hp_bar)
+        self._hud_surface: pygame.Surface | None = None
+        self._hud_key = None
+        self._boss_surface: pygame.Surface | None = None
+        self._boss_key = None
+
+        self.hud_frames = 0
+        self.hud_recomposes = 0
+        self.boss_recomposes = 0
+
     # ----------------- Public API -----------------
 
     def render(
@@ -28,14 +44,13 @@ class UIManager:
         max_stage: int,
         bosses: pygame.sprite.Group,
         game_state: str,
-        drones=None,
-        shields=None,
-    ):
+    ) -> list[pygame.Rect]:
         """
         ฟังก์ชันหลัก เรียกจาก main เพื่อวาด HUD, Boss HP, GameOver / Win
+        return: rect ทุกส่วนที่วาดทับจอ (ใช้กับ DirtyRenderer)
         """
-        self._draw_hud(screen, hero, score, current_stage, drones, shields)
-        self._draw_boss_hp_bar(screen, bosses)
+        rects = self._draw_hud(screen, hero, score, current_stage)
+        rects.extend(self._draw_boss_hp_bar(screen, bosses))
 
         if game_state == "GAME_OVER":
             self._draw_game_over(screen, score, current_stage)
@@ -45,43 +60,82 @@ class UIManager:
             self._draw_pause(screen)
         elif game_state == "CONFIRM_QUIT":
             self._draw_confirm_quit(screen)
+        else:
+            return rects
 
+        # overlay กลางจอ → ถือว่าเปลี่ยนทั้งจอ
+        return [screen.get_rect()]
 
-    # ----------------- Internal helpers -----------------
 
-    def _draw_hud(self, screen, hero, score: int, current_stage: int, drones, shields):
+    def draw_profiler(self, screen: pygame.surface.Surface, rows: list[dict], version: int):
         """
-        วาด Stage, Score, และ 'จำนวนไอเท็มที่กำลังทำงานอยู่ในปัจจุบัน'
-        เช่น จำนวน Drone, จำนวน Shield, Speed / Laser / Buckshot ที่ Active อยู่
+        วาดตารางเวลาแต่ละส่วนของเฟรม (ms) มุมขวาบน
+        rows / version มาจาก Profiler.summary() / Profiler.summary_version
         """
-        if drones is None:
-            drones = []
-        if shields is None:
-            shields = []
-
-        hud_y = 10
+        if version != self._profiler_version or self._profiler_panel is None:
+            self._profiler_panel = self._build_profiler_panel(rows)
+            self._profiler_version = version
 
-        # Stage
-        text_stage = self.font_small.render(
-            f"Stage: {current_stage}", True, (255, 255, 255)
-        )
-        screen.blit(text_stage, (10, hud_y))
+        panel_rect = self._profiler_panel.get_rect(topright=(SCREEN_WIDTH - 10, 10))
+        screen.blit(self._profiler_panel, panel_rect)
 
-        # Score
-        hud_y += 25
-        text_score = self.font_small.render(
-            f"Score: {score}", True, (255, 255, 255)
-        )
-        screen.blit(text_score, (10, hud_y))
-
-        # ---------- นับสถานะปัจจุบันของไอเท็ม ----------
+    # ----------------- Internal helpers -----------------
 
-        # 1) นับ Drone ที่เป็นของ Hero นี้
-        drone_count = 0
-        for d in drones:
-            owner = getattr(d, "hero", None)
-            if owner is hero and d.alive():
-                drone_count += 1
+    def _build_profiler_panel(self, rows: list[dict]) -> pygame.Surface:
+        font = self._profiler_font
+        name_width = 150
+        col_width = 52
+        line_height = font.get_linesize()
+
+        lines = [("section", "p50", "p95", "p99")]
+        for row in rows:
+            lines.append((
+                row["name"],
+                f"{row['p50_ms']:.2f}",
+                f"{row['p95_ms']:.2f}",
+                f"{row['p99_ms']:.2f}",
+            ))
+
+        width = name_width + col_width * 3 + 12
+        height = line_height * len(lines) + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+
+        # ตัวเลขชิดขวาในแต่ละคอลัมน์ (font ปกติไม่ใช่ monospace)
+        for i, (name, *values) in enumerate(lines):
+            y = 4 + i * line_height
+            panel.blit(font.render(name, True, (200, 255, 200)), (6, y))
+            for col, value in enumerate(values):
+                text = font.render(value, True, (200, 255, 200))
+                right = 6 + name_width + col_width * (col + 1)
+                panel.blit(text, text.get_rect(topright=(right, y)))
+        return panel
+
+    def hud_stats(self) -> dict:
+        """{frames, recomposes, boss_recomposes}: จำนวนเฟรมที่วาด HUD / จำนวนครั้งที่ต้องประกอบ Surface ใหม่"""
+        return {
+            "frames": self.hud_frames,
+            "recomposes": self.hud_recomposes,
+            "boss_recomposes": self.boss_recomposes,
+        }
+
+    def _hud_state(self, hero, score: int, current_stage: int) -> tuple:
+        """
+        ค่าทั้งหมดที่แสดงบน HUD (ใช้เป็น fingerprint: เท่าเดิม = ภาพ HUD เท่าเดิม)
+        Stage, Score, และ 'จำนวนไอเท็มที่กำลังทำงานอยู่ในปัจจุบัน'
+        เช่น จำนวน Drone, จำนวน Shield, Speed / Laser / Buckshot ที่ Active อยู่
+        (อ่านจาก hero.loadout() ที่ Hero นับไว้เอง ไม่ต้องไล่ group drones / shields)
+        """
+        if hero is None:
+            drone_count = shield_count = 0
+            speed_active = False
+            weapon_mode = "normal"
+        else:
+            loadout = hero.loadout()
+            drone_count = loadout["drones"]
+            shield_count = loadout["shields"]
+            speed_active = loadout["speed"]
+            weapon_mode = loadout["weapon_mode"]
 
         # เดโม่ logic:
         # - single_count = จำนวน Drone ทั้งหมด (ยิงช่วยกี่กระบอก)
@@ -89,52 +143,96 @@ class UIManager:
         single_count = drone_count
         double_count = 1 if drone_count >= 2 else 0
 
-        # 2) Shield: จำนวน ShieldNode ที่ล้อม Hero
-        shield_count = 0
-        for s in shields:
-            owner = getattr(s, "hero", None)
-            if owner is hero and s.alive():
-                shield_count += 1
+        return (
+            current_stage,
+            score,
+            single_count,
+            double_count,
+            shield_count,
+            1 if speed_active else 0,
+            1 if weapon_mode == "laser" else 0,
+            1 if weapon_mode == "buckshot" else 0,
+        )
 
-        # 3) Speed: ใช้ speed_boost_time / speed_multiplier
-        speed_boost_time = getattr(hero, "speed_boost_time", 0.0)
-        speed_multiplier = getattr(hero, "speed_multiplier", 1.0)
-        speed_active = (speed_boost_time > 0.0) or (speed_multiplier > 1.0)
-        speed_count = 1 if speed_active else 0
+    def _draw_hud(self, screen, hero, score: int, current_stage: int):
+        """
+        วาด HUD มุมซ้ายบน (retained): เก็บภาพ HUD ไว้ 1 Surface
+        ประกอบใหม่เฉพาะเฟรมที่ค่าบน HUD เปลี่ยน (_hud_state) นอกนั้น blit Surface เดิมครั้งเดียว
+        """
+        state = self._hud_state(hero, score, current_stage)
+        self.hud_frames += 1
+        if state != self._hud_key or self._hud_surface is None:
+            self._hud_surface = self._compose_hud(state)
+            self._hud_key = state
+            self.hud_recomposes += 1
+
+        return [screen.blit(self._hud_surface, (10, 10))]
+
+    def _compose_hud(self, state: tuple) -> pygame.Surface:
+        (
+            current_stage,
+            score,
+            single_count,
+            double_count,
+            shield_count,
+            speed_count,
+            laser_count,
+            buckshot_count,
+        ) = state
+
+        lines = []
+        hud_y = 0
 
-        # 4) Laser: weapon_mode == "laser"
-        weapon_mode = getattr(hero, "weapon_mode", "normal")
-        laser_active = (weapon_mode == "laser")
-        laser_count = 1 if laser_active else 0
+        # Stage
+        text_stage = TextCache.render_numeric(
+            self.font_small,
+            f"Stage: {current_stage}", True, (255, 255, 255)
+        )
+        lines.append((text_stage, hud_y))
 
-        # 5) Buckshot: weapon_mode == "buckshot"
-        buckshot_active = (weapon_mode == "buckshot")
-        buckshot_count = 1 if buckshot_active else 0
+        # Score
+        hud_y += 25
+        text_score = TextCache.render_numeric(
+            self.font_small,
+            f"Score: {score}", True, (255, 255, 255)
+        )
+        lines.append((text_score, hud_y))
 
         # ---------- วาด HUD แสดงตัวเลข ----------
 
         hud_y += 25
         # บรรทัดแรก: อาวุธยิง + Shield
-        text_weapons_1 = self.font_small.render(
+        text_weapons_1 = TextCache.render(
+            self.font_small,
             f"Single: {single_count}  "
             f"Double: {double_count}  "
             f"Shield: {shield_count}",
             True,
             (255, 255, 255),
         )
-        screen.blit(text_weapons_1, (10, hud_y))
+        lines.append((text_weapons_1, hud_y))
 
         # บรรทัดสอง: Buff / Mode พิเศษ
         hud_y += 22
-        text_weapons_2 = self.font_small.render(
+        text_weapons_2 = TextCache.render(
+            self.font_small,
             f"Speed: {speed_count}  "
             f"Laser: {laser_count}  "
             f"Buck: {buckshot_count}",
             True,
             (255, 255, 255),
         )
-        screen.blit(text_weapons_2, (10, hud_y))
-
+        lines.append((text_weapons_2, hud_y))
+
+        # แต่ละบรรทัดไม่ทับกัน → copy ลง Surface ใสด้วย RGBA_MAX ได้ pixel เท่ากับ blit ลงจอตรง ๆ
+        width = max(text.get_width() for text, _ in lines)
+        height = max(y + text.get_height() for text, y in lines)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.blits(
+            [(text, (0, y), None, pygame.BLEND_RGBA_MAX) for text, y in lines],
+            doreturn=False,
+        )
+        return surface
 
     def _draw_boss_hp_bar(
         self,
@@ -145,18 +243,31 @@ class UIManager:
         แสดงแถบพลัง Boss:
         - ถ้ามี Boss อย่างน้อย 1 ตัวใน group → แสดง
         - ถ้าไม่มี Boss → ไม่แสดง
+        แถบถูกเก็บเป็น Surface เดียว ประกอบใหม่เฉพาะตอน HP เปลี่ยน
+        return: rect ที่วาด ([] = ไม่ได้วาด)
         """
         if len(bosses) == 0:
-            return
+            return []
 
         boss = next(iter(bosses))
 
         if not hasattr(boss, "hp") or not hasattr(boss, "max_hp"):
-            return
+            return []
         if boss.max_hp <= 0:
-            return
+            return []
+
+        state = (boss.hp, boss.max_hp)
+        if state != self._boss_key or self._boss_surface is None:
+            self._boss_surface = self._compose_boss_hp_bar(boss.hp, boss.max_hp)
+            self._boss_key = state
+            self.boss_recomposes += 1
+
+        bar_x = (SCREEN_WIDTH - self._boss_surface.get_width()) // 2
+        bar_y = 10  # อยู่ด้านบนสุดของหน้าจอ
+        return [screen.blit(self._boss_surface, (bar_x, bar_y))]
 
-        ratio = max(boss.hp, 0) / boss.max_hp  # 0.0 - 1.0
+    def _compose_boss_hp_bar(self, hp, max_hp) -> pygame.Surface:
+        ratio = max(hp, 0) / max_hp  # 0.0 - 1.0
 
         # เลือกสีตามเปอร์เซ็นต์ HP
         if ratio > 0.6:
@@ -168,54 +279,54 @@ class UIManager:
 
         bar_width = 300
         bar_height = 22
-        bar_x = (SCREEN_WIDTH - bar_width) // 2
-        bar_y = 10  # อยู่ด้านบนสุดของหน้าจอ
+
+        # แถบทึบทั้งแผ่น → Surface แบบไม่มี alpha
+        surface = pygame.Surface((bar_width, bar_height)).convert()
 
         # พื้นหลังแถบ (เทาเข้ม)
-        pygame.draw.rect(
-            screen,
-            (40, 40, 40),
-            (bar_x, bar_y, bar_width, bar_height),
-        )
+        surface.fill((40, 40, 40))
 
         # แถบพลังจริง
         pygame.draw.rect(
-            screen,
+            surface,
             bar_color,
-            (bar_x, bar_y, int(bar_width * ratio), bar_height),
+            (0, 0, int(bar_width * ratio), bar_height),
         )
 
         # กรอบเส้นขาว
         pygame.draw.rect(
-            screen,
+            surface,
             (255, 255, 255),
-            (bar_x, bar_y, bar_width, bar_height),
+            (0, 0, bar_width, bar_height),
             2,
         )
 
         # ข้อความ Boss HP ตรงกลางแถบ
-        hp_text = self.font_small.render(
-            f"Boss HP: {boss.hp}/{boss.max_hp}",
+        hp_text = TextCache.render_numeric(
+            self.font_small,
+            f"Boss HP: {hp}/{max_hp}",
             True,
             (255, 255, 255),
         )
-        hp_rect = hp_text.get_rect(
-            center=(SCREEN_WIDTH // 2, bar_y + bar_height // 2)
-        )
-        screen.blit(hp_text, hp_rect)
+        surface.blit(hp_text, hp_text.get_rect(center=(bar_width // 2, bar_height // 2)))
+        return surface
 
     def _draw_game_over(self, screen, score: int, current_stage: int):
         """วาดหน้าจอ Game Over กลางจอ"""
-        game_over_text = self.font_big.render(
+        game_over_text = TextCache.render(
+            self.font_big,
             "GAME OVER", True, (255, 50, 50)
         )
-        score_text = self.font_small.render(
+        score_text = TextCache.render_numeric(
+            self.font_small,
             f"Final Score: {score}", True, (255, 255, 255)
         )
-        stage_text = self.font_small.render(
+        stage_text = TextCache.render_numeric(
+            self.font_small,
             f"Reached Stage: {current_stage}", True, (255, 255, 255)
         )
-        hint_text = self.font_small.render(
+        hint_text = TextCache.render(
+            self.font_small,
             "Press R to Restart  |  Q to Quit",
             True,
             (255, 255, 0),
@@ -239,16 +350,20 @@ class UIManager:
 
     def _draw_game_win(self, screen, score: int, current_stage: int):
         """วาดหน้าจอ You Win กลางจอ"""
-        win_text = self.font_big.render(
+        win_text = TextCache.render(
+            self.font_big,
             "YOU WIN!", True, (80, 255, 80)
         )
-        score_text = self.font_small.render(
+        score_text = TextCache.render_numeric(
+            self.font_small,
             f"Final Score: {score}", True, (255, 255, 255)
         )
-        stage_text = self.font_small.render(
+        stage_text = TextCache.render(
+            self.font_small,
             f"All Stages Cleared ({current_stage})", True, (255, 255, 255)
         )
-        hint_text = self.font_small.render(
+        hint_text = TextCache.render(
+            self.font_small,
             "Press R to Play Again  |  Q to Quit",
             True,
             (255, 255, 0),
@@ -273,13 +388,16 @@ class UIManager:
 
     def _draw_pause(self, screen):
         """วาดหน้าจอ Pause กลางจอ"""
-        pause_text = self.font_big.render(
+        pause_text = TextCache.render(
+            self.font_big,
             "PAUSED", True, (255, 255, 0)
         )
-        hint_text1 = self.font_small.render(
+        hint_text1 = TextCache.render(
+            self.font_small,
             "Press R to Resume", True, (255, 255, 255)
         )
-        hint_text2 = self.font_small.render(
+        hint_text2 = TextCache.render(
+            self.font_small,
             "Press Q to Quit Game", True, (255, 255, 255)
         )
 
@@ -297,13 +415,16 @@ class UIManager:
 
     def _draw_confirm_quit(self, screen):
         """วาดหน้าจอถามยืนยันออกจากเกม"""
-        confirm_text = self.font_big.render(
+        confirm_text = TextCache.render(
+            self.font_big,
             "QUIT GAME?", True, (255, 80, 80)
         )
-        hint_text1 = self.font_small.render(
+        hint_text1 = TextCache.render(
+            self.font_small,
             "Press Y to Confirm", True, (255, 255, 255)
         )
-        hint_text2 = self.font_small.render(
+        hint_text2 = TextCache.render(
+            self.font_small,
             "Press N to Cancel", True, (255, 255, 255)
         )
 
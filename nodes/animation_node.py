@@ -1,6 +1,7 @@
 # nodes/animation_node.py
 
 import pygame
+from managers.resource_manager import ResourceManager
 
 class AnimationNode(pygame.sprite.Sprite):
     def __init__(self, states, default_state="default", use_mask=True):
@@ -16,7 +17,7 @@ class AnimationNode(pygame.sprite.Sprite):
                 ...
             }
         default_state: ชื่อ state เริ่มต้น เช่น "default"
-        use_mask: ถ้า True จะสร้าง mask จากภาพ (ใช้กับ collide_mask)
+        use_mask: ถ้า True จะใช้ mask ของแต่ละเฟรม (ใช้กับ collide_mask)
         """
         super().__init__()
 
@@ -55,8 +56,11 @@ class AnimationNode(pygame.sprite.Sprite):
         self.finished = False
 
         if self.use_mask:
-            self.mask = pygame.mask.from_surface(self.image)
+            # mask ของทุกเฟรมสร้างไว้แล้วใน ResourceManager
+            self.masks = ResourceManager.get_masks(self.frames)
+            self.mask = self.masks[self.index]
         else:
+            self.masks = None
             self.mask = None
 
     def set_state(self, state_name, reset_frame=True):
@@ -104,7 +108,7 @@ class AnimationNode(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=old_center)
 
         if self.use_mask:
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self.masks[self.index]
 
     def update(self, dt, *args, **kwargs):
         """default behavior: แอนิเมชันอย่างเดียว (คลาสลูก override เองได้)"""
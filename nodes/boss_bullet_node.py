@@ -2,7 +2,9 @@
 
 import pygame
 from managers.resource_manager import ResourceManager
+from managers.pool_manager import PoolManager
 from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from settings.game_constants import PROJECTILE_LIFETIME
 
 
 class BossBulletNode(pygame.sprite.Sprite):
@@ -24,12 +26,21 @@ class BossBulletNode(pygame.sprite.Sprite):
             frames = [fallback]
 
         self.frames = frames
+
+        # mask สำหรับ collide_mask (สร้างไว้แล้วใน ResourceManager)
+        self.masks = ResourceManager.get_masks(self.frames)
+
+        # แอนิเมชัน
+        self.frame_duration = 0.06  # วินาทีต่อเฟรม
+
+        self.reset(start_pos, direction, speed)
+
+    def reset(self, start_pos, direction: pygame.Vector2, speed: float = 250.0):
+        """ยิงกระสุนใหม่จาก start_pos (ใช้ตอนสร้าง และตอนดึงกลับมาจาก pool)"""
         self.frame_index = 0
         self.image = self.frames[self.frame_index]
         self.rect = self.image.get_rect(center=start_pos)
-
-        # mask สำหรับ collide_mask (ถ้าต้องการใช้)
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = self.masks[self.frame_index]
 
         self.pos = pygame.Vector2(start_pos)
 
@@ -40,11 +51,12 @@ class BossBulletNode(pygame.sprite.Sprite):
             self.direction = pygame.Vector2(0, 1)
 
         self.speed = speed
-
-        # แอนิเมชัน
-        self.frame_duration = 0.06  # วินาทีต่อเฟรม
         self.time_since_last = 0.0
 
+        # สถานะที่ ProjectileGroup อ่านไปเก็บใน array
+        self.velocity = self.direction * self.speed
+        self.lifetime = PROJECTILE_LIFETIME
+
     def _update_animation(self, dt: float):
         if len(self.frames) <= 1:
             return
@@ -56,11 +68,11 @@ class BossBulletNode(pygame.sprite.Sprite):
             center = self.rect.center
             self.image = self.frames[self.frame_index]
             self.rect = self.image.get_rect(center=center)
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self.masks[self.frame_index]
 
     def update(self, dt: float):
         # อัปเดตตำแหน่ง
-        self.pos += self.direction * self.speed * dt
+        self.pos += self.velocity * dt
         self.rect.center = self.pos
 
         # อัปเดตแอนิเมชัน
@@ -74,3 +86,7 @@ class BossBulletNode(pygame.sprite.Sprite):
             or self.rect.top > SCREEN_HEIGHT
         ):
             self.kill()
+
+    def kill(self):
+        super().kill()
+        PoolManager.release(self)
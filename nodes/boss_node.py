@@ -5,6 +5,7 @@ from settings.config import SCREEN_WIDTH
 from managers.resource_manager import ResourceManager
 from nodes.animation_node import AnimationNode
 from nodes.boss_bullet_node import BossBulletNode
+from managers.pool_manager import PoolManager
 
 
 class BossNode(AnimationNode):
@@ -61,6 +62,9 @@ class BossNode(AnimationNode):
 
         self.rect = self.image.get_rect()
         self.rect.midtop = (SCREEN_WIDTH // 2, y)
+        # จุดกึ่งกลางแนวนอนจริงแบบ float (rect เป็น int → ขยับต่อ step ไม่ถึง 1 px จะถูกปัดทิ้ง / ปัดไม่เท่ากันซ้าย-ขวา)
+        # เก็บเป็น center เพราะ update_animation จัด rect ใหม่รอบ center เดิม
+        self.center_x = float(self.rect.centerx)
 
         # การเคลื่อนที่แนวนอน
         self.speed_x = speed_x
@@ -123,28 +127,34 @@ class BossNode(AnimationNode):
             spawn_left = left_base + pygame.Vector2(0, offset_y)
             dir_left = hero_pos - spawn_left
             if dir_left.length_squared() > 0:
-                bullet_left = BossBulletNode(spawn_left, dir_left, self.bullet_speed)
+                bullet_left = PoolManager.acquire(
+                    BossBulletNode, spawn_left, dir_left, self.bullet_speed
+                )
                 self.boss_bullet_group.add(bullet_left)
 
             # ขวา
             spawn_right = right_base + pygame.Vector2(0, offset_y)
             dir_right = hero_pos - spawn_right
             if dir_right.length_squared() > 0:
-                bullet_right = BossBulletNode(spawn_right, dir_right, self.bullet_speed)
+                bullet_right = PoolManager.acquire(
+                    BossBulletNode, spawn_right, dir_right, self.bullet_speed
+                )
                 self.boss_bullet_group.add(bullet_right)
 
     # ------------------ อัปเดตทุกเฟรม ------------------
     def update(self, dt: float):
         # เคลื่อนที่ซ้าย-ขวาด้านบนจอ
-        self.rect.x += self.direction * self.speed_x * dt
+        self.center_x += self.direction * self.speed_x * dt
 
         # เด้งกลับเมื่อชนขอบจอ
-        if self.rect.left < 0:
-            self.rect.left = 0
+        half_width = self.rect.width / 2
+        if self.center_x - half_width < 0:
+            self.center_x = half_width
             self.direction = 1
-        elif self.rect.right > SCREEN_WIDTH:
-            self.rect.right = SCREEN_WIDTH
+        elif self.center_x + half_width > SCREEN_WIDTH:
+            self.center_x = SCREEN_WIDTH - half_width
             self.direction = -1
+        self.rect.centerx = round(self.center_x)
 
         # ระบบยิง (นับถอยหลัง)
         self.fire_cooldown -= dt
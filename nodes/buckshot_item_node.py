@@ -10,6 +10,6 @@ class BuckshotItemNode(ItemNode):
     - ใช้ item_type = "buckshot"
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         # ItemNode จะใช้ item_type เพื่อตัดสินใจเลือกเฟรมจาก ResourceManager
-        super().__init__(item_type="buckshot")
+        super().__init__(item_type="buckshot", rng=rng)
@@ -1,17 +1,33 @@
 # nodes/bullet_node.py
 
 import pygame
-from settings.game_constants import BULLET_SPEED
+from settings.game_constants import BULLET_SPEED, PROJECTILE_LIFETIME
 from managers.resource_manager import ResourceManager
+from managers.pool_manager import PoolManager
 
 class BulletNode(pygame.sprite.Sprite):
     def __init__(self, pos):
         super().__init__()
         self.image = ResourceManager.get_image("bullet")
-        self.rect = self.image.get_rect(center=pos)
         self.speed = BULLET_SPEED
+        self.reset(pos)
+
+    def reset(self, pos):
+        """วางกระสุนใหม่ที่ pos (ใช้ตอนสร้าง และตอนดึงกลับมาจาก pool)"""
+        self.rect = self.image.get_rect(center=pos)
+
+        # สถานะที่ ProjectileGroup อ่านไปเก็บใน array
+        self.pos = pygame.Vector2(self.rect.center)
+        self.velocity = pygame.Vector2(0, -self.speed)
+        self.lifetime = PROJECTILE_LIFETIME
 
     def update(self, dt):
-        self.rect.y -= self.speed * dt
+        # ใช้เมื่ออยู่ใน Group ธรรมดา (ProjectileGroup จะขยับให้เองทั้งกลุ่ม)
+        self.pos += self.velocity * dt
+        self.rect.center = self.pos
         if self.rect.bottom < 0:
             self.kill()
+
+    def kill(self):
+        super().kill()
+        PoolManager.release(self)
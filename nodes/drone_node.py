@@ -10,6 +10,7 @@ from settings.game_constants import (
 from managers.resource_manager import ResourceManager
 from nodes.animation_node import AnimationNode
 from nodes.bullet_node import BulletNode  # หรือส่งคลาสจากข้างนอกก็ได้
+from managers.pool_manager import PoolManager
 
 
 class DroneNode(AnimationNode):
@@ -44,9 +45,10 @@ class DroneNode(AnimationNode):
         self.fire_cooldown = DRONE_FIRE_INTERVAL
         self.lifetime = DRONE_LIFETIME
 
-        # นับจำนวนอาวุธที่ Hero มีอยู่ตอนนี้
-        if hasattr(self.hero, "weapon_counts") and self.weapon_type in self.hero.weapon_counts:
-            self.hero.weapon_counts[self.weapon_type] += 1
+        # นับจำนวนอาวุธที่ Hero มีอยู่ตอนนี้ (คืนตอน kill)
+        self._equipped = hasattr(self.hero, "equip")
+        if self._equipped:
+            self.hero.equip(self.weapon_type)
 
     def _update_position(self):
         base_x = self.hero.rect.centerx
@@ -67,15 +69,14 @@ class DroneNode(AnimationNode):
         if self.fire_cooldown <= 0:
             self.fire_cooldown = DRONE_FIRE_INTERVAL
             bullet_pos = self.rect.midtop
-            bullet = BulletNode(bullet_pos)
+            bullet = PoolManager.acquire(BulletNode, bullet_pos)
             bullet_group.add(bullet)
 
     def kill(self):
         """ลบ Drone ออกจากเกม และอัปเดตจำนวนใน Hero"""
-        if hasattr(self.hero, "weapon_counts"):
-            wt = getattr(self, "weapon_type", None)
-            if wt in self.hero.weapon_counts and self.hero.weapon_counts[wt] > 0:
-                self.hero.weapon_counts[wt] -= 1
+        if self._equipped:
+            self._equipped = False
+            self.hero.unequip(self.weapon_type)
         super().kill()
 
     def update(self, dt, bullet_group=None):
@@ -1,6 +1,7 @@
 # nodes/explosion_node.py
 
 from nodes.animation_node import AnimationNode
+from managers.pool_manager import PoolManager
 
 class ExplosionNode(AnimationNode):
     def __init__(self, pos, frames, frame_duration=0.05):
@@ -16,5 +17,21 @@ class ExplosionNode(AnimationNode):
         super().__init__(states, default_state="default", use_mask=True)
         self.rect.center = pos
 
+    def reset(self, pos, frames, frame_duration=0.05):
+        """เริ่มระเบิดใหม่ที่ pos (ใช้ตอนดึงกลับมาจาก pool)"""
+        self.add_state(
+            "default",
+            frames,
+            frame_duration=frame_duration,
+            loop=False,
+            kill_on_end=True,
+        )
+        self.set_state("default", reset_frame=True)
+        self.rect.center = pos
+
     def update(self, dt):
         self.update_animation(dt)
+
+    def kill(self):
+        super().kill()
+        PoolManager.release(self)
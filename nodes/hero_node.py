@@ -45,12 +45,61 @@ class HeroNode(AnimationNode):
         self.weapon_mode = "normal"
         self.weapon_timer = 0.0         # เวลาที่เหลือของโหมดอาวุธพิเศษ
 
+        # ---------- EQUIPMENT REGISTRY ----------
+        # จำนวนของที่ติดตัว Hero อยู่ตอนนี้ (Drone / Shield / ไอพ่น) → อ่านได้ทันทีไม่ต้องไล่ group
+        # node แต่ละชนิดเรียก equip() ตอนสร้าง และ unequip() ตอน kill() (ครั้งเดียวต่อ node)
+        self.weapon_counts = {
+            "single": 0,        # DroneNode weapon_type="single"
+            "double": 0,        # DroneNode weapon_type="double"
+            "shield": 0,        # ShieldNode
+            "speed_flame": 0,   # SpeedFlameNode
+        }
+
     # -------------------------------------------------
     # Helper: ปรับ max_speed ตาม speed_multiplier
     # -------------------------------------------------
     def _update_max_speed(self):
         self.max_speed = self.base_max_speed * self.speed_multiplier
 
+    # -------------------------------------------------
+    # Equipment registry
+    # -------------------------------------------------
+    def equip(self, kind: str):
+        """ของชนิด kind ติดตัว Hero เพิ่ม 1 ชิ้น"""
+        self.weapon_counts[kind] = self.weapon_counts.get(kind, 0) + 1
+
+    def unequip(self, kind: str):
+        """ของชนิด kind หลุด / หมดอายุ 1 ชิ้น"""
+        if self.weapon_counts.get(kind, 0) > 0:
+            self.weapon_counts[kind] -= 1
+
+    def equipment_count(self, kind: str) -> int:
+        return self.weapon_counts.get(kind, 0)
+
+    @property
+    def drone_count(self) -> int:
+        return self.weapon_counts["single"] + self.weapon_counts["double"]
+
+    @property
+    def shield_count(self) -> int:
+        return self.weapon_counts["shield"]
+
+    @property
+    def speed_active(self) -> bool:
+        return self.speed_boost_time > 0.0 or self.speed_multiplier > 1.0
+
+    def loadout(self) -> dict:
+        """
+        สรุปของที่ Hero มีตอนนี้ (O(1) ไม่ต้องไล่ group ไหน)
+        {"drones", "shields", "speed", "weapon_mode"}
+        """
+        return {
+            "drones": self.drone_count,
+            "shields": self.shield_count,
+            "speed": self.speed_active,
+            "weapon_mode": self.weapon_mode,
+        }
+
     # -------------------------------------------------
     # เรียกตอนเก็บไอเท็ม SPEED
     # -------------------------------------------------
@@ -67,9 +116,13 @@ class HeroNode(AnimationNode):
         self.is_speed_active = True
         self._update_max_speed()
 
-        # ถ้ายังไม่มีไอพ่น หรืออันเดิมตายแล้ว → สร้างใหม่
+        # ถ้ายังไม่มีไอพ่น หรืออันเดิมตายแล้ว → สร้างใหม่ (คนเรียกเอาไปใส่ group เอง)
         if self.speed_flame is None or not self.speed_flame.alive():
+            if self.speed_flame is not None:
+                self.speed_flame.kill()     # คืนช่องใน weapon_counts ของอันเดิม
             self.speed_flame = SpeedFlameNode(self)
+        # ไอพ่นต้องอยู่อย่างน้อยจนหมด buff (buff หมด → ปิดไอพ่นใน update)
+        self.speed_flame.lifetime = max(self.speed_flame.lifetime, self.speed_boost_time)
 
     # -------------------------------------------------
     # เรียกตอนเก็บไอเท็ม Laser
@@ -134,7 +187,7 @@ class HeroNode(AnimationNode):
                 self._update_max_speed()
 
                 # ปิดไอพ่น
-                if self.speed_flame is not None and self.speed_flame.alive():
+                if self.speed_flame is not None:
                     self.speed_flame.kill()
                 self.speed_flame = None
             else:
@@ -13,10 +13,12 @@ ITEM_SPAWN_MARGIN_X = 60
 
 
 class ItemNode(AnimationNode):
-    def __init__(self, item_type):
+    def __init__(self, item_type, rng=None):
         """
         item_type: "single", "double", "shield" ฯลฯ
+        rng      : random.Random ที่ใช้สุ่มตำแหน่ง (None = ใช้ module random)
         """
+        rng = rng if rng is not None else random
         self.type = item_type
 
         frames = ResourceManager.get_item_frames(self.type)
@@ -45,7 +47,7 @@ class ItemNode(AnimationNode):
         if min_x >= max_x:
             start_x = SCREEN_WIDTH // 2
         else:
-            start_x = random.randint(min_x, max_x)
+            start_x = rng.randint(min_x, max_x)
 
         self.rect.midbottom = (start_x, 0)
 
@@ -10,5 +10,5 @@ class LaserItemNode(ItemNode):
     - ใช้ item_type = "laser"
     """
 
-    def __init__(self):
-        super().__init__(item_type="laser")
+    def __init__(self, rng=None):
+        super().__init__(item_type="laser", rng=rng)
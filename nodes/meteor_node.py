@@ -5,6 +5,7 @@ import random
 from settings.config import SCREEN_WIDTH, SCREEN_HEIGHT
 from settings.game_constants import METEOR_SPEED
 from managers.resource_manager import ResourceManager
+from managers.pool_manager import PoolManager
 from nodes.animation_node import AnimationNode
 
 
@@ -13,7 +14,10 @@ METEOR_SPAWN_MARGIN_X = 60
 
 
 class MeteorNode(AnimationNode):
-    def __init__(self):
+    def __init__(self, rng=None):
+        """
+        rng: random.Random ที่ใช้สุ่มตำแหน่ง (None = ใช้ module random)
+        """
         meteor_frames = ResourceManager.get_meteor_frames()
         states = {
             "default": {
@@ -26,6 +30,14 @@ class MeteorNode(AnimationNode):
 
         super().__init__(states, default_state="default", use_mask=True)
 
+        self.speed = METEOR_SPEED
+        self.reset(rng)
+
+    def reset(self, rng=None):
+        """วางอุกาบาตใหม่เหนือขอบจอ (ใช้ตอนสร้าง และตอนดึงกลับมาจาก pool)"""
+        self.rng = rng if rng is not None else random
+        self.set_state("default", reset_frame=True)
+
         # ให้รู้ขนาดตัว sprite ก่อน แล้วค่อยสุ่ม x แบบเว้นขอบจอ
         self.rect = self.image.get_rect()
 
@@ -37,12 +49,11 @@ class MeteorNode(AnimationNode):
         if min_x >= max_x:
             start_x = SCREEN_WIDTH // 2
         else:
-            start_x = random.randint(min_x, max_x)
+            start_x = self.rng.randint(min_x, max_x)
 
         self.rect.midbottom = (start_x, 0)
 
         self.pos = pygame.Vector2(self.rect.centerx, self.rect.centery)
-        self.speed = METEOR_SPEED
 
     def update(self, dt):
         # เคลื่อนที่ลงล่าง
@@ -55,3 +66,7 @@ class MeteorNode(AnimationNode):
             return
 
         self.update_animation(dt)
+
+    def kill(self):
+        super().kill()
+        PoolManager.release(self)
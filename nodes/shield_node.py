@@ -32,7 +32,9 @@ class ShieldNode(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=self.hero.rect.center)
 
         # ใช้ mask จากรูป เพื่อใช้กับ pygame.sprite.collide_mask
-        self.mask = pygame.mask.from_surface(self.image)
+        # (mask ของทุกเฟรมสร้างไว้แล้วใน ResourceManager)
+        self.masks = ResourceManager.get_masks(self.frames)
+        self.mask = self.masks[self.index]
 
         # เวลาเปลี่ยนเฟรมแอนิเมชัน
         self.frame_duration = 0.08
@@ -42,9 +44,10 @@ class ShieldNode(pygame.sprite.Sprite):
         self.lifetime = SHIELD_LIFETIME
         self.radius = max(self.rect.width, self.rect.height) // 2
 
-        # เพิ่มจำนวน shield ใน Hero ตอนสร้าง
-        if hasattr(self.hero, "weapon_counts") and "shield" in self.hero.weapon_counts:
-            self.hero.weapon_counts["shield"] += 1
+        # เพิ่มจำนวน shield ใน Hero ตอนสร้าง (คืนตอน kill)
+        self._equipped = hasattr(self.hero, "equip")
+        if self._equipped:
+            self.hero.equip(self.weapon_type)
 
     # ------------------ โดนโจมตีหนึ่งครั้ง ------------------
     def take_hit(self, damage=1):
@@ -55,9 +58,9 @@ class ShieldNode(pygame.sprite.Sprite):
 
     def kill(self):
         """ลบ Shield ออกจากเกม และอัปเดตจำนวนใน Hero"""
-        if hasattr(self.hero, "weapon_counts") and "shield" in self.hero.weapon_counts:
-            if self.hero.weapon_counts["shield"] > 0:
-                self.hero.weapon_counts["shield"] -= 1
+        if self._equipped:
+            self._equipped = False
+            self.hero.unequip(self.weapon_type)
         super().kill()
 
     # ------------------ อัปเดตเกราะทุกเฟรม ------------------
@@ -81,7 +84,7 @@ class ShieldNode(pygame.sprite.Sprite):
             self.rect = self.image.get_rect(center=old_center)
 
             # อัปเดต mask ด้วย (สำคัญถ้าเฟรมมีรูปร่างไม่เหมือนกัน)
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self.masks[self.index]
 
         # อายุการทำงานลดลง
         self.lifetime -= dt
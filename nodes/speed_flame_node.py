@@ -32,7 +32,9 @@ class SpeedFlameNode(pygame.sprite.Sprite):
         self.rect = self.image.get_rect(center=self.hero.rect.center)
 
         # ใช้ mask จากรูป เพื่อใช้กับ pygame.sprite.collide_mask
-        self.mask = pygame.mask.from_surface(self.image)
+        # (mask ของทุกเฟรมสร้างไว้แล้วใน ResourceManager)
+        self.masks = ResourceManager.get_masks(self.frames)
+        self.mask = self.masks[self.index]
 
         # เวลาเปลี่ยนเฟรมแอนิเมชัน
         self.frame_duration = 0.08
@@ -41,6 +43,11 @@ class SpeedFlameNode(pygame.sprite.Sprite):
         # อายุการทำงาน (วินาที)
         self.lifetime = SPEED_FLAME_LIFETIME
 
+        # นับไอพ่นที่ติด Hero อยู่ (คืนตอน kill)
+        self._equipped = hasattr(self.hero, "equip")
+        if self._equipped:
+            self.hero.equip("speed_flame")
+
     def update_position(self):
         """
         ให้ไอพ่นไปอยู่ด้านท้ายของยาน
@@ -74,7 +81,7 @@ class SpeedFlameNode(pygame.sprite.Sprite):
             self.rect = self.image.get_rect(center=old_center)
 
             # อัปเดต mask ด้วย (สำคัญถ้าเฟรมมีรูปร่างไม่เหมือนกัน)
-            self.mask = pygame.mask.from_surface(self.image)
+            self.mask = self.masks[self.index]
 
         # อายุการทำงานลดลง
         self.lifetime -= dt
@@ -83,4 +90,7 @@ class SpeedFlameNode(pygame.sprite.Sprite):
             return
 
     def kill(self):
+        if self._equipped:
+            self._equipped = False
+            self.hero.unequip("speed_flame")
         super().kill()
@@ -11,6 +11,6 @@ class SpeedItemNode(ItemNode):
     - ภายใน ItemNode จะจัดการโหลดเฟรมและสุ่มตำแหน่งให้เอง
     """
 
-    def __init__(self):
+    def __init__(self, rng=None):
         # ItemNode จะใช้ item_type เพื่อตัดสินใจเลือกเฟรมจาก ResourceManager
-        super().__init__(item_type="speed")
+        super().__init__(item_type="speed", rng=rng)
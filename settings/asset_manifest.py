@@ -0,0 +1,54 @@
+# settings/asset_manifest.py
+
+from .stage_config import STAGE_CONFIGS, has_boss
+
+# Manifest ของ asset: แต่ละ scene / ด่าน ต้องใช้ชุดเฟรมไหนบ้าง
+# (key = ชื่อชุดเฟรมใน ResourceManager เช่น "hero_frames", "item_laser", "bg_01")
+#
+# - ResourceManager.ensure(keys)   → โหลดให้ครบก่อนใช้ (รอถ้ายังไม่เสร็จ)
+# - ResourceManager.prefetch(keys) → โหลดล่วงหน้าบน thread เบื้องหลัง
+# ชุดที่ไม่อยู่ใน manifest จะถูกโหลดตอนเรียกใช้ครั้งแรก (เช่น enemy_frames)
+
+SCENE_ASSETS = {
+    # เมนู: มีแค่ background เลื่อน
+    "menu": ["bg_01", "bg_02", "bg_03", "bg_04", "bg_05", "bg_06"],
+
+    # ตอนเล่น (ทุกด่าน)
+    "game": ["hero_frames", "bullet", "meteor_frames", "explosion_frames"],
+}
+
+# item แต่ละชนิด → ชุดเฟรมของตัว item + ของที่เกิดตอนเก็บ
+ITEM_ASSETS = {
+    "single":   ["item_single", "drone_frames"],
+    "double":   ["item_double", "drone_frames"],
+    "shield":   ["item_shield", "shield_frames"],
+    "speed":    ["item_speed", "speed_frames"],
+    "laser":    ["item_laser"],
+    "buckshot": ["item_buckshot"],
+}
+
+BOSS_ASSETS = ["boss_frames", "boss_bullet_frames"]
+
+
+def stage_assets(stage: int) -> list[str]:
+    """
+    ชุดเฟรมที่ด่านนี้ใช้ (คิดจาก STAGE_CONFIGS):
+    - item ที่ weight > 0 ใน item_weights
+    - บอส ถ้า has_boss(stage)
+    ด่านที่ไม่มีใน STAGE_CONFIGS → []
+    """
+    cfg = STAGE_CONFIGS.get(stage)
+    if cfg is None:
+        return []
+
+    keys = []
+    weights = cfg.get("spawn", {}).get("item_weights", {})
+    for item_type, weight in weights.items():
+        if weight > 0:
+            keys.extend(ITEM_ASSETS.get(item_type, []))
+
+    if has_boss(stage):
+        keys.extend(BOSS_ASSETS)
+
+    # ตัดตัวซ้ำ คงลำดับเดิม
+    return list(dict.fromkeys(keys))
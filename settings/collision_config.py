@@ -0,0 +1,128 @@
+# settings/collision_config.py
+
+# ตารางการชน (collision matrix)
+# CollisionManager.resolve() จะไล่ทีละกฎตามลำดับในลิสต์นี้ ภายใน broadphase เดียวต่อเฟรม
+#
+# แต่ละกฎ:
+#   "a" / "b"      : ชื่อ group (ตาม key ใน Game.groups) ฝั่งยิง / ฝั่งเป้า
+#   "collide"      : "mask" | "circle" | "rect"
+#   "kill_a/b"     : ให้ลบ sprite ฝั่งนั้นเมื่อชนหรือไม่ (dokill)
+#   "score"        : คะแนนต่อการชน 1 คู่
+#   "kill_bonus"   : คะแนนพิเศษเมื่อ effect "boss_damage" ทำให้บอสตาย
+#   "effects"      : ลำดับ effect ที่จะทำต่อการชน 1 คู่
+#       "shield_hit"  → a.take_hit(1)
+#       "boss_damage" → b.take_damage(1)
+#       "explode_a" / "explode_b" / "explode_mid" → ระเบิดที่ a / b / กึ่งกลาง + เสียงระเบิด
+#       "pickup"      → เก็บไอเท็ม (drone / shield / speed / laser / buckshot)
+#
+# เพิ่มอาวุธหรือศัตรูใหม่ = เพิ่มกฎใหม่ในลิสต์นี้ (ไม่ต้องเพิ่ม sweep ใน game.py)
+
+COLLISION_MATRIX = [
+    {
+        "name": "bullet_enemy",
+        "a": "bullets", "b": "enemies", "collide": "mask",
+        "kill_a": True, "kill_b": True,
+        "score": 10,
+        "effects": ("explode_b",),
+    },
+    {
+        "name": "hero_enemy",
+        "a": "heros", "b": "enemies", "collide": "mask",
+        "kill_a": True, "kill_b": True,
+        "score": 0,
+        "effects": ("explode_mid",),
+    },
+    {
+        "name": "hero_meteor",
+        "a": "heros", "b": "meteors", "collide": "mask",
+        "kill_a": True, "kill_b": True,
+        "score": 0,
+        "effects": ("explode_mid",),
+    },
+    {
+        "name": "bullet_meteor",
+        "a": "bullets", "b": "meteors", "collide": "mask",
+        "kill_a": True, "kill_b": True,
+        "score": 5,
+        "effects": ("explode_b",),
+    },
+    {
+        "name": "hero_item",
+        "a": "heros", "b": "items", "collide": "mask",
+        "kill_a": False, "kill_b": True,
+        "score": 0,
+        "effects": ("pickup",),
+    },
+    {
+        "name": "shield_meteor",
+        "a": "shields", "b": "meteors", "collide": "circle",
+        "kill_a": False, "kill_b": True,
+        "score": 0,
+        "effects": ("shield_hit", "explode_b"),
+    },
+    {
+        "name": "shield_enemy",
+        "a": "shields", "b": "enemies", "collide": "circle",
+        "kill_a": False, "kill_b": True,
+        "score": 0,
+        "effects": ("shield_hit", "explode_b"),
+    },
+    # -------- Boss (ตัว + กระสุน) --------
+    {
+        "name": "bullet_boss",
+        "a": "bullets", "b": "bosses", "collide": "mask",
+        "kill_a": True, "kill_b": False,
+        "score": 15, "kill_bonus": 50,
+        "effects": ("boss_damage", "explode_a"),
+    },
+    {
+        "name": "hero_boss",
+        "a": "heros", "b": "bosses", "collide": "mask",
+        "kill_a": True, "kill_b": False,
+        "score": 0,
+        "effects": ("explode_a",),
+    },
+    {
+        "name": "shield_boss",
+        "a": "shields", "b": "bosses", "collide": "circle",
+        "kill_a": False, "kill_b": False,
+        "score": 10, "kill_bonus": 50,
+        "effects": ("shield_hit", "boss_damage", "explode_b"),
+    },
+    {
+        "name": "hero_bossbullet",
+        "a": "heros", "b": "boss_bullets", "collide": "mask",
+        "kill_a": True, "kill_b": True,
+        "score": 0,
+        "effects": ("explode_a",),
+    },
+    {
+        "name": "shield_bossbullet",
+        "a": "shields", "b": "boss_bullets", "collide": "circle",
+        "kill_a": False, "kill_b": True,
+        "score": 0,
+        "effects": ("shield_hit", "explode_b"),
+    },
+    # -------- LaserBeam vs Enemy/Meteor/Boss --------
+    {
+        "name": "laser_enemy",
+        "a": "laser_beams", "b": "enemies", "collide": "rect",
+        "kill_a": False, "kill_b": True,
+        "score": 10,
+        "effects": ("explode_b",),
+    },
+    {
+        "name": "laser_meteor",
+        "a": "laser_beams", "b": "meteors", "collide": "rect",
+        "kill_a": False, "kill_b": True,
+        "score": 5,
+        "effects": ("explode_b",),
+    },
+    {
+        "name": "laser_boss",
+        "a": "laser_beams", "b": "bosses", "collide": "rect",
+        "kill_a": False, "kill_b": False,
+        "score": 15, "kill_bonus": 50,
+        "effects": ("boss_damage", "explode_b"),
+    },
+]
@@ -4,6 +4,49 @@ SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 60
 
+# Simulation: อัปเดต logic ด้วย dt คงที่ (fixed timestep) แยกจากอัตราวาดจอ
+SIM_HZ = 120
+FIXED_DT = 1.0 / SIM_HZ
+MAX_CATCHUP_STEPS = 8       # เฟรมช้ามาก → ตามทันได้สูงสุดกี่ step แล้วทิ้งเวลาที่เหลือ
+
+# โหมด headless (ไม่มีจอ): dt คงที่ต่อ 1 เฟรมจำลอง (เท่ากับ step ของเกมจริง)
+HEADLESS_DT = FIXED_DT
+
+# Profiler (F3 = เปิด/ปิด overlay)
+PROFILER_WINDOW = 600               # จำนวนเฟรมล่าสุดที่ใช้คิด p50 / p95 / p99
+PROFILER_SUMMARY_INTERVAL = 30      # คำนวณสรุปใหม่ทุกกี่เฟรม (overlay)
+PROFILER_CSV = None                 # ไฟล์ CSV สรุปตอนออกเกม (None = ไม่เขียน, เปิดด้วย --profile-csv PATH)
+
+# cache ของภาพที่ scale แล้ว (โฟลเดอร์ใต้ root ของโปรเจกต์, ลบทิ้งได้เสมอ)
+ASSET_CACHE_DIR = ".asset_cache"
+ASSET_LOADER_THREADS = None         # จำนวน thread ที่ใช้ decode ภาพ (None = เท่าจำนวน core)
+
+# โหลดภาพตาม scene / ด่าน (settings/asset_manifest.py) แทนการโหลดทุกอย่างตอนเปิดเกม
+ASSET_STREAMING = True
+ASSET_PREFETCH_THREADS = 1          # thread เบื้องหลังที่ prefetch ด่านถัดไป
+
+# Dirty-rect rendering: ระหว่างเล่น วาด + update จอเฉพาะส่วนที่เปลี่ยน (ดู DirtyRenderer)
+# พื้นหลังเลื่อนเมื่อไหร่ก็กลับไปวาดทั้งจอ + flip เหมือนเดิม
+DIRTY_RECT_RENDERING = False
+DIRTY_RECTS_MAX = 120               # rect เยอะกว่านี้ในเฟรมเดียว → flip ทั้งจอแทน
+
+# Texture atlas: รวมเฟรม sprite ทั้งหมด (ยกเว้น background) ไว้ใน Surface ใหญ่ไม่กี่หน้า
+ATLAS_ENABLED = True
+ATLAS_PAGE_SIZE = 1024
+ATLAS_PADDING = 1                   # ช่องว่างระหว่างเฟรม (px)
+
+# งบหน่วยความจำของภาพที่ decode แล้วใน ResourceManager (MB, None = ไม่จำกัด)
+# นับหน้า atlas ทั้งหน้าด้วย, เกินงบ → ทิ้งชุดที่ไม่ได้ใช้นานที่สุดที่ไม่ถูก pin (เรียกใช้อีกครั้งก็โหลดใหม่เอง)
+# ชุดใน atlas ถูกทิ้งพร้อมทุกชุดที่อยู่หน้าเดียวกัน → หน้าที่มีชุดถูก pin อยู่ (เช่นของด่านที่เล่นอยู่) ไม่ถูกปล่อย
+ASSET_MEMORY_BUDGET_MB = 8
+
+# cache ของ Surface ข้อความ (TextCache): จำนวนรายการสูงสุด เกินแล้วทิ้งอันที่ไม่ได้ใช้นานที่สุด
+TEXT_CACHE_SIZE = 256
+
+# เสียงจาก collision (SoundBus): เสียงเดียวกันหลายครั้งใน tick เดียว → เล่นครั้งเดียว ดังขึ้นตามจำนวน
+SOUND_BUS_VOLUME_STEP = 0.15        # ดังขึ้นกี่เท่าต่อเสียงซ้ำ 1 ครั้ง (ไม่เกิน 1.0)
+SOUND_BUS_PAN = 0.5                 # แพนซ้าย/ขวาตามตำแหน่งบนจอ สูงสุดเท่านี้ที่ขอบจอ (0 = ไม่แพน)
+
 # สีที่ใช้บ่อย
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -3,6 +3,7 @@
 # ความเร็วต่าง ๆ
 HERO_SPEED = 300          # px/s (ถ้าอยากให้ยานขยับซ้ายขวา)
 BULLET_SPEED = 500        # px/s
+PROJECTILE_LIFETIME = 10.0  # อายุสูงสุดของกระสุน (วินาที) กันกระสุนค้างในจอ
 ENEMY_Y = 100             # ตำแหน่งแนวตั้งของศัตรูด้านบน
 
 # ค่าคงที่อื่น ๆ
@@ -20,6 +21,8 @@ DRONE_Y_OFFSET = -10        # ขยับขึ้น/ลงจาก Hero ต
 SHIELD_LIFETIME = 10.0      # อยู่ได้ 10 วินาทีแล้วหายไป
 SPEED_FLAME_LIFETIME = 10.0  # อยู่ได้ 10 วินาทีแล้วหายไป
 
+COLLISION_CELL_SIZE = 96    # ขนาด cell (px) ของ spatial hash ที่ใช้เช็คการชน
+
 # สถานะเกม
 GAME_STATE_PLAYING = "PLAYING"
 GAME_STATE_GAME_OVER = "GAME_OVER"